@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /studioai/analysis/backend.py                                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:19:33 pm                                                #
+# Modified   : Monday October 19th 2026 06:40:10 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Compute Backend Module"""
+from __future__ import annotations
+
+import logging
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Union
+
+import numpy as np
+import pandas as pd
+
+try:  # pragma: no cover
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover
+    pa = None
+
+try:  # pragma: no cover
+    import polars as pl
+except ImportError:  # pragma: no cover
+    pl = None
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+DESCRIBE_INDEX = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+INDEX = "__index__"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          BACKEND                                                 #
+# ------------------------------------------------------------------------------------------------ #
+class Backend(ABC):
+    """Computes the column statistics underlying exploratory data analysis.
+
+    Backends take and return pandas objects, so results are identical in layout whichever
+    engine computes them. Columnar backends fall back to pandas for data they cannot
+    represent, such as object columns holding mixed types.
+    """
+
+    name: str = None
+
+    @abstractmethod
+    def count(self, df: pd.DataFrame) -> pd.Series:
+        """Returns the number of non-null values in each column."""
+
+    @abstractmethod
+    def nunique(self, df: pd.DataFrame) -> pd.Series:
+        """Returns the number of distinct non-null values in each column."""
+
+    @abstractmethod
+    def value_counts(self, df: pd.DataFrame, columns: List[str]) -> pd.Series:
+        """Returns the counts of the observed values, or combinations of values, of the columns.
+
+        Rows with a missing value in any of the columns are not counted. The result is indexed
+        by value, or by a MultiIndex if more than one column is counted.
+        """
+
+    @abstractmethod
+    def nlargest(self, df: pd.DataFrame, x: str, n: int) -> pd.DataFrame:
+        """Returns the n rows with the largest values of x, in descending order of x."""
+
+    @abstractmethod
+    def drop_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Returns the first occurrence of each distinct row, in order of occurrence."""
+
+    @abstractmethod
+    def describe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Returns count, mean, std, min, quartiles and max of the numeric columns."""
+
+
+# ------------------------------------------------------------------------------------------------ #
+class PandasBackend(Backend):
+    """Single-threaded pandas backend. Always available."""
+
+    name = "pandas"
+
+    def count(self, df: pd.DataFrame) -> pd.Series:
+        return df.count()
+
+    def nunique(self, df: pd.DataFrame) -> pd.Series:
+        return df.nunique()
+
+    def value_counts(self, df: pd.DataFrame, columns: List[str]) -> pd.Series:
+        if len(columns) == 1:
+            return df[columns[0]].value_counts(sort=False).rename("count")
+        return df[columns].value_counts(sort=False).rename("count")
+
+    def nlargest(self, df: pd.DataFrame, x: str, n: int) -> pd.DataFrame:
+        return df.sort_values(by=x, ascending=False, kind="stable").head(n)
+
+    def drop_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.drop_duplicates().reset_index(drop=True)
+
+    def describe(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.select_dtypes(include=np.number).describe()
+
+
+# ------------------------------------------------------------------------------------------------ #
+class ColumnarBackend(Backend):
+    """Base class for multi-threaded columnar backends.
+
+    Each operation is attempted on the columnar engine. If the engine cannot convert the
+    data, the operation is computed by pandas instead.
+
+    Args:
+        n_jobs (int): Number of threads used for per-column statistics. Defaults to the
+            number of CPUs.
+    """
+
+    def __init__(self, n_jobs: int = None) -> None:
+        self._n_jobs = n_jobs or os.cpu_count() or 1
+        self._fallback = PandasBackend()
+
+    def count(self, df: pd.DataFrame) -> pd.Series:
+        return self._run("count", df)
+
+    def nunique(self, df: pd.DataFrame) -> pd.Series:
+        return self._run("nunique", df)
+
+    def value_counts(self, df: pd.DataFrame, columns: List[str]) -> pd.Series:
+        return self._run("value_counts", df, columns=columns)
+
+    def nlargest(self, df: pd.DataFrame, x: str, n: int) -> pd.DataFrame:
+        return self._run("nlargest", df, x=x, n=n)
+
+    def drop_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
+        return self._run("drop_duplicates", df)
+
+    def describe(self, df: pd.DataFrame) -> pd.DataFrame:
+        return self._run("describe", df.select_dtypes(include=np.number))
+
+    def _run(self, operation: str, df: pd.DataFrame, **kwargs):
+        """Runs an operation on the engine, falling back to pandas on conversion errors."""
+        try:
+            return getattr(self, f"_{operation}")(df, **kwargs)
+        except (TypeError, ValueError, NotImplementedError) + self._errors as e:
+            msg = f"{self.name} backend unable to compute {operation}, using pandas.\n{e}"
+            logger.debug(msg)
+            return getattr(self._fallback, operation)(df, **kwargs)
+
+    def _map(self, func: Callable, items: list) -> list:
+        """Applies func to each item, in threads. The engines release the GIL."""
+        if self._n_jobs == 1 or len(items) < 2:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self._n_jobs, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    @property
+    def _errors(self) -> tuple:
+        """Returns the engine's conversion exception types."""
+        return ()
+
+    @staticmethod
+    def _take(df: pd.DataFrame, x: str, indices: np.ndarray) -> pd.DataFrame:
+        """Returns rows at the positions, by descending x, ties in order of occurrence."""
+        values = df[x].to_numpy()[indices]
+        order = np.lexsort((indices, -values.astype(float)))
+        return df.iloc[indices[order]]
+
+    @abstractmethod
+    def _count(self, df: pd.DataFrame) -> pd.Series:
+        """Computes count on the engine."""
+
+    @abstractmethod
+    def _nunique(self, df: pd.DataFrame) -> pd.Series:
+        """Computes nunique on the engine."""
+
+    @abstractmethod
+    def _value_counts(self, df: pd.DataFrame, columns: List[str]) -> pd.Series:
+        """Computes value_counts on the engine."""
+
+    @abstractmethod
+    def _nlargest(self, df: pd.DataFrame, x: str, n: int) -> pd.DataFrame:
+        """Computes nlargest on the engine."""
+
+    @abstractmethod
+    def _drop_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Computes drop_duplicates on the engine."""
+
+    @abstractmethod
+    def _describe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Computes describe on the engine."""
+
+
+# ------------------------------------------------------------------------------------------------ #
+class ArrowBackend(ColumnarBackend):
+    """Backend computing with pyarrow.compute kernels and multi-threaded Arrow group-bys."""
+
+    name = "arrow"
+
+    @property
+    def _errors(self) -> tuple:
+        return (pa.ArrowException,)
+
+    def _table(self, df: pd.DataFrame) -> pa.Table:
+        return pa.Table.from_pandas(df, preserve_index=False, nthreads=self._n_jobs)
+
+    def _count(self, df: pd.DataFrame) -> pd.Series:
+        table = self._table(df)
+        counts = [len(col) - col.null_count for col in table.columns]
+        return pd.Series(counts, index=df.columns, dtype="int64")
+
+    def _nunique(self, df: pd.DataFrame) -> pd.Series:
+        table = self._table(df)
+        counts = self._map(
+            lambda col: pc.count_distinct(col, mode="only_valid").as_py(), table.columns
+        )
+        return pd.Series(counts, index=df.columns, dtype="int64")
+
+    def _value_counts(self, df: pd.DataFrame, columns: List[str]) -> pd.Series:
+        table = self._table(df[columns])
+        if len(columns) == 1:
+            counts = pc.value_counts(table.column(0).combine_chunks())
+            counts = counts.filter(counts.field("values").is_valid())
+            index = pd.Index(counts.field("values").to_pandas(), name=columns[0])
+            return pd.Series(counts.field("counts").to_numpy(), index=index, name="count")
+
+        valid = table.column(0).is_valid()
+        for column in table.columns[1:]:
+            valid = pc.and_(valid, column.is_valid())
+        table = table.filter(valid)
+        counts = table.group_by(columns).aggregate([([], "count_all")])
+        index = pd.MultiIndex.from_arrays(
+            [counts.column(c).to_pandas() for c in columns], names=columns
+        )
+        return pd.Series(counts.column("count_all").to_numpy(), index=index, name="count")
+
+    def _nlargest(self, df: pd.DataFrame, x: str, n: int) -> pd.DataFrame:
+        column = self._table(df[[x]])
+        indices = pc.select_k_unstable(column, k=min(n, len(df)), sort_keys=[(x, "descending")])
+        return self._take(df=df, x=x, indices=indices.to_numpy())
+
+    def _drop_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
+        table = self._table(df).append_column(INDEX, pa.array(np.arange(len(df))))
+        first = table.group_by(list(df.columns)).aggregate([(INDEX, "min")])
+        indices = np.sort(first.column(f"{INDEX}_min").to_numpy())
+        return df.iloc[indices].reset_index(drop=True)
+
+    def _describe(self, df: pd.DataFrame) -> pd.DataFrame:
+        table = self._table(df)
+
+        def describe(column: pa.ChunkedArray) -> list:
+            count = len(column) - column.null_count
+            if count == 0:
+                return [0.0] + [np.nan] * 7
+            minmax = pc.min_max(column)
+            quartiles = pc.quantile(column, q=[0.25, 0.5, 0.75], interpolation="linear")
+            return [
+                float(count),
+                pc.mean(column).as_py(),
+                pc.stddev(column, ddof=1).as_py() if count > 1 else np.nan,
+                minmax["min"].as_py(),
+                *quartiles.to_pylist(),
+                minmax["max"].as_py(),
+            ]
+
+        stats = self._map(describe, table.columns)
+        return pd.DataFrame(
+            np.array(stats, dtype=float).T, index=DESCRIBE_INDEX, columns=df.columns
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+class PolarsBackend(ColumnarBackend):
+    """Backend computing with Polars' multi-threaded query engine."""
+
+    name = "polars"
+
+    @property
+    def _errors(self) -> tuple:
+        return (pl.exceptions.PolarsError,)
+
+    def _frame(self, df: pd.DataFrame) -> pl.DataFrame:
+        return pl.from_pandas(df, include_index=False)
+
+    def _count(self, df: pd.DataFrame) -> pd.Series:
+        counts = self._frame(df).select(pl.all().is_not_null().sum()).row(0)
+        return pd.Series(counts, index=df.columns, dtype="int64")
+
+    def _nunique(self, df: pd.DataFrame) -> pd.Series:
+        counts = self._frame(df).select(pl.all().drop_nulls().n_unique()).row(0)
+        return pd.Series(counts, index=df.columns, dtype="int64")
+
+    def _value_counts(self, df: pd.DataFrame, columns: List[str]) -> pd.Series:
+        counts = (
+            self._frame(df[columns]).drop_nulls().group_by(columns).agg(pl.len().alias("count"))
+        )
+        if len(columns) == 1:
+            index = pd.Index(counts[columns[0]].to_pandas(), name=columns[0])
+        else:
+            index = pd.MultiIndex.from_arrays(
+                [counts[c].to_pandas() for c in columns], names=columns
+            )
+        return pd.Series(counts["count"].to_numpy(), index=index, name="count", dtype="int64")
+
+    def _nlargest(self, df: pd.DataFrame, x: str, n: int) -> pd.DataFrame:
+        top = self._frame(df[[x]]).with_row_index(INDEX).drop_nulls().top_k(n, by=x)
+        return self._take(df=df, x=x, indices=top[INDEX].to_numpy().astype(np.int64))
+
+    def _drop_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
+        first = (
+            self._frame(df)
+            .with_row_index(INDEX)
+            .unique(subset=list(df.columns), keep="first", maintain_order=True)
+        )
+        return df.iloc[first[INDEX].to_numpy().astype(np.int64)].reset_index(drop=True)
+
+    def _describe(self, df: pd.DataFrame) -> pd.DataFrame:
+        frame = self._frame(df)
+        exprs = []
+        for c in df.columns:
+            col = pl.col(c)
+            exprs.extend(
+                [
+                    col.count().cast(pl.Float64),
+                    col.mean(),
+                    col.std(ddof=1),
+                    col.min().cast(pl.Float64),
+                    col.quantile(0.25, interpolation="linear"),
+                    col.quantile(0.5, interpolation="linear"),
+                    col.quantile(0.75, interpolation="linear"),
+                    col.max().cast(pl.Float64),
+                ]
+            )
+        row = frame.select([e.alias(str(i)) for i, e in enumerate(exprs)]).row(0)
+        stats = np.array(row, dtype=float).reshape(len(df.columns), len(DESCRIBE_INDEX))
+        return pd.DataFrame(stats.T, index=DESCRIBE_INDEX, columns=df.columns)
+
+
+# ------------------------------------------------------------------------------------------------ #
+BACKENDS: Dict[str, type] = {
+    "polars": PolarsBackend,
+    "arrow": ArrowBackend,
+    "pandas": PandasBackend,
+}
+AVAILABLE: Dict[str, bool] = {
+    "polars": pl is not None,
+    "arrow": pa is not None,
+    "pandas": True,
+}
+
+
+# ------------------------------------------------------------------------------------------------ #
+def get_backend(backend: Union[str, Backend] = "auto") -> Backend:
+    """Returns a compute backend.
+
+    Args:
+        backend (Union[str, Backend]): A Backend instance, or one of 'polars', 'arrow',
+            'pandas', or 'auto'. Auto selects the first installed of Polars, pyarrow and pandas,
+            in that order. The columnar backends convert the DataFrame on every call, which
+            outweighs their parallelism on small frames. Default = 'auto'
+    """
+    if isinstance(backend, Backend):
+        return backend
+    if backend is None or backend == "auto":
+        backend = next(name for name, available in AVAILABLE.items() if available)
+    if backend not in BACKENDS:
+        msg = f"Backend {backend} is not supported. Choose from {list(BACKENDS.keys())}."
+        logger.error(msg)
+        raise ValueError(msg)
+    if not AVAILABLE[backend]:
+        msg = f"Backend {backend} is not installed."
+        logger.error(msg)
+        raise ImportError(msg)
+    return BACKENDS[backend]()
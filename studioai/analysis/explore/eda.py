@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Thursday August 10th 2023 08:29:08 pm                                               #
-# Modified   : Friday June 7th 2024 02:16:21 pm                                                    #
+# Modified   : Monday October 19th 2026 06:40:10 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
@@ -24,9 +24,12 @@ from typing import Callable, List, Union
 
 import pandas as pd
 
+from studioai.analysis.backend import Backend, get_backend
+from studioai.analysis.stats.descriptive.frequency import FrequencyDistribution
 from studioai.analysis.stats.descriptive.summary import SummaryStats
 from studioai.analysis.stats.inferential.test import Inference
 from studioai.analysis.visualize.visualizer import SeabornCanvas, Visualizer
+from studioai.util.cache import CacheStats, LRUCache, memoize
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
@@ -38,22 +41,98 @@ logger = logging.getLogger(__name__)
 class Explorer(ABC):
     """Encapsulates the data and behaviors in support of Exploratory Data Analysis
 
+    Computed properties and analyses are memoized in a bounded LRU cache, keyed by the
+    version of the data and the arguments of the call. Assigning a new DataFrame to `df`
+    invalidates the cache. Call `refresh` after modifying the DataFrame in place.
+
+    Counting, distinct values, top n, deduplication and numeric summaries are computed by a
+    pluggable backend. Pandas is used by default. The Polars and pyarrow backends run on all
+    cores, but convert the DataFrame on every call, so they pay off for large frames only.
+
     Args:
         df (pd.DataFrame): Pandas DataFrame object.
+        cache_size (int): Maximum number of results held in the cache. Default = 128
+        backend (Union[str, Backend]): One of 'auto', 'polars', 'arrow', 'pandas', or a Backend
+            instance. Default = 'pandas'
     """
 
-    def __init__(self, df: pd.DataFrame) -> None:
+    def __init__(
+        self, df: pd.DataFrame, cache_size: int = 128, backend: Union[str, Backend] = "pandas"
+    ) -> None:
+        self._backend = get_backend(backend)
+        self._cache = LRUCache(maxsize=cache_size)
+        self._version = 0
         self.df = df
         self._visualizer = Visualizer(canvas=SeabornCanvas())
         self._inference = Inference()
         self._tests = {}
-        self._overview = None
-        self._info = None
 
     def __len__(self):
         """Returns the length of the dataset."""
         return len(self.df)
 
+    @property
+    def df(self) -> pd.DataFrame:
+        """Returns the DataFrame under analysis."""
+        return self._df
+
+    @df.setter
+    def df(self, df: pd.DataFrame) -> None:
+        """Replaces the DataFrame under analysis and invalidates cached results."""
+        self._df = df
+        self.refresh()
+
+    @property
+    def backend(self) -> Backend:
+        """Returns the compute backend."""
+        return self._backend
+
+    @property
+    def cache_info(self) -> CacheStats:
+        """Returns the hit and miss statistics of the result cache."""
+        return self._cache.stats
+
+    def refresh(self) -> None:
+        """Invalidates cached results, e.g. after the DataFrame was modified in place."""
+        self._version += 1
+        self._cache.clear()
+
+    @classmethod
+    def from_dataset(
+        cls,
+        path: str,
+        format: str = "parquet",
+        batch_size: int = 131072,
+        partitioning: str = "hive",
+        sample_size: int = 100000,
+        random_state: int = None,
+    ) -> Explorer:
+        """Returns an Explorer that streams its data from a file or directory of files.
+
+        The data are never loaded into memory in full. Shape, columns and data types are read
+        from the dataset schema and Parquet metadata; the remaining statistics are computed
+        one record batch at a time.
+
+        Args:
+            path (str): Path to a file or a directory of files, e.g. a partitioned Parquet dataset.
+            format (str): The file format of the dataset. Default = 'parquet'
+            batch_size (int): The maximum number of rows in each record batch.
+            partitioning (str): The partitioning scheme of the directory. Default = 'hive'
+            sample_size (int): Number of rows sampled for plots and inference. Default = 100,000
+            random_state (int): Seed for the sample used by plots and inference.
+        """
+        # Imported here as the arrow module subclasses Explorer.
+        from studioai.analysis.explore.arrow import ArrowExplorer
+
+        return ArrowExplorer(
+            path=path,
+            format=format,
+            batch_size=batch_size,
+            partitioning=partitioning,
+            sample_size=sample_size,
+            random_state=random_state,
+        )
+
     @property
     @abstractmethod
     def summary(self) -> pd.DataFrame:
@@ -80,6 +159,7 @@ class Explorer(ABC):
         return self.df.shape
 
     @property
+    @memoize
     def dtypes(self) -> list:
         """Returns the count of data types in the dataset."""
         dtypes = self.df.dtypes.value_counts().reset_index()
@@ -89,53 +169,50 @@ class Explorer(ABC):
         return dtypes
 
     @property
+    @memoize
     def size(self) -> int:
         """Returns the size of the Dataset in memory in bytes."""
         return self.df.memory_usage(deep=True).sum()
 
     # ------------------------------------------------------------------------------------------- #
     @property
+    @memoize
     def overview(self) -> pd.DataFrame:
         """Returns an overview of the dataset in terms of its shape and size."""
 
-        if self._overview is None:
-            nvars = self.df.shape[1]
-            nrows = self.df.shape[0]
-            ncells = nvars * nrows
-            size = self.df.memory_usage(deep=True).sum().sum()
-            d = {
-                "Number of Observations": nrows,
-                "Number of Variables": nvars,
-                "Number of Cells": ncells,
-                "Size (Bytes)": size,
-            }
-            overview = pd.DataFrame.from_dict(data=d, orient="index").reset_index()
-            overview.columns = ["Characteristic", "Total"]
-            self._overview = overview.style.format(thousands=",")
-
-        return self._overview
+        nvars = self.df.shape[1]
+        nrows = self.df.shape[0]
+        ncells = nvars * nrows
+        d = {
+            "Number of Observations": nrows,
+            "Number of Variables": nvars,
+            "Number of Cells": ncells,
+            "Size (Bytes)": self.size,
+        }
+        overview = pd.DataFrame.from_dict(data=d, orient="index").reset_index()
+        overview.columns = ["Characteristic", "Total"]
+        return overview.style.format(thousands=",")
 
     # ------------------------------------------------------------------------------------------- #
     @property
+    @memoize
     def info(self) -> pd.DataFrame:
         """Returns a DataFrame with basic dataset quality statistics"""
 
-        if self._info is None:
-            info = self.df.dtypes.to_frame().reset_index()
-            info.columns = ["Column", "DataType"]
-            info["Complete"] = self.df.count().values
-            info["Null"] = self.df.isna().sum().values
-            info["Completeness"] = info["Complete"] / self.df.shape[0]
-            info["Unique"] = self.df.nunique().values
-            info["Duplicate"] = self.df.shape[0] - self.df.nunique().values
-            info["Uniqueness"] = self.df.nunique().values / self.df.shape[0]
-            info["Size"] = (
-                self.df.memory_usage(deep=True, index=False).to_frame().reset_index()[0]
-            )
-            info = round(info, 2)
-            self._info = info.style.format(thousands=",")
-
-        return self._info
+        info = self.df.dtypes.to_frame().reset_index()
+        info.columns = ["Column", "DataType"]
+        nrows = self.df.shape[0]
+        complete = self._backend.count(self.df).values
+        unique = self._backend.nunique(self.df).values
+        info["Complete"] = complete
+        info["Null"] = nrows - complete
+        info["Completeness"] = info["Complete"] / nrows
+        info["Unique"] = unique
+        info["Duplicate"] = nrows - unique
+        info["Uniqueness"] = unique / nrows
+        info["Size"] = self.df.memory_usage(deep=True, index=False).to_frame().reset_index()[0]
+        info = round(info, 2)
+        return info.style.format(thousands=",")
 
     # ------------------------------------------------------------------------------------------- #
     def as_df(self) -> pd.DataFrame:
@@ -149,6 +226,7 @@ class Explorer(ABC):
         frac: float = None,
         replace: bool = False,
         random_state: int = None,
+        by: str = None,
     ) -> pd.DataFrame:
         """Returns a sample from the FOG Dataset
 
@@ -157,8 +235,18 @@ class Explorer(ABC):
             frac (float): Proportion of items to return
             replace (bool): Whether to sample with replacement
             random_state (int): Pseudo random seed.
+            by (str): Column defining strata. If provided, n items, or the proportion frac of
+                items, are sampled from each stratum. Optional.
         """
-        df = self.df.sample(n=n, frac=frac, replace=replace, random_state=random_state)
+        if by is None:
+            df = self.df.sample(n=n, frac=frac, replace=replace, random_state=random_state)
+        else:
+            df = self.df.groupby(by=by, observed=True).sample(
+                n=None if frac is not None else n,
+                frac=frac,
+                replace=replace,
+                random_state=random_state,
+            )
         return self._format(df=df)
 
     # ------------------------------------------------------------------------------------------- #
@@ -200,6 +288,7 @@ class Explorer(ABC):
             raise
 
     # ------------------------------------------------------------------------------------------- #
+    @memoize
     def top_n(self, x: str, n: int = 10) -> pd.DataFrame:
         """Returns the observations with the top n values in the x column.
 
@@ -208,8 +297,7 @@ class Explorer(ABC):
             n (int): The top n observations to return.
         """
         try:
-            df = self.df.sort_values(by=x, ascending=False, axis=0)
-            return df.head(n)
+            return self._backend.nlargest(df=self.df, x=x, n=n)
         except KeyError as e:
             msg = f"{x} is not a valid variable in the dataset."
             logger.exception(msg)
@@ -220,6 +308,7 @@ class Explorer(ABC):
         return self.df.head(n)
 
     # ------------------------------------------------------------------------------------------- #
+    @memoize
     def describe(
         self,
         x: list[str] = None,
@@ -239,21 +328,20 @@ class Explorer(ABC):
         if x is not None:
             df = df[x]
 
-        stats = SummaryStats()
+        stats = SummaryStats(backend=self._backend)
         stats.describe(data=df, groupby=groupby, include=include, exclude=exclude)
         return stats
 
     # ------------------------------------------------------------------------------------------- #
+    @memoize
     def unique(self, columns: list = None) -> pd.DataFrame:
         """Returns a DataFrame containing the unique values for all or the designated columns.
 
         Args:
             columns (list): List of columns for which unique values are to be returned.
         """
-        if columns is not None:
-            df = self.df[columns].drop_duplicates().reset_index(drop=True)
-        else:
-            df = self.df.drop_duplicates().reset_index(drop=True)
+        df = self.df if columns is None else self.df[columns]
+        df = self._backend.drop_duplicates(df=df)
         return self._format(df=df)
 
     # ------------------------------------------------------------------------------------------- #
@@ -317,6 +405,7 @@ class Explorer(ABC):
         return top_n
 
     # ------------------------------------------------------------------------------------------- #
+    @memoize
     def frequency(
         self,
         x: Union[str, List[str]],
@@ -332,43 +421,17 @@ class Explorer(ABC):
             sort (bool): Whether to sort by frequencies. If False, sorting will done by label.
             ascending (bool): Whether to sort ascending.
             formatting (bool): Whether to format the DataFrame for presentation.
-            bins (int): Rather than count values, group them into half-open bins, only works with numeric data.
+            bins (int): Rather than count values, group them into half-open bins. Only applies to a single numeric variable.
 
         """
 
-        if isinstance(self.df[x], pd.Series):
-            abs = (
-                self.df[x]
-                .value_counts(
-                    normalize=False, sort=sort, bins=bins, ascending=ascending
-                )
-                .to_frame()
-            )
-            rel = (
-                self.df[x]
-                .value_counts(normalize=True, sort=sort, bins=bins, ascending=ascending)
-                .to_frame()
-            )
-        else:
-            abs = (
-                self.df[x]
-                .value_counts(normalize=False, sort=sort, ascending=ascending)
-                .to_frame()
-            )
-            rel = (
-                self.df[x]
-                .value_counts(normalize=True, sort=sort, ascending=ascending)
-                .to_frame()
-            )
-        freq = abs.join(rel, on=x)
-        freq.loc["Total"] = freq.sum()
-        freq["cumulative"] = freq["proportion"].cumsum()
-        freq.loc[freq.index[-1], freq.columns[-1]] = " "
-        if formatting:
-            freq = self._format(freq)
-        return freq
+        freq = FrequencyDistribution.describe(data=self.df, x=x, bins=bins, backend=self._backend)
+        return self._frequency_table(
+            freq=freq, sort=sort, ascending=ascending, formatting=formatting
+        )
 
     # ------------------------------------------------------------------------------------------- #
+    @memoize
     def countstats(self, x: str, df: pd.DataFrame = None) -> pd.DataFrame:
         """Computes descriptive statistics of counts for a variable.
 
@@ -384,17 +447,34 @@ class Explorer(ABC):
             Count Statistics: pd.DataFrame
 
         """
-        if df is None:
-            counts = self.df[x].value_counts().to_frame().reset_index()
-        else:
-            counts = df[x].value_counts().to_frame().reset_index()
-        stats = counts["count"].describe().to_frame().reset_index()
+        df = self.df if df is None else df
+        counts = self._backend.value_counts(df=df, columns=[x])
+        counts = counts.sort_values(ascending=False, kind="stable").to_frame().reset_index()
+        stats = counts["count"].describe().to_frame()
         stats.columns = [x]
         return counts, stats.T
 
     # ------------------------------------------------------------------------------------------- #
     #                                PRIVATE METHODS                                              #
     # ------------------------------------------------------------------------------------------- #
+    def _frequency_table(
+        self,
+        freq: FrequencyDistribution,
+        sort: bool = False,
+        ascending: bool = True,
+        formatting: bool = True,
+    ) -> pd.DataFrame:
+        """Renders a frequency distribution with totals and cumulative proportions."""
+        freq = freq.to_frame(sort=sort, ascending=ascending)
+        if not isinstance(freq.index, pd.MultiIndex):
+            freq.index = freq.index.astype(object)
+        freq.loc["Total"] = freq.sum()
+        freq["cumulative"] = freq["proportion"].cumsum()
+        freq.loc[freq.index[-1], freq.columns[-1]] = " "
+        if formatting:
+            freq = self._format(freq)
+        return freq
+
     def _format(self, df: pd.DataFrame) -> pd.DataFrame:
         """Returns the resulting dataframe with capitalized column names."""
         # df.columns = [col.capitalize() for col in df.columns]
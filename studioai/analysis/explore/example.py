@@ -11,22 +11,27 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Wednesday August 23rd 2023 05:56:02 am                                              #
-# Modified   : Monday May 20th 2024 05:02:45 am                                                    #
+# Modified   : Monday October 19th 2026 06:40:10 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 from __future__ import annotations
 
+from typing import Union
+
 import pandas as pd
 
+from studioai.analysis.backend import Backend
 from studioai.analysis.explore.eda import Explorer
 
 
 # ------------------------------------------------------------------------------------------------ #
 class CreditScoreExplorer(Explorer):
-    def __init__(self, df: pd.DataFrame) -> None:
-        super().__init__(df=df)
+    def __init__(
+        self, df: pd.DataFrame, cache_size: int = 128, backend: Union[str, Backend] = "pandas"
+    ) -> None:
+        super().__init__(df=df, cache_size=cache_size, backend=backend)
 
     @property
     def summary(self) -> pd.DataFrame:
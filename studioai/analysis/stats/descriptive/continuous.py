@@ -11,11 +11,12 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Thursday June 8th 2023 02:56:56 am                                                  #
-# Modified   : Thursday October 19th 2023 07:02:46 pm                                              #
+# Modified   : Monday October 19th 2026 05:24:06 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
+from __future__ import annotations
 from dataclasses import dataclass
 from typing import Union
 import logging
@@ -68,3 +69,59 @@ class ContinuousStats(DataClass):
             skew=stats.skew(x),
             kurtosis=stats.kurtosis(x, bias=False),
         )
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class SufficientStats(DataClass):
+    """Count, mean and sum of squared deviations from the mean (M2) of a sample.
+
+    These are sufficient for the mean and variance of the sample. Statistics computed over
+    partitions of the data can be merged exactly, without revisiting the data, using the
+    pairwise update of Chan, Golub and LeVeque (1979).
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    @property
+    def var(self) -> float:
+        """Returns the unbiased (ddof=1) sample variance."""
+        if self.count < 2:
+            return np.nan
+        return self.m2 / (self.count - 1)
+
+    @property
+    def std(self) -> float:
+        """Returns the sample (ddof=1) standard deviation."""
+        return np.sqrt(self.var)
+
+    @classmethod
+    def describe(cls, x: Union[pd.Series, np.ndarray]) -> SufficientStats:
+        """Computes the sufficient statistics of the non-null values in x."""
+        x = np.asarray(x, dtype=np.float64)
+        x = x[~np.isnan(x)]
+        if len(x) == 0:
+            return cls()
+        mean = x.mean()
+        return cls(count=len(x), mean=mean, m2=np.square(x - mean).sum())
+
+    @classmethod
+    def from_summary(cls, count: int, mean: float, std: float) -> SufficientStats:
+        """Creates the statistics from a count, mean and sample (ddof=1) standard deviation."""
+        m2 = 0.0 if count < 2 else float(std) ** 2 * (count - 1)
+        return cls(count=int(count), mean=float(mean), m2=m2)
+
+    def merge(self, other: SufficientStats) -> SufficientStats:
+        """Combines these statistics with those of another partition of the data."""
+        count = self.count + other.count
+        if count == 0:
+            return SufficientStats()
+        delta = other.mean - self.mean
+        mean = self.mean + delta * other.count / count
+        m2 = self.m2 + other.m2 + delta**2 * self.count * other.count / count
+        return SufficientStats(count=count, mean=mean, m2=m2)
+
+    def __add__(self, other: SufficientStats) -> SufficientStats:
+        return self.merge(other)
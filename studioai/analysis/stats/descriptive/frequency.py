@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /studioai/analysis/stats/descriptive/frequency.py                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:08:15 pm                                                #
+# Modified   : Monday October 19th 2026 05:21:22 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Frequency Distribution Module"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from functools import reduce
+from typing import Iterable, List, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+from studioai import DataClass
+from studioai.analysis.backend import Backend
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+# Largest number of level combinations that will be counted in a dense array when counting
+# several categorical variables. Above this, counting falls back to hashing the rows.
+MAX_DENSE_KEYS = 2**22
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class FrequencyDistribution(DataClass):
+    """Absolute frequencies of one or more variables.
+
+    Counts are obtained in a single counting pass. Proportions are derived from the counts,
+    rather than counted again. Distributions computed on partitions of the same data can be
+    combined with `merge` (or `+`), provided the partitions were binned with the same edges.
+
+    Args:
+        name (Union[str, List[str]]): The variable or variables counted.
+        counts (pd.Series): Absolute counts indexed by value, or by tuples of values
+            if more than one variable was counted.
+    """
+
+    name: Union[str, List[str]] = None
+    counts: pd.Series = None
+
+    @property
+    def total(self) -> int:
+        """Returns the number of observations counted."""
+        return int(self.counts.sum())
+
+    @property
+    def proportions(self) -> pd.Series:
+        """Returns the relative frequencies."""
+        return (self.counts / self.total).rename("proportion")
+
+    @classmethod
+    def describe(
+        cls,
+        data: Union[pd.DataFrame, pd.Series],
+        x: Union[str, List[str]] = None,
+        bins: Union[int, Sequence[float]] = None,
+        dropna: bool = True,
+        backend: Backend = None,
+    ) -> FrequencyDistribution:
+        """Counts the values of one or more variables.
+
+        Args:
+            data (Union[pd.DataFrame, pd.Series]): The data to be counted.
+            x (Union[str, List[str]]): Variable or variables in data. Ignored for Series.
+            bins (Union[int, Sequence[float]]): Rather than count values, group them into
+                half-open bins. Either the number of equal width bins, or the bin edges. Edges
+                must be used if distributions from different partitions are to be merged.
+                Only applies to a single numeric variable. Optional.
+            dropna (bool): Whether to exclude missing values from the counts. Default = True
+            backend (Backend): Compute backend used to count values that are neither binned nor
+                categorical. Defaults to pandas.
+        """
+        if isinstance(data, pd.Series):
+            x = data.name
+        else:
+            data = data[x]
+
+        if isinstance(data, pd.Series):
+            counts = cls._count_series(series=data, bins=bins, dropna=dropna, backend=backend)
+        else:
+            counts = cls._count_frame(df=data, dropna=dropna, backend=backend)
+
+        return cls(name=x, counts=counts.rename("count"))
+
+    def merge(self, other: FrequencyDistribution) -> FrequencyDistribution:
+        """Combines the counts of this distribution with those of another.
+
+        Args:
+            other (FrequencyDistribution): Distribution of the same variables from another
+                partition of the data.
+        """
+        if self.name != other.name:
+            msg = f"Unable to merge frequencies of {other.name} with frequencies of {self.name}."
+            logger.error(msg)
+            raise ValueError(msg)
+        counts = self.counts.add(other.counts, fill_value=0).astype("int64")
+        return FrequencyDistribution(name=self.name, counts=counts.rename("count"))
+
+    def __add__(self, other: FrequencyDistribution) -> FrequencyDistribution:
+        return self.merge(other)
+
+    @classmethod
+    def combine(cls, distributions: Iterable[FrequencyDistribution]) -> FrequencyDistribution:
+        """Merges the distributions computed over several partitions of the data."""
+        return reduce(lambda a, b: a.merge(b), distributions)
+
+    def to_frame(self, sort: bool = False, ascending: bool = True) -> pd.DataFrame:
+        """Returns the absolute and relative frequencies in DataFrame format.
+
+        Args:
+            sort (bool): Whether to sort by frequencies. If False, sorting will done by label.
+            ascending (bool): Whether to sort ascending.
+        """
+        if sort:
+            counts = self.counts.sort_values(ascending=ascending, kind="stable")
+        else:
+            counts = self.counts.sort_index(ascending=ascending)
+        freq = counts.to_frame(name="count")
+        freq["proportion"] = freq["count"] / self.total
+        return freq
+
+    # -------------------------------------------------------------------------------------------- #
+    @classmethod
+    def _count_series(
+        cls,
+        series: pd.Series,
+        bins: Union[int, Sequence[float]] = None,
+        dropna: bool = True,
+        backend: Backend = None,
+    ) -> pd.Series:
+        """Counts the values in a series."""
+        if bins is not None and is_numeric_dtype(series) and not is_bool_dtype(series):
+            series = pd.cut(series, bins=bins, include_lowest=True)
+
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return cls._count_codes(series=series, dropna=dropna)
+
+        if backend is not None and dropna:
+            return backend.value_counts(df=series.to_frame(), columns=[series.name])
+
+        return series.value_counts(sort=False, dropna=dropna)
+
+    @classmethod
+    def _count_codes(cls, series: pd.Series, dropna: bool = True) -> pd.Series:
+        """Counts a categorical series from its integer codes, without hashing the values."""
+        categories = series.cat.categories
+        codes = series.cat.codes.to_numpy()
+        counts = pd.Series(
+            np.bincount(codes[codes >= 0], minlength=len(categories)),
+            index=pd.CategoricalIndex(
+                categories,
+                categories=categories,
+                ordered=series.cat.ordered,
+                name=series.name,
+            ),
+        )
+        if not dropna:
+            nulls = int(np.count_nonzero(codes < 0))
+            if nulls:
+                counts = pd.concat([counts, pd.Series([nulls], index=[np.nan])])
+                counts.index.name = series.name
+        return counts
+
+    @classmethod
+    def _count_frame(
+        cls, df: pd.DataFrame, dropna: bool = True, backend: Backend = None
+    ) -> pd.Series:
+        """Counts the combinations of values across the columns of a DataFrame.
+
+        When every column is categorical, the codes are combined into a single integer key
+        and counted with bincount. Otherwise, the rows are hashed once by value_counts.
+        """
+        columns = list(df.columns)
+        if dropna and all(isinstance(dtype, pd.CategoricalDtype) for dtype in df.dtypes):
+            shape = tuple(len(df[col].cat.categories) for col in columns)
+            if 0 < np.prod(shape, dtype=np.float64) <= MAX_DENSE_KEYS:
+                codes = [df[col].cat.codes.to_numpy().astype(np.intp) for col in columns]
+                valid = np.logical_and.reduce([code >= 0 for code in codes])
+                keys = np.ravel_multi_index([code[valid] for code in codes], shape)
+                counts = np.bincount(keys, minlength=int(np.prod(shape)))
+                observed = np.flatnonzero(counts)
+                levels = np.unravel_index(observed, shape)
+                index = pd.MultiIndex.from_arrays(
+                    [df[col].cat.categories[level] for col, level in zip(columns, levels)],
+                    names=columns,
+                )
+                return pd.Series(counts[observed], index=index)
+
+        if backend is not None and dropna:
+            return backend.value_counts(df=df, columns=columns)
+
+        return df.value_counts(sort=False, dropna=dropna)
@@ -11,20 +11,23 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Wednesday August 23rd 2023 12:15:10 am                                              #
-# Modified   : Thursday October 19th 2023 07:43:17 pm                                              #
+# Modified   : Monday October 19th 2026 05:21:22 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 """Summary Statistics Module"""
-from typing import Union
+from typing import Iterable, Union
 import logging
 
 import pandas as pd
 import numpy as np
 
 from studioai import NUMERIC_TYPES, NON_NUMERIC_TYPES
+from studioai.analysis.backend import Backend, get_backend
 from studioai.analysis.stats.descriptive.base import DescriptiveStats
+from studioai.analysis.stats.descriptive.continuous import SufficientStats
+from studioai.analysis.stats.descriptive.frequency import FrequencyDistribution
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
@@ -32,10 +35,16 @@ logger = logging.getLogger(__name__)
 
 # ------------------------------------------------------------------------------------------------ #
 class SummaryStats(DescriptiveStats):
-    """Object encapsulating numeric and categorical data summary statistics"""
+    """Object encapsulating numeric and categorical data summary statistics
 
-    def __init__(self) -> None:
+    Args:
+        backend (Union[str, Backend]): Compute backend for numeric statistics of ungrouped
+            data, when no data types are included or excluded. See get_backend. Default = 'pandas'
+    """
+
+    def __init__(self, backend: Union[str, Backend] = "pandas") -> None:
         super().__init__()
+        self._backend = get_backend(backend)
         self._numeric_summary = None
         self._categorical_summary = None
 
@@ -146,6 +155,12 @@ class SummaryStats(DescriptiveStats):
 
         # If inclusion/exclusion not specified, we describe numbers
         if include is None and exclude is None:
+            if isinstance(data, pd.DataFrame):
+                if data.select_dtypes(include=np.number).shape[1] == 0:
+                    msg = "No numeric values to describe"
+                    logger.debug(msg)
+                    return None
+                return self._backend.describe(df=data)
             include = np.number
         # If include is an iterable, extract numeric types, bounce if there are none.
         elif isinstance(include, list):
@@ -174,3 +189,141 @@ class SummaryStats(DescriptiveStats):
             msg = "No numeric values to describe"
             logger.debug(msg)
             return None
+
+
+# ------------------------------------------------------------------------------------------------ #
+class StreamingSummaryStats(DescriptiveStats):
+    """Summary statistics computed over a stream of DataFrame chunks.
+
+    Each chunk is visited once. Counts, means, standard deviations, minimums and maximums of
+    numeric variables are exact, as are the counts, cardinality and mode of categorical
+    variables. Quartiles are estimated from a uniform random sample of each numeric variable,
+    and are exact when a variable has no more observations than the sample size.
+
+    Args:
+        sample_size (int): Number of observations per numeric variable retained to estimate
+            quartiles. Default = 100,000
+        random_state (int): Pseudo random seed for the quartile sample. Optional.
+    """
+
+    def __init__(self, sample_size: int = 100000, random_state: int = None) -> None:
+        super().__init__()
+        self._sample_size = sample_size
+        self._random_state = random_state
+        self._numeric_summary = None
+        self._categorical_summary = None
+
+    @property
+    def numeric(self) -> pd.DataFrame:
+        """Returns descriptive statistics for numeric variables if available."""
+        return self._numeric_summary
+
+    @property
+    def categorical(self) -> pd.DataFrame:
+        """Returns descriptive statistics for categorical variables if available."""
+        return self._categorical_summary
+
+    def describe(
+        self,
+        data: Iterable[pd.DataFrame],
+        groupby: Union[str, list[str]] = None,
+        include: Union[str, list[str]] = None,
+        exclude: Union[str, list[str]] = None,
+    ) -> None:
+        """Computes descriptive statistics
+
+        Args:
+            data (Iterable[pd.DataFrame]): Chunks of the data, each with the same columns.
+            groupby Union[str, list[str]]): Not supported for streamed data.
+            include Union[str, list[str]]): A white list of data types to include in the
+                result. See SummaryStats.describe.
+            exclude Union[str, list[str]]): A black list of data types to exclude from the
+                result. See SummaryStats.describe.
+        """
+        if groupby is not None:
+            msg = "Grouped descriptive statistics are not supported for streamed data."
+            logger.error(msg)
+            raise NotImplementedError(msg)
+
+        rng = np.random.default_rng(self._random_state)
+        numeric, categorical = None, None
+        moments, minimums, maximums, samples, frequencies = {}, {}, {}, {}, {}
+
+        for chunk in data:
+            if numeric is None:
+                numeric, categorical = self._select(chunk=chunk, include=include, exclude=exclude)
+            for col in numeric:
+                x = chunk[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                x = x[~np.isnan(x)]
+                if len(x) == 0:
+                    continue
+                moments[col] = moments.get(col, SufficientStats()) + SufficientStats.describe(x)
+                minimums[col] = min(minimums.get(col, np.inf), x.min())
+                maximums[col] = max(maximums.get(col, -np.inf), x.max())
+                samples[col] = self._sample(current=samples.get(col), x=x, rng=rng)
+            for col in categorical:
+                freq = FrequencyDistribution.describe(data=chunk[col])
+                frequencies[col] = frequencies[col] + freq if col in frequencies else freq
+
+        if numeric:
+            self._numeric_summary = pd.DataFrame(
+                {
+                    col: self._summarize_numeric(
+                        moments=moments.get(col, SufficientStats()),
+                        minimum=minimums.get(col, np.nan),
+                        maximum=maximums.get(col, np.nan),
+                        sample=samples.get(col),
+                    )
+                    for col in numeric
+                }
+            )
+        if categorical:
+            self._categorical_summary = pd.DataFrame(
+                {col: self._summarize_categorical(freq=frequencies[col]) for col in categorical}
+            )
+
+    def _select(
+        self,
+        chunk: pd.DataFrame,
+        include: Union[str, list[str]] = None,
+        exclude: Union[str, list[str]] = None,
+    ) -> tuple:
+        """Returns the numeric and categorical columns to be described."""
+        if include is not None or exclude is not None:
+            chunk = chunk.select_dtypes(include=include, exclude=exclude)
+        numeric = list(chunk.select_dtypes(include=np.number).columns)
+        categorical = list(chunk.select_dtypes(include=NON_NUMERIC_TYPES).columns)
+        return numeric, categorical
+
+    def _sample(self, current: tuple, x: np.ndarray, rng: np.random.Generator) -> tuple:
+        """Maintains a uniform sample by keeping the values with the smallest random keys."""
+        keys = rng.random(len(x))
+        if current is not None:
+            keys = np.concatenate([current[0], keys])
+            x = np.concatenate([current[1], x])
+        if len(x) > self._sample_size:
+            idx = np.argpartition(keys, self._sample_size)[: self._sample_size]
+            keys, x = keys[idx], x[idx]
+        return keys, x
+
+    def _summarize_numeric(
+        self, moments: SufficientStats, minimum: float, maximum: float, sample: tuple
+    ) -> pd.Series:
+        quartiles = (
+            np.percentile(sample[1], [25, 50, 75]) if sample is not None else [np.nan] * 3
+        )
+        return pd.Series(
+            [moments.count, moments.mean, moments.std, minimum, *quartiles, maximum],
+            index=["count", "mean", "std", "min", "25%", "50%", "75%", "max"],
+            dtype=np.float64,
+        )
+
+    def _summarize_categorical(self, freq: FrequencyDistribution) -> pd.Series:
+        counts = freq.counts[freq.counts > 0]
+        if len(counts) == 0:
+            return pd.Series([0, 0, np.nan, np.nan], index=["count", "unique", "top", "freq"])
+        return pd.Series(
+            [freq.total, len(counts), counts.idxmax(), counts.max()],
+            index=["count", "unique", "top", "freq"],
+            dtype=object,
+        )
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /studioai/analysis/stats/distribution/estimate.py                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:33:46 pm                                                #
+# Modified   : Monday October 19th 2026 06:22:13 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Distribution Parameter Estimation Module"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+from scipy import optimize, special, stats
+
+from studioai.util.cache import CacheStats, LRUCache
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+SAMPLE_SIZE = 100000
+NUM_STRATA = 20
+MAX_EVALS = 50
+# Distributions for which scipy computes maximum likelihood estimates in closed form.
+CLOSED_FORM = ("norm", "expon", "uniform")
+# ------------------------------------------------------------------------------------------------ #
+_cache = LRUCache(maxsize=256)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                 METHOD OF MOMENTS                                                #
+# ------------------------------------------------------------------------------------------------ #
+def _norm(x: np.ndarray) -> tuple:
+    return (x.mean(), x.std())
+
+
+def _expon(x: np.ndarray) -> tuple:
+    return (x.min(), x.mean() - x.min())
+
+
+def _uniform(x: np.ndarray) -> tuple:
+    return (x.min(), np.ptp(x))
+
+
+def _logistic(x: np.ndarray) -> tuple:
+    return (x.mean(), x.std() * np.sqrt(3) / np.pi)
+
+
+def _shift(x: np.ndarray) -> float:
+    """Returns a loc of zero, or just below the minimum if the data are not all positive,
+    so that the support of a distribution on the positive reals covers the data."""
+    return min(0.0, x.min() - 1e-6 * max(np.ptp(x), 1.0))
+
+
+def _gamma(x: np.ndarray) -> tuple:
+    # The shape matching the skewness, as in scipy's starting values, with the loc bounded
+    # by the minimum. Near symmetric data are fitted by a large shape, far from zero.
+    mean, var = x.mean(), x.var()
+    skew = np.mean((x - mean) ** 3) / var**1.5
+    shape = 4 / (1e-8 + skew**2)
+    loc = min(mean - np.sqrt(shape * var), _shift(x))
+    mean -= loc
+    return (mean**2 / var, loc, var / mean)
+
+
+def _chi2(x: np.ndarray) -> tuple:
+    shape, loc, scale = _gamma(x)
+    return (2 * shape, loc, scale / 2)
+
+
+def _lognorm(x: np.ndarray) -> tuple:
+    # Shift the data so that it is positive, and estimate on the log scale.
+    loc = _shift(x)
+    logx = np.log(x - loc)
+    return (logx.std(), loc, np.exp(logx.mean()))
+
+
+def _weibull_min(x: np.ndarray) -> tuple:
+    loc = _shift(x)
+    mean = (x - loc).mean()
+    c = (x.std() / mean) ** -1.086
+    return (c, loc, mean / special.gamma(1 + 1 / c))
+
+
+def _beta(x: np.ndarray) -> tuple:
+    # Estimate on the data rescaled to a support slightly wider than its range.
+    margin = 1e-3 * np.ptp(x)
+    loc, scale = x.min() - margin, np.ptp(x) + 2 * margin
+    z = (x - loc) / scale
+    mean, var = z.mean(), z.var()
+    common = mean * (1 - mean) / var - 1
+    return (mean * common, (1 - mean) * common, loc, scale)
+
+
+# Method of moments starting values by scipy distribution name, as (*shapes, loc, scale).
+GUESSES: Dict[str, Callable] = {
+    "norm": _norm,
+    "expon": _expon,
+    "uniform": _uniform,
+    "logistic": _logistic,
+    "gamma": _gamma,
+    "chi2": _chi2,
+    "lognorm": _lognorm,
+    "weibull_min": _weibull_min,
+    "beta": _beta,
+}
+
+
+def guess_params(data: np.ndarray, dist: stats.rv_continuous) -> Tuple[tuple, dict]:
+    """Returns method of moments starting values for the fit of a distribution.
+
+    Args:
+        data (np.ndarray): 1D array of data.
+        dist (stats.rv_continuous): The scipy distribution.
+
+    Returns:
+        Shape parameters and a dictionary of loc and scale, to be passed to dist.fit. Both
+        are empty if no estimates are available for the distribution, or if the support of
+        the estimated distribution does not cover the data.
+    """
+    try:
+        with np.errstate(all="ignore"):
+            *shapes, loc, scale = GUESSES[dist.name](data)
+    except KeyError:
+        return (), {}
+    params = (*shapes, loc, scale)
+    if not np.all(np.isfinite(params)) or scale <= 0 or any(s <= 0 for s in shapes):
+        return (), {}
+    lower, upper = dist.support(*shapes, loc=loc, scale=scale)
+    if data.min() < lower or data.max() > upper:
+        return (), {}
+    return tuple(float(s) for s in shapes), {"loc": float(loc), "scale": float(scale)}
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       SUBSAMPLE                                                  #
+# ------------------------------------------------------------------------------------------------ #
+def stratified_subsample(
+    data: np.ndarray, n: int, strata: int = NUM_STRATA, random_state: int = None
+) -> np.ndarray:
+    """Returns a sample of the data stratified by quantile.
+
+    The data are split into strata of equal frequency between quantiles, and the same number
+    of values is drawn from each, so both tails are represented. The minimum and maximum
+    are always included, so the sample spans the range of the data.
+
+    Args:
+        data (np.ndarray): 1D array of data.
+        n (int): Size of the sample.
+        strata (int): Number of quantile strata. Default = 20
+        random_state (int): Seed for the random number generator. Optional.
+    """
+    if n >= len(data):
+        return data
+    rng = np.random.default_rng(random_state)
+    edges = np.quantile(data, np.linspace(0, 1, strata + 1)[1:-1])
+    labels = np.searchsorted(edges, data, side="right")
+    order = np.argsort(labels, kind="stable")
+    counts = np.bincount(labels, minlength=strata)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    sizes = np.round((n - 2) * counts / len(data)).astype(np.int64)
+    positions = [
+        start + rng.choice(count, size=min(size, count), replace=False)
+        for start, count, size in zip(starts, counts, sizes)
+        if count
+    ]
+    index = order[np.concatenate(positions)]
+    return np.concatenate([[data.min(), data.max()], data[index]])
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          FIT                                                     #
+# ------------------------------------------------------------------------------------------------ #
+def refiner(max_evals: int = MAX_EVALS) -> Callable:
+    """Returns an optimizer for dist.fit that refines estimates already close to the optimum.
+
+    The Nelder-Mead simplex starts within 1% of the initial estimates, rather than the 5%
+    used by default, and the number of negative log-likelihood evaluations is bounded, so
+    the cost of a refinement on the full data is predictable. The best vertex is returned,
+    so the result is never worse than the initial estimates.
+
+    Args:
+        max_evals (int): Maximum number of function evaluations. Default = 50
+    """
+
+    def optimizer(func: Callable, x0: np.ndarray, args: tuple = (), disp: int = 0) -> np.ndarray:
+        x0 = np.asarray(x0, dtype=np.float64)
+        steps = np.diag(0.01 * np.maximum(np.abs(x0), 1e-3))
+        result = optimize.minimize(
+            func,
+            x0,
+            args=args,
+            method="Nelder-Mead",
+            options={"initial_simplex": np.vstack([x0, x0 + steps]), "maxfev": max_evals},
+        )
+        return result.x
+
+    return optimizer
+
+
+def fit_params(
+    data: np.ndarray,
+    dist: stats.rv_continuous,
+    sample_size: int = SAMPLE_SIZE,
+    refine: bool = True,
+    max_evals: int = MAX_EVALS,
+    guess: bool = True,
+    cache: bool = True,
+    random_state: int = 0,
+) -> tuple:
+    """Estimates distribution parameters by maximum likelihood.
+
+    The optimizer starts from method of moments estimates where they are available. Data
+    larger than sample_size are fitted on a stratified subsample, and the estimates are then
+    refined on the full data with a bounded number of likelihood evaluations. Results are
+    cached by a hash of the data content and the fitting options, so refitting a column is
+    immediate.
+
+    Args:
+        data (np.ndarray): 1D array of data.
+        dist (stats.rv_continuous): The scipy distribution to fit.
+        sample_size (int): Largest number of values fitted without subsampling. Default =
+            100,000
+        refine (bool): Whether to refine the subsample estimates on the full data. If False,
+            the subsample estimates are returned. Default = True
+        max_evals (int): Maximum number of likelihood evaluations on the full data when
+            refining. Default = 50
+        guess (bool): Whether to start the optimizer from method of moments estimates.
+            Default = True
+        cache (bool): Whether to use and update the cache of fitted parameters.
+            Default = True
+        random_state (int): Seed for the subsample. Default = 0
+
+    Returns:
+        Tuple of shape parameters, loc and scale, as returned by dist.fit.
+    """
+    data = np.ascontiguousarray(data, dtype=np.float64)
+    key = None
+    if cache:
+        key = (data_hash(data), dist.name, sample_size, refine, max_evals, guess, random_state)
+        params = _cache.get(key)
+        if params is not None:
+            return params
+
+    sample = data
+    if sample_size and len(data) > sample_size and dist.name not in CLOSED_FORM:
+        sample = stratified_subsample(data, n=sample_size, random_state=random_state)
+    shapes, kwargs = guess_params(sample, dist) if guess else ((), {})
+    params = dist.fit(sample, *shapes, **kwargs)
+    if sample is not data and refine:
+        *shapes, loc, scale = params
+        params = dist.fit(data, *shapes, loc=loc, scale=scale, optimizer=refiner(max_evals))
+    params = tuple(float(p) for p in params)
+
+    if cache:
+        _cache.put(key, params)
+    return params
+
+
+def data_hash(data: np.ndarray) -> str:
+    """Returns a hash of the content of an array."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str((data.dtype.str, data.shape)).encode())
+    digest.update(np.ascontiguousarray(data).data)
+    return digest.hexdigest()
+
+
+def cache_info() -> CacheStats:
+    """Returns the hit and miss statistics of the fitted parameter cache."""
+    return _cache.stats
+
+
+def clear_cache() -> None:
+    """Removes all fitted parameters from the cache."""
+    _cache.clear()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /studioai/analysis/stats/distribution/fit.py                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:31:53 pm                                                #
+# Modified   : Monday October 19th 2026 06:38:13 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Distribution Fitting Module"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from studioai.analysis.stats.distribution.generate import DISTRIBUTIONS, get_params
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+RANK_BY = {
+    "aic": "aic",
+    "bic": "bic",
+    "ks": "ks_statistic",
+    "ad": "ad_statistic",
+}
+# Columns of the leaderboard, present even when a family cannot be fitted.
+COLUMNS = [
+    "distribution",
+    "params",
+    "k",
+    "loglik",
+    "aic",
+    "bic",
+    "ks_statistic",
+    "ks_pvalue",
+    "ad_statistic",
+]
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        SCORES                                                    #
+# ------------------------------------------------------------------------------------------------ #
+def score_fit(data: np.ndarray, distribution: str, params: tuple) -> dict:
+    """Scores fitted distribution parameters against the data.
+
+    Args:
+        data (np.ndarray): 1D array of data from which the parameters were estimated.
+        distribution (str): One of the supported distributions.
+        params (tuple): The fitted shape, loc and scale parameters.
+
+    Returns:
+        Dictionary containing the log-likelihood, AIC, BIC, Kolmogorov-Smirnov statistic and
+        p-value, and the Anderson-Darling statistic.
+    """
+    dist = DISTRIBUTIONS[distribution]
+    x = np.sort(data)
+    n = len(x)
+    k = len(params)
+    loglik = float(np.sum(dist.logpdf(x, *params)))
+    if not np.isfinite(loglik):
+        loglik = -np.inf
+    cdf = np.clip(dist.cdf(x, *params), 1e-300, 1 - 1e-16)
+    # One sample KS statistic from the sorted data.
+    ks = max((np.arange(1.0, n + 1) / n - cdf).max(), (cdf - np.arange(0.0, n) / n).max())
+    # Anderson-Darling statistic, weighting the tails of the distribution.
+    i = np.arange(1, n + 1)
+    ad = -n - np.sum((2 * i - 1) * (np.log(cdf) + np.log1p(-cdf[::-1]))) / n
+    return {
+        "k": k,
+        "loglik": loglik,
+        "aic": 2 * k - 2 * loglik,
+        "bic": k * np.log(n) - 2 * loglik,
+        "ks_statistic": float(ks),
+        "ks_pvalue": float(np.clip(stats.kstwo.sf(ks, n), 0, 1)),
+        "ad_statistic": float(ad),
+    }
+
+
+def _fit_family(data: np.ndarray, distribution: str) -> dict:
+    """Fits and scores one distribution. Runs in a worker process."""
+    try:
+        params = tuple(float(p) for p in get_params(data=data, distribution=distribution))
+        scores = score_fit(data=data, distribution=distribution, params=params)
+        return {"distribution": distribution, "params": params, **scores}
+    except Exception as e:
+        logger.warning(f"Unable to fit the {distribution} distribution.\n{e}")
+        return {"distribution": distribution, "params": None}
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      BEST FIT                                                    #
+# ------------------------------------------------------------------------------------------------ #
+def fit_best(
+    data: np.ndarray,
+    families: List[str] = None,
+    n_jobs: int = None,
+    rank_by: str = "aic",
+) -> pd.DataFrame:
+    """Fits several distributions to the data and ranks them by goodness of fit.
+
+    Each family is fitted in its own worker process. Only the parameters and fit scores are
+    computed; random variates and pdf/cdf curves for a family can be obtained afterwards
+    from RVSDistribution.
+
+    Args:
+        data (np.ndarray): 1D array of data.
+        families (List[str]): Distributions to fit. Defaults to all supported distributions.
+        n_jobs (int): Number of worker processes. Defaults to the number of processors.
+            With n_jobs=1, families are fitted in the calling process.
+        rank_by (str): Score on which the fits are ranked. One of 'aic', 'bic', 'ks' or
+            'ad'. Lower is better for each. Default = 'aic'
+
+    Returns:
+        DataFrame with one row per family, ranked from best to worst, containing the fitted
+        parameters, log-likelihood, AIC, BIC, KS statistic and p-value, and AD statistic.
+        Families that cannot be fitted are ranked last, with missing parameters and scores.
+    """
+    if rank_by not in RANK_BY:
+        msg = f"rank_by must be one of {list(RANK_BY.keys())}, not {rank_by}."
+        logger.error(msg)
+        raise ValueError(msg)
+    families = families or list(DISTRIBUTIONS.keys())
+    unsupported = [family for family in families if family not in DISTRIBUTIONS]
+    if unsupported:
+        msg = f"Unsupported distributions: {unsupported}."
+        logger.error(msg)
+        raise ValueError(msg)
+
+    data = np.asarray(data, dtype=np.float64)
+    data = data[~np.isnan(data)]
+    if n_jobs == 1:
+        rows = [_fit_family(data, family) for family in families]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            rows = list(executor.map(_fit_family, [data] * len(families), families))
+
+    result = pd.DataFrame(rows, columns=COLUMNS)
+    if result["params"].isna().all():
+        logger.warning("None of the distributions could be fitted to the data.")
+    result = result.sort_values(by=RANK_BY[rank_by], na_position="last", kind="stable")
+    result.index = pd.RangeIndex(1, len(result) + 1, name="rank")
+    return result
@@ -11,656 +11,458 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Saturday May 27th 2023 08:56:02 pm                                                  #
-# Modified   : Thursday October 19th 2023 07:02:46 pm                                              #
+# Modified   : Monday October 19th 2026 05:45:13 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 """Statistics Module"""
 from __future__ import annotations
+import functools
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 from scipy import stats
 import numpy as np
+import pandas as pd
 
 from studioai import DataClass
+from studioai.analysis.stats.distribution.estimate import fit_params
+from studioai.data.sample import RandomState, seed_sequence
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
 # ------------------------------------------------------------------------------------------------ #
 NUM_POINTS = 5000
-# ------------------------------------------------------------------------------------------------ #
-#                                    SCIPY DISTRIBUTIONS                                           #
-# ------------------------------------------------------------------------------------------------ #
-DISTRIBUTIONS = {
-    "beta": stats.beta,
-    "norm": stats.norm,
-    "X2": stats.chi2,
-    "exponential": stats.expon,
-    "f": stats.f,
-    "gamma": stats.gamma,
-    "logistic": stats.logistic,
-    "lognorm": stats.lognorm,
-    "uniform": stats.uniform,
-    "weibull": stats.weibull_min,
-}
-# ------------------------------------------------------------------------------------------------ #
-#                                    SCIPY CDF FUNCTIONS                                           #
-# ------------------------------------------------------------------------------------------------ #
-CDF = {
-    "beta": stats.beta.cdf,
-    "norm": stats.norm.cdf,
-    "X2": stats.chi2.cdf,
-    "exponential": stats.expon.cdf,
-    "f": stats.f.cdf,
-    "gamma": stats.gamma.cdf,
-    "logistic": stats.logistic.cdf,
-    "lognorm": stats.lognorm.cdf,
-    "uniform": stats.uniform.cdf,
-    "weibull": stats.weibull_min.cdf,
-}
+CHUNK_SIZE = 1000000
 
 
 # ------------------------------------------------------------------------------------------------ #
-#                                DISTRIBUTION DATACLASSES                                          #
+#                                  DISTRIBUTION FAMILIES                                           #
 # ------------------------------------------------------------------------------------------------ #
 @dataclass
-class Distribution(DataClass):
-    name: str
-    label: str
-    formula: str
-    params: str
-    x: np.ndarray
-    y: np.ndarray
-
-
-# ------------------------------------------------------------------------------------------------ #
-#                                   DATA GENERATORS                                                #
-# ------------------------------------------------------------------------------------------------ #
-def beta(data: np.ndarray, size: int = None) -> np.ndarray:
-    """Generates random variates for the beta distribution
+class Family(DataClass):
+    """A distribution supported by the generators.
 
     Args:
-        data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
-
-    Returns:
-        rvs: Random variate of the distribution
-        pdf: Data from the probability density function
-        cdf: Data from the cumulative distribution function
+        dist (stats.rv_continuous): The scipy distribution.
+        name (str): Display name of the distribution.
+        formula (str): LaTeX formula of the distribution.
+        shapes (Tuple[str, ...]): Labels of the shape parameters, in scipy order.
+        rvs_label (str): Label of the random variates.
     """
-    # Estimate parameters
-    a, b, loc, scale = get_params(data=data, distribution="beta")
-
-    name = "Beta Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
-    params = (
-        r"$\alpha=$"
-        + str(round(a, 2))
-        + r", $\beta=$"
-        + str(round(b, 2))
-        + "\nloc = "
-        + str(round(loc, 2))
-        + ", scale = "
-        + str(round(scale, 2))
-    )
-    formula = (
-        r"$ f(x, \alpha, \beta) = \frac{\Gamma(\alpha+\beta) x^{\alpha-1} (1-x)^{\beta-1}} {\Gamma(\alpha) \Gamma(\beta)}$"
-        + "\n"
-        + r"where $\Gamma$ is the gamma function"
-        + "\n"
-        + "0 <= x <= 1"
-        + "\n"
-        + r"$\alpha$ > 0, $\beta$ > 0 are shape parameters"
-    )
 
-    size = size or len(data)
+    dist: stats.rv_continuous = None
+    name: str = None
+    formula: str = ""
+    shapes: Tuple[str, ...] = ()
+    rvs_label: str = "Random Variate"
+
+    def describe(self, params: tuple) -> str:
+        """Returns a description of fitted shape, loc and scale parameters."""
+        *shapes, loc, scale = params
+        text = "loc = " + str(round(loc, 2)) + ", scale = " + str(round(scale, 2))
+        if shapes:
+            labels = ", ".join(
+                label + str(round(value, 2)) for label, value in zip(self.shapes, shapes)
+            )
+            text = labels + "\n" + text
+        return text
 
-    # Random variate
-    rvs = stats.beta.rvs(a, b, loc=loc, scale=scale, size=size)
-    rvs = Distribution(
-        name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
-    )
 
-    # Probability density function
-    pdf = stats.beta.pdf(x=x_range, a=a, b=b, loc=loc, scale=scale)
-    pdf = Distribution(
-        name=name,
-        label="Probability Density Function",
-        formula=formula,
-        params=params,
-        x=x_range,
-        y=pdf,
-    )
-
-    # Cumulative density function
-    cdf = stats.beta.cdf(x=x_range, a=a, b=b, loc=loc, scale=scale)
-    cdf = Distribution(
-        name=name,
-        label="Cumulative Density Function",
-        params=params,
-        formula=formula,
-        x=x_range,
-        y=cdf,
-    )
-
-    return rvs, pdf, cdf
+# Families by key, with the scipy distributions and cdf functions they register.
+FAMILIES: Dict[str, Family] = {}
+DISTRIBUTIONS: Dict[str, stats.rv_continuous] = {}
+CDF: Dict[str, Callable] = {}
 
 
-def norm(data: np.ndarray, size: int = None) -> np.ndarray:
-    """Generates random variates for the normal distribution
+def register(
+    key: str,
+    dist: stats.rv_continuous,
+    name: str = None,
+    formula: str = "",
+    shapes: Tuple[str, ...] = None,
+    rvs_label: str = "Random Variate",
+) -> Family:
+    """Registers a scipy continuous distribution with the generators.
 
     Args:
-        data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
-
-    Returns:
-        rvs: Random variate of the distribution
-        pdf: Data from the probability density function
-        cdf: Data from the cumulative distribution function
+        key (str): Key by which the distribution is requested.
+        dist (stats.rv_continuous): The scipy distribution.
+        name (str): Display name. Defaults to the capitalized scipy name.
+        formula (str): LaTeX formula of the distribution. Optional.
+        shapes (Tuple[str, ...]): Labels of the shape parameters. Defaults to the scipy
+            names of the shape parameters.
+        rvs_label (str): Label of the random variates.
     """
-    # Estimate parameters
-    loc, scale = get_params(data=data, distribution="norm")
-
-    name = "Normal Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
-    params = "loc = " + str(round(loc, 2)) + ", scale = " + str(round(scale, 2))
-    formula = r"$ f(x) = \frac{\exp(-x^2/2)}{\sqrt{2\pi}}$" + "\n" + r"For real number x"
-
-    size = size or len(data)
-
-    # Random variate
-    rvs = stats.norm.rvs(loc=loc, scale=scale, size=size)
-    rvs = Distribution(
-        name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
-    )
-
-    # Probability density function
-    pdf = stats.norm.pdf(x=x_range, loc=loc, scale=scale)
-    pdf = Distribution(
-        name=name,
-        label="Probability Density Function",
+    if shapes is None:
+        shapes = tuple(f"{shape} =" for shape in (dist.shapes or "").split(", ") if shape)
+    family = Family(
+        dist=dist,
+        name=name or f"{dist.name.capitalize()} Distribution",
         formula=formula,
-        params=params,
-        x=x_range,
-        y=pdf,
+        shapes=shapes,
+        rvs_label=rvs_label,
     )
-
-    # Cumulative density function
-    cdf = stats.norm.cdf(x=x_range, loc=loc, scale=scale)
-    cdf = Distribution(
-        name=name,
-        label="Cumulative Density Function",
-        params=params,
-        formula=formula,
-        x=x_range,
-        y=cdf,
-    )
-
-    return rvs, pdf, cdf
+    FAMILIES[key] = family
+    DISTRIBUTIONS[key] = dist
+    CDF[key] = dist.cdf
+    return family
 
 
-def chi2(data: np.ndarray, size: int = None) -> np.ndarray:
-    """Generates random variates for the chi-squared distribution
-
-    Args:
-        data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
-
-    Returns:
-        rvs: Random variate of the distribution
-        pdf: Data from the probability density function
-        cdf: Data from the cumulative distribution function
-    """
-    _, loc, scale = get_params(data=data, distribution="X2")
-    df = len(data) - 1
-    name = r"$\chi^2$ Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
-    params = "loc = " + str(round(loc, 2)) + ", scale = " + str(round(scale, 2))
-    formula = (
+register(
+    key="beta",
+    dist=stats.beta,
+    name="Beta Distribution",
+    formula=(
+        r"$ f(x, \alpha, \beta) = \frac{\Gamma(\alpha+\beta) x^{\alpha-1} (1-x)^{\beta-1}} {\Gamma(\alpha) \Gamma(\beta)}$"
+        + "\n"
+        + r"where $\Gamma$ is the gamma function"
+        + "\n"
+        + "0 <= x <= 1"
+        + "\n"
+        + r"$\alpha$ > 0, $\beta$ > 0 are shape parameters"
+    ),
+    shapes=(r"$\alpha=$", r"$\beta=$"),
+)
+register(
+    key="norm",
+    dist=stats.norm,
+    name="Normal Distribution",
+    formula=r"$ f(x) = \frac{\exp(-x^2/2)}{\sqrt{2\pi}}$" + "\n" + r"For real number x",
+)
+register(
+    key="X2",
+    dist=stats.chi2,
+    name=r"$\chi^2$ Distribution",
+    formula=(
         r"$ f(x, k) = \frac{1}{2^{k/2} \Gamma \left( k/2 \right)} x^{k/2-1} \exp \left( -x/2 \right)$"
         + "\n"
         + "for x>0 and k>0 (degrees of freedom)"
-    )
-
-    size = size or len(data)
-
-    # Random variate
-    rvs = stats.chi2.rvs(df=df, loc=loc, scale=scale, size=size)
-    rvs = Distribution(
-        name=name,
-        label=r"$\chi^2$ Random Variate",
-        x=x_range,
-        y=rvs,
-        params=params,
-        formula=formula,
-    )
-
-    # Probability density function
-    pdf = stats.chi2.pdf(x=x_range, df=df, loc=loc, scale=scale)
-    pdf = Distribution(
-        name=name,
-        label="Probability Density Function",
-        formula=formula,
-        params=params,
-        x=x_range,
-        y=pdf,
-    )
-
-    # Cumulative density function
-    cdf = stats.chi2.cdf(x=x_range, df=df, loc=loc, scale=scale)
-    cdf = Distribution(
-        name=name,
-        label="Cumulative Density Function",
-        params=params,
-        formula=formula,
-        x=x_range,
-        y=cdf,
-    )
-
-    return rvs, pdf, cdf
-
-
-def exponential(data: np.ndarray, size: int = None) -> np.ndarray:
-    """Generates random variates for the exponential distribution
-
-    Args:
-        data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
-
-    Returns:
-        rvs: Random variate of the distribution
-        pdf: Data from the probability density function
-        cdf: Data from the cumulative distribution function
-    """
-    loc, scale = get_params(data=data, distribution="exponential")
-    rvs = stats.expon.rvs(loc=loc, scale=scale, size=size)
-    name = "Exponential Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
-    params = "\nloc = " + str(round(loc, 2)) + ", scale = " + str(round(scale, 2))
-    formula = r"$f(x) = \exp(-x)$" + "\n" + r"for x >= 0"
-
-    size = size or len(data)
-
-    # Random variate
-    rvs = stats.expon.rvs(loc=loc, scale=scale, size=size)
-    rvs = Distribution(
-        name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
-    )
-
-    # Probability density function
-    pdf = stats.expon.pdf(x=x_range, loc=loc, scale=scale)
-    pdf = Distribution(
-        name=name,
-        label="Probability Density Function",
-        formula=formula,
-        params=params,
-        x=x_range,
-        y=pdf,
-    )
-
-    # Cumulative density function
-    cdf = stats.expon.cdf(x=x_range, loc=loc, scale=scale)
-    cdf = Distribution(
-        name=name,
-        label="Cumulative Density Function",
-        params=params,
-        formula=formula,
-        x=x_range,
-        y=cdf,
-    )
-
-    return rvs, pdf, cdf
-
-
-def f(data: np.ndarray, size: int = None) -> np.ndarray:
-    """Generates random variates for the f distribution
-
-    Args:
-        data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
-
-    Returns:
-        rvs: Random variate of the distribution
-        pdf: Data from the probability density function
-        cdf: Data from the cumulative distribution function
-    """
-    dfn, dfd, loc, scale = get_params(data=data, distribution="f")
-    name = "F Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
-    params = (
-        r"$df_1=$"
-        + str(round(dfn, 2))
-        + r", $df_2$"
-        + str(round(dfd, 2))
-        + "\nloc = "
-        + str(round(loc, 2))
-        + ", scale = "
-        + str(round(scale, 2))
-    )
-    formula = (
+    ),
+    shapes=("k =",),
+    rvs_label=r"$\chi^2$ Random Variate",
+)
+register(
+    key="exponential",
+    dist=stats.expon,
+    name="Exponential Distribution",
+    formula=r"$f(x) = \exp(-x)$" + "\n" + r"for x >= 0",
+)
+register(
+    key="f",
+    dist=stats.f,
+    name="F Distribution",
+    formula=(
         r"$f(x, df_1, df_2) = \frac{df_2^{df_2/2} df_1^{df_1/2} x^{df_1 / 2-1}}{(df_2+df_1 x)^{(df_1+df_2)/2}B(df_1/2, df_2/2)}$"
         + "\n"
         + r"For x > 0 and parameters $df_1$, $df_2$ > 0"
-    )
-
-    size = size or len(data)
-
-    # Random variate
-    rvs = stats.f.rvs(dfn=dfn, dfd=dfd, loc=loc, scale=scale, size=size)
-    rvs = Distribution(
-        name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
-    )
-
-    # Probability density function
-    pdf = stats.f.pdf(x=x_range, dfn=dfn, dfd=dfd, loc=loc, scale=scale)
-    pdf = Distribution(
-        name=name,
-        label="Probability Density Function",
-        formula=formula,
-        params=params,
-        x=x_range,
-        y=pdf,
-    )
-
-    # Cumulative density function
-    cdf = stats.f.cdf(
-        x=x_range,
-        dfn=dfn,
-        dfd=dfd,
-        loc=loc,
-        scale=scale,
-    )
-    cdf = Distribution(
-        name=name,
-        label="Cumulative Density Function",
-        params=params,
-        formula=formula,
-        x=x_range,
-        y=cdf,
-    )
-
-    return rvs, pdf, cdf
-
-
-def gamma(data: np.ndarray, size: int = None) -> np.ndarray:
-    """Generates random variates for the gamma distribution
-
-    Args:
-        data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
-
-    Returns:
-        rvs: Random variate of the distribution
-        pdf: Data from the probability density function
-        cdf: Data from the cumulative distribution function
-    """
-    a, loc, scale = get_params(data=data, distribution="gamma")
-    name = "Gamma Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
-    params = (
-        "a ="
-        + str(round(a, 2))
-        + "\nloc = "
-        + str(round(loc, 2))
-        + ", scale = "
-        + str(round(scale, 2))
-    )
-    formula = (
+    ),
+    shapes=(r"$df_1=$", r"$df_2=$"),
+)
+register(
+    key="gamma",
+    dist=stats.gamma,
+    name="Gamma Distribution",
+    formula=(
         r"$f(x, a) = \frac{x^{a-1} e^{-x}}{\Gamma(a)}$"
         + "\n"
         + r"For x >= 0, a > 0, and $\Gamma$ is the gamma function"
-    )
-
-    size = size or len(data)
-
-    # Random variate
-    rvs = stats.gamma.rvs(a, loc=loc, scale=scale, size=size)
-    rvs = Distribution(
-        name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
-    )
-
-    # Probability density function
-    pdf = stats.gamma.pdf(x=x_range, a=a, loc=loc, scale=scale)
-    pdf = Distribution(
-        name=name,
-        label="Probability Density Function",
-        formula=formula,
-        params=params,
-        x=x_range,
-        y=pdf,
-    )
-
-    # Cumulative density function
-    cdf = stats.gamma.cdf(x=x_range, a=a, loc=loc, scale=scale)
-    cdf = Distribution(
-        name=name,
-        label="Cumulative Density Function",
-        params=params,
-        formula=formula,
-        x=x_range,
-        y=cdf,
-    )
+    ),
+)
+register(
+    key="logistic",
+    dist=stats.logistic,
+    name="Logistic Distribution",
+    formula=r"$ f(x) = \frac{\exp(-x)}{(1+\exp(-x))^2}$",
+)
+register(
+    key="lognorm",
+    dist=stats.lognorm,
+    name="Lognorm Distribution",
+    formula=(
+        r"$f(x, s) = \frac{1}{s x \sqrt{2\pi}}\exp\left(-\frac{\log^2(x)}{2s^2}\right)$"
+        + "\n"
+        + r"For x > 0, s > 0."
+    ),
+)
+register(
+    key="uniform",
+    dist=stats.uniform,
+    name="Uniform Distribution",
+    formula=r"$ f(x) = \frac{1}{(b-a)}$" + "for a <= x <= b",
+)
+register(
+    key="weibull",
+    dist=stats.weibull_min,
+    name="Weibull Distribution",
+    formula=r"$f(x, c) = c x^{c-1} \exp(-x^c)$" + "\n" + r"For x > 0, c > 0.",
+)
+register(
+    key="pareto",
+    dist=stats.pareto,
+    name="Pareto Distribution",
+    formula=r"$f(x, b) = \frac{b}{x^{b+1}}$" + "\n" + r"For x >= 1, b > 0.",
+)
 
-    return rvs, pdf, cdf
 
+# ------------------------------------------------------------------------------------------------ #
+#                                DISTRIBUTION DATACLASSES                                          #
+# ------------------------------------------------------------------------------------------------ #
+class Distribution(DataClass):
+    """Data from a distribution, computed on first access.
 
-def logistic(data: np.ndarray, size: int = None) -> np.ndarray:
-    """Generates random variates for the logistic distribution
+    The params, x and y members may be given as values or as functions without arguments.
+    Functions are called the first time the member is read, and their results are kept, so
+    callers pay only for the data they use.
 
     Args:
-        data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
-
-    Returns:
-        rvs: Random variate of the distribution
-        pdf: Data from the probability density function
-        cdf: Data from the cumulative distribution function
+        name (str): Name of the distribution.
+        label (str): Label for the data, e.g. 'Probability Density Function'.
+        formula (str): LaTeX formula of the distribution.
+        params (Union[str, Callable]): Description of the parameters.
+        x (Union[np.ndarray, Callable]): Values at which the function is evaluated.
+        y (Union[np.ndarray, Callable]): Random variates, or function values at x.
     """
-    loc, scale = get_params(data=data, distribution="logistic")
-    name = "Logistic Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
-    params = "loc = " + str(round(loc, 2)) + ", scale = " + str(round(scale, 2))
-    formula = r"$ f(x) = \frac{\exp(-x)}{(1+\exp(-x))^2}$"
 
-    size = size or len(data)
+    def __init__(
+        self,
+        name: str,
+        label: str,
+        formula: str,
+        params: Union[str, Callable],
+        x: Union[np.ndarray, Callable],
+        y: Union[np.ndarray, Callable],
+    ) -> None:
+        self.name = name
+        self.label = label
+        self.formula = formula
+        self._members = {"params": params, "x": x, "y": y}
 
-    # Random variate
-    rvs = stats.logistic.rvs(loc=loc, scale=scale, size=size)
-    rvs = Distribution(
-        name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
-    )
+    @property
+    def params(self) -> str:
+        """Returns the description of the parameters."""
+        return self._get("params")
 
-    # Probability density function
-    pdf = stats.logistic.pdf(x=x_range, loc=loc, scale=scale)
-    pdf = Distribution(
-        name=name,
-        label="Probability Density Function",
-        formula=formula,
-        params=params,
-        x=x_range,
-        y=pdf,
-    )
+    @property
+    def x(self) -> np.ndarray:
+        """Returns the values at which the function is evaluated."""
+        return self._get("x")
 
-    # Cumulative density function
-    cdf = stats.logistic.cdf(x=x_range, loc=loc, scale=scale)
-    cdf = Distribution(
-        name=name,
-        label="Cumulative Density Function",
-        params=params,
-        formula=formula,
-        x=x_range,
-        y=cdf,
-    )
+    @property
+    def y(self) -> np.ndarray:
+        """Returns the random variates, or the function values at x."""
+        return self._get("y")
 
-    return rvs, pdf, cdf
+    def _get(self, member: str) -> Any:
+        value = self._members[member]
+        if callable(value):
+            value = value()
+            self._members[member] = value
+        return value
 
 
-def lognorm(data: np.ndarray, size: int = None) -> np.ndarray:
-    """Generates random variates for the log normal distribution
+# ------------------------------------------------------------------------------------------------ #
+#                                   DATA GENERATORS                                                #
+# ------------------------------------------------------------------------------------------------ #
+@functools.lru_cache(maxsize=64)
+def x_grid(start: float, stop: float, num_points: int = NUM_POINTS) -> np.ndarray:
+    """Returns evenly spaced points over an interval, shared by all callers.
+
+    The array is read-only, since it is returned to every caller requesting the same grid.
+    """
+    grid = np.linspace(start, stop, num_points)
+    grid.setflags(write=False)
+    return grid
+
+
+def sample_rvs(
+    dist: stats.rv_continuous,
+    params: tuple,
+    size: int,
+    random_state: RandomState = None,
+    n_jobs: int = 1,
+    chunk_size: int = CHUNK_SIZE,
+    out: Union[np.ndarray, str] = None,
+) -> np.ndarray:
+    """Draws random variates in chunks, each from an independent random stream.
+
+    Each chunk of chunk_size variates is drawn from a Generator seeded by its own child of
+    the SeedSequence, so the variates depend on the seed and the chunk size, but not on the
+    number of jobs. Chunks are written directly into the output buffer by a pool of threads;
+    numpy's generators release the GIL while sampling, so the threads run in parallel.
 
     Args:
-        data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
+        dist (stats.rv_continuous): The scipy distribution.
+        params (tuple): Shape parameters, loc and scale.
+        size (int): Number of random variates.
+        random_state (RandomState): Seed, SeedSequence or Generator. Optional.
+        n_jobs (int): Number of threads. None uses all processors. Default = 1
+        chunk_size (int): Number of variates per chunk. Default = 1,000,000
+        out (Union[np.ndarray, str]): Preallocated float64 array of length size, or the
+            path of a .npy file to be created as a memory-mapped array. Optional.
 
     Returns:
-        rvs: Random variate of the distribution
-        pdf: Data from the probability density function
-        cdf: Data from the cumulative distribution function
+        The array of random variates; out, if provided.
     """
-    s, loc, scale = get_params(data=data, distribution="lognorm")
-    name = "Lognorm Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
-    params = (
-        "s ="
-        + str(round(s, 2))
-        + "\nloc = "
-        + str(round(loc, 2))
-        + ", scale = "
-        + str(round(scale, 2))
-    )
-    formula = (
-        r"$f(x, s) = \frac{1}{s x \sqrt{2\pi}}\exp\left(-\frac{\log^2(x)}{2s^2}\right)$"
-        + "\n"
-        + r"For x > 0, s > 0."
-    )
-
-    size = size or len(data)
-
-    # Random variate
-    rvs = stats.lognorm.rvs(s, loc=loc, scale=scale, size=size)
-    rvs = Distribution(
-        name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
-    )
-
-    # Probability density function
-    pdf = stats.lognorm.pdf(x=x_range, s=s, loc=loc, scale=scale)
-    pdf = Distribution(
-        name=name,
-        label="Probability Density Function",
-        formula=formula,
-        params=params,
-        x=x_range,
-        y=pdf,
-    )
-
-    # Cumulative density function
-    cdf = stats.lognorm.cdf(x=x_range, s=s, loc=loc, scale=scale)
-    cdf = Distribution(
-        name=name,
-        label="Cumulative Density Function",
-        params=params,
-        formula=formula,
-        x=x_range,
-        y=cdf,
-    )
-
-    return rvs, pdf, cdf
-
-
-def uniform(data: np.ndarray, size: int = None) -> np.ndarray:
-    """Generates random variates for the uniform distribution
+    if isinstance(out, str):
+        out = np.lib.format.open_memmap(out, mode="w+", dtype=np.float64, shape=(size,))
+    elif out is None:
+        out = np.empty(size, dtype=np.float64)
+    elif out.shape != (size,):
+        msg = f"out has shape {out.shape}; expected ({size},)."
+        logger.error(msg)
+        raise ValueError(msg)
+
+    starts = range(0, size, chunk_size)
+    seeds = seed_sequence(random_state).spawn(len(starts))
+
+    def fill(start: int, seed: np.random.SeedSequence) -> None:
+        chunk = out[start : start + chunk_size]
+        chunk[:] = dist.rvs(*params, size=len(chunk), random_state=np.random.default_rng(seed))
+
+    if n_jobs == 1:
+        for start, seed in zip(starts, seeds):
+            fill(start, seed)
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs or os.cpu_count()) as executor:
+            list(executor.map(fill, starts, seeds))
+
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
+
+
+def generate(
+    data: np.ndarray,
+    distribution: str,
+    size: int = None,
+    num_points: int = NUM_POINTS,
+    random_state: RandomState = None,
+    n_jobs: int = 1,
+    chunk_size: int = CHUNK_SIZE,
+    out: Union[np.ndarray, str] = None,
+) -> Tuple[Distribution, Distribution, Distribution]:
+    """Returns the random variates, pdf and cdf of a distribution fitted to the data.
+
+    The parameters are estimated when called. The random variates and the pdf and cdf,
+    evaluated over the range of the data, are computed when first read.
 
     Args:
         data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
+        distribution (str): One of the registered distributions.
+        size (int): Number of random variates. Defaults to the length of data.
+        num_points (int): Number of points at which the pdf and cdf are evaluated.
+        random_state (RandomState): Seed, SeedSequence or Generator for the random
+            variates. Optional.
+        n_jobs (int): Number of threads drawing the random variates. Default = 1
+        chunk_size (int): Number of random variates per independent stream.
+        out (Union[np.ndarray, str]): Buffer, or .npy path of a memory-mapped buffer, into
+            which the random variates are written. Optional.
 
     Returns:
         rvs: Random variate of the distribution
         pdf: Data from the probability density function
         cdf: Data from the cumulative distribution function
     """
-    loc, scale = get_params(data=data, distribution="uniform")
-    name = "Uniform Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
-    params = "loc = " + str(round(loc, 2)) + ", scale = " + str(round(scale, 2))
-    formula = r"$ f(x) = \frac{1}{(b-a)}$" + "for a <= x <= b"
-
+    family = FAMILIES[distribution]
+    dist = family.dist
+    params = get_params(data=data, distribution=distribution)
     size = size or len(data)
 
-    # Random variate
-    rvs = stats.uniform.rvs(loc=loc, scale=scale, size=size)
+    def grid() -> np.ndarray:
+        return x_grid(float(np.min(data)), float(np.max(data)), num_points)
+
+    def describe() -> str:
+        return family.describe(params)
+
     rvs = Distribution(
-        name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
+        name=family.name,
+        label=family.rvs_label,
+        formula=family.formula,
+        params=describe,
+        x=grid,
+        y=lambda: sample_rvs(
+            dist=dist,
+            params=params,
+            size=size,
+            random_state=random_state,
+            n_jobs=n_jobs,
+            chunk_size=chunk_size,
+            out=out,
+        ),
     )
-
-    # Probability density function
-    pdf = stats.uniform.pdf(x=x_range, loc=loc, scale=scale)
     pdf = Distribution(
-        name=name,
+        name=family.name,
         label="Probability Density Function",
-        formula=formula,
-        params=params,
-        x=x_range,
-        y=pdf,
+        formula=family.formula,
+        params=describe,
+        x=grid,
+        y=lambda: dist.pdf(grid(), *params),
     )
-
-    # Cumulative density function
-    cdf = stats.uniform.cdf(x=x_range, loc=loc, scale=scale)
     cdf = Distribution(
-        name=name,
+        name=family.name,
         label="Cumulative Density Function",
-        params=params,
-        formula=formula,
-        x=x_range,
-        y=cdf,
+        formula=family.formula,
+        params=describe,
+        x=grid,
+        y=lambda: dist.cdf(grid(), *params),
     )
-
     return rvs, pdf, cdf
 
 
-def weibull(data: np.ndarray, size: int = None) -> np.ndarray:
-    """Generates random variates for the uniform distribution
+def curves(
+    data: np.ndarray,
+    distributions: List[str] = None,
+    kind: str = "pdf",
+    num_points: int = NUM_POINTS,
+) -> pd.DataFrame:
+    """Evaluates the pdf or cdf of several fitted distributions on one grid.
+
+    The families are evaluated on a single shared grid spanning the range of the data;
+    families backed by the same scipy distribution are evaluated together, with their
+    parameters broadcast over the grid.
 
     Args:
         data (np.ndarray): 1D Numpy array of data from which parameters will be estimated.
+        distributions (List[str]): Registered distributions. Defaults to all.
+        kind (str): Either 'pdf' or 'cdf'. Default = 'pdf'
+        num_points (int): Number of points in the grid. Default = 5000
 
     Returns:
-        rvs: Random variate of the distribution
-        pdf: Data from the probability density function
-        cdf: Data from the cumulative distribution function
+        DataFrame indexed by the grid, with one column per distribution.
+    """
+    if kind not in ("pdf", "cdf"):
+        msg = f"kind must be 'pdf' or 'cdf', not {kind}."
+        logger.error(msg)
+        raise ValueError(msg)
+    distributions = distributions or list(FAMILIES.keys())
+    grid = x_grid(float(np.min(data)), float(np.max(data)), num_points)
+    groups = {}
+    for distribution in distributions:
+        groups.setdefault(FAMILIES[distribution].dist.name, []).append(distribution)
+
+    result = {}
+    for keys in groups.values():
+        dist = FAMILIES[keys[0]].dist
+        # One row of parameters per family, broadcast against the grid in one call.
+        params = np.array([get_params(data=data, distribution=key) for key in keys])
+        values = getattr(dist, kind)(grid[np.newaxis, :], *params.T[:, :, np.newaxis])
+        result.update(dict(zip(keys, values)))
+    return pd.DataFrame({key: result[key] for key in distributions}, index=grid)
+
+
+def get_params(data: np.ndarray, distribution: str, **kwargs) -> tuple:
+    """Obtains the distribution parameters estimated from the data.
+
+    Keyword arguments are passed to fit_params, which controls starting values,
+    subsampling and caching.
     """
-    c, loc, scale = get_params(data=data, distribution="weibull")
-
-    name = "Weibull Distribution"
-    x_range = np.linspace(min(data), max(data), NUM_POINTS)
-    params = (
-        "c ="
-        + str(round(c, 2))
-        + "\nloc = "
-        + str(round(loc, 2))
-        + ", scale = "
-        + str(round(scale, 2))
-    )
-    formula = r"$f(x, c) = c x^{c-1} \exp(-x^c)$" + "\n" + r"For x > 0, c > 0."
-    size = size or len(data)
-    # Random variate
-    rvs = stats.weibull_min.rvs(c, loc=loc, scale=scale, size=size)
-    rvs = Distribution(
-        name=name, label="Random Variate", x=x_range, y=rvs, params=params, formula=formula
-    )
-
-    # Probability density function
-    pdf = stats.weibull_min.pdf(x=x_range, c=c, loc=loc, scale=scale)
-    pdf = Distribution(
-        name=name,
-        label="Probability Density Function",
-        formula=formula,
-        params=params,
-        x=x_range,
-        y=pdf,
-    )
-
-    # Cumulative density function
-    cdf = stats.weibull_min.cdf(x=x_range, c=c, loc=loc, scale=scale)
-    cdf = Distribution(
-        name=name,
-        label="Cumulative Density Function",
-        params=params,
-        formula=formula,
-        x=x_range,
-        y=cdf,
-    )
-
-    return rvs, pdf, cdf
-
-
-def get_params(data: np.ndarray, distribution: str) -> tuple:
-    """Obtains the distribution parameters estimated from the data."""
     try:
-        return DISTRIBUTIONS[distribution].fit(data)
+        return fit_params(data=data, dist=DISTRIBUTIONS[distribution], **kwargs)
     except AttributeError as e:  # pragma: no cover
         msg = f"{distribution.capitalize()} has no fit attribute."
         logger.error(msg)
@@ -674,8 +476,8 @@ class RVSDistribution:
     """Random variates for various distributions. Parameters estimated from data.
 
     The parameters for the specified distribution will be estimated from the data provided.
-    It returns an array of data from the designated distribution, equal in length
-    to the data provided.
+    Random variates, equal in length to the data provided unless a size is given, and the pdf
+    and cdf are computed when first read.
 
     This is used by goodness of fit tests to evaluate the degree to which a distribution
     matches an hypothesized distribution.
@@ -684,20 +486,6 @@ class RVSDistribution:
         data (pd.DataFrame): Data from which distribution parameters are estimated.
     """
 
-    __DISTRIBUTIONS = {
-        "beta": beta,
-        "norm": norm,
-        "X2": chi2,
-        "exponential": exponential,
-        "f": f,
-        "gamma": gamma,
-        "logistic": logistic,
-        "lognorm": lognorm,
-        "uniform": uniform,
-        "weibull": weibull,
-        # "pareto": pareto,
-    }
-
     def __init__(self) -> None:
         self._rvs = None
         self._pdf = None
@@ -723,19 +511,50 @@ class RVSDistribution:
         """Returns the random variate"""
         return self._cdf
 
-    def __call__(self, data: np.ndarray, distribution: str, size: int = None) -> np.ndarray:
-        """Returns random values of the designated distribution
+    def __call__(
+        self,
+        data: np.ndarray,
+        distribution: str,
+        size: int = None,
+        num_points: int = NUM_POINTS,
+        random_state: RandomState = None,
+        n_jobs: int = 1,
+        chunk_size: int = CHUNK_SIZE,
+        out: Union[np.ndarray, str] = None,
+    ) -> RVSDistribution:
+        """Fits the designated distribution to the data.
+
+        The random variates, pdf and cdf are computed when first read.
 
         Args:
             data (np.ndarray): The data from which the distribution parameters are estimated
             distribution (str): One of the supported distributions. See the README.
+            size (int): Number of random variates. Defaults to the length of data.
+            num_points (int): Number of points at which the pdf and cdf are evaluated.
+                Default = 5000
+            random_state (RandomState): Seed, SeedSequence or Generator for the random
+                variates. Optional.
+            n_jobs (int): Number of threads drawing the random variates. None uses all
+                processors. Default = 1
+            chunk_size (int): Number of random variates per independent stream.
+                Default = 1,000,000
+            out (Union[np.ndarray, str]): Buffer of length size, or the path of a .npy file
+                to be created as a memory-mapped buffer, into which the random variates are
+                written. Optional.
         """
         self._data = data
         self._distribution = distribution
 
         try:
-            self._rvs, self._pdf, self._cdf = self.__DISTRIBUTIONS[distribution](
-                data=data, size=size
+            self._rvs, self._pdf, self._cdf = generate(
+                data=data,
+                distribution=distribution,
+                size=size,
+                num_points=num_points,
+                random_state=random_state,
+                n_jobs=n_jobs,
+                chunk_size=chunk_size,
+                out=out,
             )
         except KeyError as e:  # pragma: no cover
             msg = f"{distribution} is not supported.\n{e}"
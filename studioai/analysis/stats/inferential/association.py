@@ -11,13 +11,15 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Friday September 29th 2023 11:52:02 pm                                              #
-# Modified   : Thursday October 19th 2023 07:34:06 pm                                              #
+# Modified   : Monday October 19th 2026 05:28:32 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 from __future__ import annotations
 from dataclasses import dataclass
+import logging
+from typing import Tuple
 
 import pandas as pd
 import numpy as np
@@ -31,10 +33,95 @@ from studioai.analysis.stats.inferential.base import (
     StatAnalysis,
 )
 
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+
 
 # ================================================================================================ #
 #                                       KENDALL'S TAU                                              #
 # ================================================================================================ #
+# ------------------------------------------------------------------------------------------------ #
+def kendalltau_from_table(
+    table: np.ndarray, variant: str = "b", alternative: str = "two-sided"
+) -> Tuple[float, float]:
+    """Computes Kendall's tau and its p-value from a contingency table of two ordinal variables.
+
+    Rows and columns of the table must be in the order of the levels of the two variables.
+    Concordant and discordant pairs are counted from cumulative sums of the table, so the
+    cost is O(rc) in the number of levels, rather than O(n log n) in the number of
+    observations. The statistic and the asymptotic, tie-corrected p-value are those of
+    scipy.stats.kendalltau.
+
+    Args:
+        table (np.ndarray): Counts of observations for each combination of levels.
+        variant (str): Either 'b' or 'c'. Default = 'b'
+        alternative (str): One of 'two-sided', 'less' or 'greater'. Default = 'two-sided'
+    """
+    table = np.asarray(table, dtype=np.int64)
+    rows, cols = table.shape
+    n = table.sum()
+
+    # Observations in strictly later rows and columns (concordant), and in strictly later
+    # rows and earlier columns (discordant), of each cell.
+    later = np.zeros((rows + 1, cols + 2), dtype=np.int64)
+    later[:rows, 1 : cols + 1] = table[::-1, ::-1].cumsum(axis=0).cumsum(axis=1)[::-1, ::-1]
+    earlier = np.zeros((rows + 1, cols + 2), dtype=np.int64)
+    earlier[:rows, 1 : cols + 1] = table[::-1, :].cumsum(axis=0)[::-1, :].cumsum(axis=1)
+    concordant = (table * later[1:, 2:]).sum()
+    discordant = (table * earlier[1:, :cols]).sum()
+    con_minus_dis = float(concordant - discordant)
+
+    def ties(counts: np.ndarray) -> Tuple[float, float, float]:
+        t = counts[counts > 1].astype(np.float64)
+        return (
+            (t * (t - 1) / 2).sum(),
+            (t * (t - 1) * (t - 2)).sum(),
+            (t * (t - 1) * (2 * t + 5)).sum(),
+        )
+
+    xtie, x0, x1 = ties(table.sum(axis=1))
+    ytie, y0, y1 = ties(table.sum(axis=0))
+    total = n * (n - 1) / 2
+    if xtie == total or ytie == total:
+        return np.nan, np.nan
+
+    if variant == "b":
+        tau = con_minus_dis / np.sqrt(total - xtie) / np.sqrt(total - ytie)
+    elif variant == "c":
+        levels = min(rows, cols)
+        tau = 2 * con_minus_dis / (n**2 * (levels - 1) / levels)
+    else:
+        msg = f"Unknown variant of Kendall's tau: {variant}. Use 'b' or 'c'."
+        logger.error(msg)
+        raise ValueError(msg)
+    tau = float(np.clip(tau, -1.0, 1.0))
+
+    m = n * (n - 1.0)
+    var = (m * (2 * n + 5) - x1 - y1) / 18 + (2 * xtie * ytie) / m + x0 * y0 / (9 * m * (n - 2))
+    z = con_minus_dis / np.sqrt(var)
+    if alternative == "greater":
+        pvalue = stats.norm.sf(z)
+    elif alternative == "less":
+        pvalue = stats.norm.cdf(z)
+    else:
+        pvalue = 2 * stats.norm.sf(np.abs(z))
+    return tau, float(pvalue)
+
+
+# ------------------------------------------------------------------------------------------------ #
+def kendalltau_interval(tau: float, n: int, confidence_level: float = 0.95) -> Tuple[float, float]:
+    """Returns a confidence interval for Kendall's tau.
+
+    The interval is formed on the Fisher z-transformed statistic with the standard error
+    sqrt(0.437 / (n - 4)) of Fieller, Hartley and Pearson (1957).
+    """
+    if n <= 4 or np.isnan(tau):
+        return np.nan, np.nan
+    z = np.arctanh(np.clip(tau, -0.999999, 0.999999))
+    half = stats.norm.ppf(0.5 + confidence_level / 2) * np.sqrt(0.437 / (n - 4))
+    return float(np.tanh(z - half)), float(np.tanh(z + half))
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                                 KENDALL'S TAU MEASURE OF CORRELATION                             #
 # ------------------------------------------------------------------------------------------------ #
@@ -47,6 +134,11 @@ class KendallsTau(StatTestResult):
     n: int = None
     strength: str = None
     pvalue: float = None
+    method: str = None
+    variant: str = None
+    lower: float = None
+    upper: float = None
+    confidence_level: float = None
     visualizer: Visualizer = None
 
     @inject
@@ -73,14 +165,38 @@ class KendallsTau(StatTestResult):
 class KendallsTauAnalysis(StatAnalysis):
     """Kendall's Tau Measures the degree of correlation between two ordinal variables.
 
+    Three methods are available:
+    - 'contingency': Exact. Ties and concordance are computed from the contingency table of
+        the two variables, in O(k\u00b2) of the number of levels after one counting pass. The
+        result holds the contingency table as its data.
+    - 'exact': scipy.stats.kendalltau on the full columns.
+    - 'sample': Approximate. The statistic is computed on a uniform random sample of
+        sample_size observations. Use for large continuous data.
+    The default, 'auto', uses the contingency table when the variables have at most
+    max_cells combinations of levels, and the full columns otherwise. Observations missing
+    either variable are excluded. Levels of ordered categoricals are ranked in category
+    order; other values are ranked by sorting.
+
+    Each result carries a confidence interval for tau, which for sampled results bounds the
+    population value given the sample.
+
     Args:
         data (pd.DataFrame): The DataFrame containing the variables of interest.
         a (str): The name of an ordinal variable in data.
         b (str): The name of an ordinal variable in data.
+        variant (str): Either 'b' or 'c'. Default = 'c'
+        alternative (str): One of 'two-sided', 'less' or 'greater'. Default = 'two-sided'
+        method (str): One of 'auto', 'contingency', 'exact' or 'sample'. Default = 'auto'
+        max_cells (int): Largest contingency table used by the 'auto' method. Default = 250,000
+        sample_size (int): Number of observations sampled by the 'sample' method.
+            Default = 100,000
+        confidence_level (float): Confidence level of the interval for tau. Default = 0.95
+        random_state (int): Seed for the 'sample' method. Optional.
 
     """
 
     __id = "kendallstau"
+    __methods = ["auto", "contingency", "exact", "sample"]
 
     @inject
     def __init__(
@@ -90,13 +206,27 @@ class KendallsTauAnalysis(StatAnalysis):
         b: str = None,
         variant: str = "c",
         alternative: str = "two-sided",
+        method: str = "auto",
+        max_cells: int = 250000,
+        sample_size: int = 100000,
+        confidence_level: float = 0.95,
+        random_state: int = None,
     ) -> None:
         super().__init__()
+        if method not in self.__methods:
+            msg = f"Method must be one of {self.__methods}, not {method}."
+            logger.error(msg)
+            raise ValueError(msg)
         self._data = data
         self._a = a
         self._b = b
         self._variant = variant
         self._alternative = alternative
+        self._method = method
+        self._max_cells = max_cells
+        self._sample_size = sample_size
+        self._confidence_level = confidence_level
+        self._random_state = random_state
         self._thresholds = np.array([-1, -0.5, -0.3, 0.0, 0.3, 0.5, 1.0])
         self._labels = [
             "Strong",
@@ -115,26 +245,66 @@ class KendallsTauAnalysis(StatAnalysis):
     def run(self) -> None:
         """Performs the statistical test and creates a result object."""
 
-        a = self._data[self._a].values
-        b = self._data[self._b].values
-
-        statistic, pvalue = stats.kendalltau(
-            x=a, y=b, variant=self._variant, alternative=self._alternative
-        )
+        data = self._data[[self._a, self._b]].dropna()
+        method = self._method
+        if method == "sample" and len(data) > self._sample_size:
+            rng = np.random.default_rng(self._random_state)
+            data = data.iloc[np.sort(rng.choice(len(data), self._sample_size, replace=False))]
+        elif method == "sample":
+            method = "exact"
+
+        codes_a, levels_a = self._factorize(data[self._a])
+        codes_b, levels_b = self._factorize(data[self._b])
+
+        table = None
+        if method == "contingency" or (
+            method == "auto" and len(levels_a) * len(levels_b) <= self._max_cells
+        ):
+            method = "contingency"
+            counts = np.bincount(
+                codes_a * len(levels_b) + codes_b, minlength=len(levels_a) * len(levels_b)
+            )
+            table = counts.reshape(len(levels_a), len(levels_b))
+            statistic, pvalue = kendalltau_from_table(
+                table=table, variant=self._variant, alternative=self._alternative
+            )
+            table = pd.DataFrame(table, index=levels_a, columns=levels_b)
+            table.index.name, table.columns.name = self._a, self._b
+        else:
+            method = "exact" if method == "auto" else method
+            statistic, pvalue = stats.kendalltau(
+                x=codes_a, y=codes_b, variant=self._variant, alternative=self._alternative
+            )
 
         strength = self._labels[np.argmax(np.where(self._thresholds < statistic))]
+        lower, upper = kendalltau_interval(
+            tau=statistic, n=len(data), confidence_level=self._confidence_level
+        )
 
         # Create the result object.
         self._result = KendallsTau(
-            data=self._data,
+            data=table,
             a=self._a,
             b=self._b,
-            n=len(a),
-            value=statistic,
+            n=len(data),
+            value=float(statistic),
             strength=strength,
-            pvalue=pvalue,
+            pvalue=float(pvalue),
+            method=method,
+            variant=self._variant,
+            lower=lower,
+            upper=upper,
+            confidence_level=self._confidence_level,
         )
 
+    def _factorize(self, x: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+        """Returns the rank codes and ordered levels of a variable."""
+        if isinstance(x.dtype, pd.CategoricalDtype) and x.cat.ordered:
+            x = x.cat.remove_unused_categories()
+            return x.cat.codes.to_numpy().astype(np.int64), x.cat.categories
+        codes, levels = pd.factorize(x, sort=True)
+        return codes.astype(np.int64), levels
+
 
 # ================================================================================================ #
 #                                         CRAMER'S V                                               #
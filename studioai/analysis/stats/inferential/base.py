@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Tuesday August 22nd 2023 07:44:59 pm                                                #
-# Modified   : Thursday October 19th 2023 08:01:04 pm                                              #
+# Modified   : Monday October 19th 2026 06:39:43 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
@@ -51,9 +51,9 @@ class StatTestResult(DataClass):
     def report(self) -> str:
         """Reports results in APA Style"""
 
-    def _report_alpha(self) -> str:
+    def _report_alpha(self, end: str = ".") -> str:
         a = int(self.alpha * 100)
-        return f"significant at {a}%."
+        return f"significant at {a}%{end}"
 
     def _report_pvalue(self, pvalue: float) -> str:  # pragma: no cover
         """Rounds the pvalue in accordance with the APA Style Guide 7th Edition"""
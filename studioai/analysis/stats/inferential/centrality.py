@@ -11,14 +11,18 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Wednesday June 7th 2023 11:41:00 pm                                                 #
-# Modified   : Thursday October 19th 2023 07:34:06 pm                                              #
+# Modified   : Monday October 19th 2026 06:39:43 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
+from __future__ import annotations
 from dataclasses import dataclass
+import logging
+from typing import List, Sequence, Tuple, Union
 
 import numpy as np
+import pandas as pd
 from scipy import stats
 from dependency_injector.wiring import inject, Provide
 
@@ -30,7 +34,56 @@ from studioai.analysis.stats.inferential.base import (
     StatisticalTest,
 )
 
-from studioai.analysis.stats.descriptive.continuous import ContinuousStats
+from studioai.analysis.stats.inferential.multitest import CORRECTIONS, adjust_pvalues
+from studioai.analysis.stats.descriptive.continuous import SufficientStats
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------------------------------------------------------ #
+def ttest_from_stats(
+    n_a: np.ndarray,
+    mean_a: np.ndarray,
+    var_a: np.ndarray,
+    n_b: np.ndarray,
+    mean_b: np.ndarray,
+    var_b: np.ndarray,
+    homoscedastic: bool = True,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Computes two sample t-tests from the counts, means and variances of the samples.
+
+    Arguments may be scalars or arrays, in which case one test is computed per element.
+    Variances are sample variances (ddof=1). Tests with fewer than two observations in a
+    sample, or zero variance in both, yield missing values.
+
+    Args:
+        n_a, mean_a, var_a: Count, mean and variance of the first sample(s).
+        n_b, mean_b, var_b: Count, mean and variance of the second sample(s).
+        homoscedastic (bool): If True, Student's t-test with the pooled variance. Otherwise,
+            Welch's t-test with Welch-Satterthwaite degrees of freedom.
+
+    Returns:
+        Tuple of the t statistics, degrees of freedom and two-sided p-values.
+    """
+    n_a, mean_a, var_a, n_b, mean_b, var_b = (
+        np.asarray(v, dtype=float) for v in (n_a, mean_a, var_a, n_b, mean_b, var_b)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if homoscedastic:
+            dof = n_a + n_b - 2
+            pooled = ((n_a - 1) * var_a + (n_b - 1) * var_b) / dof
+            se = np.sqrt(pooled * (1 / n_a + 1 / n_b))
+        else:
+            se_a, se_b = var_a / n_a, var_b / n_b
+            se = np.sqrt(se_a + se_b)
+            dof = (se_a + se_b) ** 2 / (se_a**2 / (n_a - 1) + se_b**2 / (n_b - 1))
+        statistic = (mean_a - mean_b) / se
+        invalid = (n_a < 2) | (n_b < 2) | (se == 0)
+        statistic = np.where(invalid, np.nan, statistic)
+        dof = np.where(invalid, np.nan, dof)
+        pvalue = 2 * stats.t.sf(np.abs(statistic), dof)
+    return statistic, dof, pvalue
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -39,15 +92,15 @@ from studioai.analysis.stats.descriptive.continuous import ContinuousStats
 @dataclass
 class TTestResult(StatTestResult):
     name: str = "Student's t-test"
-    dof: int = None
+    dof: float = None
     homoscedastic: bool = None
     a: np.ndarray = None
     a_name: str = None
     b: np.ndarray = None
     b_name: str = None
     varname: str = None
-    a_stats: ContinuousStats = None
-    b_stats: ContinuousStats = None
+    a_stats: SufficientStats = None
+    b_stats: SufficientStats = None
 
     @inject
     def __post_init__(self, visualizer: Visualizer = Provide[AnalysisContainer.visualizer]) -> None:
@@ -58,7 +111,7 @@ class TTestResult(StatTestResult):
         self.visualizer.ttestplot(statistic=self.value, dof=self.dof, alpha=self.alpha, title=title)
 
     def report(self) -> str:
-        return f"{self.name}\na: (N = {self.a_stats.count}, M = {round(self.a_stats.mean,2)}, SD = {round(self.a_stats.std,2)})\nb: (N = {self.b_stats.count}, M = {round(self.b_stats.mean,2)}, SD = {round(self.b_stats.std,2)})\nt({self.dof}) = {round(self.value,2)}, {self._report_pvalue(self.pvalue)} {self._report_alpha()}"
+        return f"{self.name}\na: (N = {self.a_stats.count}, M = {round(self.a_stats.mean,2)}, SD = {round(self.a_stats.std,2)})\nb: (N = {self.b_stats.count}, M = {round(self.b_stats.mean,2)}, SD = {round(self.b_stats.std,2)})\nt({round(self.dof, 2):g}) = {round(self.value,2)}, {self._report_pvalue(self.pvalue)} {self._report_alpha()}"
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -70,6 +123,11 @@ class TTest(StatisticalTest):
     This is a test for the null hypothesis that 2 independent samples have identical average
     (expected) values. This test assumes that the populations have identical variances by default.
 
+    The count, mean and sum of squared deviations of each sample are computed once, and both
+    the test and the reported statistics are derived from them. Alternatively, these
+    sufficient statistics may be provided directly, e.g. from a summary table, in which case
+    no raw data are required. Missing values are excluded from the samples.
+
     Args:
         a: (np.ndarray): An array containing the first of two independent samples.
         b: (np.ndarray): An array containing the second of two independent samples.
@@ -77,6 +135,8 @@ class TTest(StatisticalTest):
         homoscedastic (bool): If True, perform a standard independent 2 sample test t
             hat assumes equal population variances. If False, perform Welch’s
             t-test, which does not assume equal population variance.
+        a_stats (SufficientStats): Sufficient statistics of the first sample. Used if a is None.
+        b_stats (SufficientStats): Sufficient statistics of the second sample. Used if b is None.
 
     """
 
@@ -84,15 +144,23 @@ class TTest(StatisticalTest):
 
     def __init__(
         self,
-        a: np.ndarray,
-        b: np.ndarray,
+        a: np.ndarray = None,
+        b: np.ndarray = None,
         varname: str = None,
         alpha: float = 0.05,
         homoscedastic: bool = True,
+        a_stats: SufficientStats = None,
+        b_stats: SufficientStats = None,
     ) -> None:
         super().__init__()
+        if (a is None and a_stats is None) or (b is None and b_stats is None):
+            msg = "Each sample must be provided as data or as sufficient statistics."
+            logger.error(msg)
+            raise ValueError(msg)
         self._a = a
         self._b = b
+        self._a_stats = a_stats
+        self._b_stats = b_stats
         self._varname = varname
         self._alpha = alpha
         self._homoscedastic = homoscedastic
@@ -112,12 +180,18 @@ class TTest(StatisticalTest):
     def run(self) -> None:
         """Executes the TTest."""
 
-        statistic, pvalue = stats.ttest_ind(a=self._a, b=self._b, equal_var=self._homoscedastic)
-
-        a_stats = ContinuousStats.describe(x=self._a)
-        b_stats = ContinuousStats.describe(x=self._b)
+        a_stats = SufficientStats.describe(x=self._a) if self._a is not None else self._a_stats
+        b_stats = SufficientStats.describe(x=self._b) if self._b is not None else self._b_stats
 
-        dof = len(self._a) + len(self._b) - 2
+        statistic, dof, pvalue = ttest_from_stats(
+            n_a=a_stats.count,
+            mean_a=a_stats.mean,
+            var_a=a_stats.var,
+            n_b=b_stats.count,
+            mean_b=b_stats.mean,
+            var_b=b_stats.var,
+            homoscedastic=self._homoscedastic,
+        )
 
         # Create the result object.
         self._result = TTestResult(
@@ -126,12 +200,178 @@ class TTest(StatisticalTest):
             hypothesis=self._profile.hypothesis,
             homoscedastic=self._homoscedastic,
             varname=self._varname,
-            dof=dof,
-            value=np.abs(statistic),
+            name="Student's t-test" if self._homoscedastic else "Welch's t-test",
+            dof=float(dof),
+            value=float(np.abs(statistic)),
             alpha=self._alpha,
-            pvalue=pvalue,
+            pvalue=float(pvalue),
             a=self._a,
             b=self._b,
             a_stats=a_stats,
             b_stats=b_stats,
         )
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                   GROUPED TEST RESULT                                            #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class GroupedTTestResult(StatTestResult):
+    name: str = "Student's t-test"
+    homoscedastic: bool = None
+    correction: str = None
+    group: str = None
+    a_name: str = None
+    b_name: str = None
+    table: pd.DataFrame = None
+
+    @property
+    def significant(self) -> pd.DataFrame:
+        """Returns the tests significant at alpha, after correction."""
+        return self.table.loc[self.table["significant"]]
+
+    def report(self) -> str:
+        correction = CORRECTIONS[self.correction] if self.correction else "no"
+        return (
+            f"{self.name}s of {self.a_name} vs {self.b_name} by {self.group}: "
+            f"{int(self.table['significant'].sum())} of {len(self.table)} tests "
+            f"{self._report_alpha(end='')} with {correction} correction."
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       GROUPED TEST                                               #
+# ------------------------------------------------------------------------------------------------ #
+class GroupedTTest(StatisticalTest):
+    """Two sample t-tests of many variables within many segments, computed together.
+
+    Counts, means and variances of every variable, by segment and group, are obtained in a
+    single grouped aggregation. The t statistics and p-values of all tests are then derived
+    from those summaries at once, and adjusted for multiple comparisons.
+
+    Args:
+        data (pd.DataFrame): The data containing the variables, group and segments.
+        value_cols (Union[str, List[str]]): The numeric variables to be tested.
+        group_col (str): The variable defining the two groups compared.
+        segment_cols (Union[str, List[str]]): Variables defining segments, within each of which
+            the groups are compared. Optional.
+        groups (Sequence[str]): The levels of group_col designating samples a and b. Required
+            if group_col has more than two levels. Defaults to its two levels in sorted order.
+        alpha (float): The level of statistical significance for inference.
+        homoscedastic (bool): If True, Student's t-tests. Otherwise, Welch's t-tests.
+        correction (str): Multiple testing correction applied across all tests. One of
+            'holm', 'bh', 'bonferroni', or None. Default = 'holm'
+    """
+
+    __id = "t2"
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        value_cols: Union[str, List[str]],
+        group_col: str,
+        segment_cols: Union[str, List[str]] = None,
+        groups: Sequence[str] = None,
+        alpha: float = 0.05,
+        homoscedastic: bool = True,
+        correction: str = "holm",
+    ) -> None:
+        super().__init__()
+        self._data = data
+        self._value_cols = [value_cols] if isinstance(value_cols, str) else list(value_cols)
+        self._group_col = group_col
+        self._segment_cols = (
+            [segment_cols] if isinstance(segment_cols, str) else list(segment_cols or [])
+        )
+        self._groups = groups
+        self._alpha = alpha
+        self._homoscedastic = homoscedastic
+        self._correction = correction
+        self._profile = StatTestProfile.create(self.__id)
+        self._result = None
+
+    @property
+    def profile(self) -> StatTestProfile:
+        """Returns the statistical test profile."""
+        return self._profile
+
+    @property
+    def result(self) -> GroupedTTestResult:
+        """Returns a Statistical Test Result object."""
+        return self._result
+
+    def run(self) -> None:
+        """Executes the t-tests."""
+        a, b = self._get_groups()
+        data = self._data.loc[self._data[self._group_col].isin([a, b])]
+
+        # One grouped aggregation for every variable, segment and group.
+        keys = self._segment_cols + [self._group_col]
+        agg = data.groupby(by=keys, observed=True, sort=True)[self._value_cols].agg(
+            ["count", "mean", "var"]
+        )
+        # Reshape to one row per segment and variable, with a column per statistic and group.
+        agg = pd.concat({v: agg[v] for v in self._value_cols}, names=["variable"])
+        agg = agg.unstack(level=self._group_col)
+        if self._segment_cols:
+            agg = agg.reorder_levels(self._segment_cols + ["variable"]).sort_index()
+
+        def side(stat: str, group: str) -> np.ndarray:
+            return agg[(stat, group)].to_numpy() if (stat, group) in agg else np.nan
+
+        n_a, n_b = np.nan_to_num(side("count", a)), np.nan_to_num(side("count", b))
+        mean_a, mean_b = side("mean", a), side("mean", b)
+        var_a, var_b = side("var", a), side("var", b)
+        statistic, dof, pvalue = ttest_from_stats(
+            n_a=n_a,
+            mean_a=mean_a,
+            var_a=var_a,
+            n_b=n_b,
+            mean_b=mean_b,
+            var_b=var_b,
+            homoscedastic=self._homoscedastic,
+        )
+        pvalue_adj = adjust_pvalues(pvalues=pvalue, method=self._correction)
+
+        table = agg.index.to_frame(index=False)
+        table["n_a"] = n_a.astype(int)
+        table["mean_a"] = mean_a
+        table["std_a"] = np.sqrt(var_a)
+        table["n_b"] = n_b.astype(int)
+        table["mean_b"] = mean_b
+        table["std_b"] = np.sqrt(var_b)
+        table["difference"] = mean_a - mean_b
+        table["t"] = statistic
+        table["dof"] = dof
+        table["pvalue"] = pvalue
+        table["pvalue_adj"] = pvalue_adj
+        table["significant"] = pvalue_adj < self._alpha
+
+        self._result = GroupedTTestResult(
+            name="Student's t-test" if self._homoscedastic else "Welch's t-test",
+            H0=self._profile.H0,
+            statistic=self._profile.statistic,
+            hypothesis=self._profile.hypothesis,
+            homoscedastic=self._homoscedastic,
+            correction=self._correction,
+            alpha=self._alpha,
+            group=self._group_col,
+            a_name=str(a),
+            b_name=str(b),
+            table=table,
+        )
+
+    def _get_groups(self) -> tuple:
+        """Returns the levels of the group variable designating samples a and b."""
+        if self._groups is not None:
+            groups = tuple(self._groups)
+        else:
+            groups = tuple(sorted(self._data[self._group_col].dropna().unique()))
+        if len(groups) != 2:
+            msg = (
+                f"The group variable {self._group_col} must designate two groups, not "
+                f"{len(groups)}. Specify the two levels to compare with the groups parameter."
+            )
+            logger.error(msg)
+            raise ValueError(msg)
+        return groups
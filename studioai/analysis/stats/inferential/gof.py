@@ -11,15 +11,19 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Tuesday June 6th 2023 01:45:05 am                                                   #
-# Modified   : Thursday October 19th 2023 07:34:06 pm                                              #
+# Modified   : Monday October 19th 2026 06:35:40 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
+from __future__ import annotations
 from dataclasses import dataclass
-from typing import Union
+import logging
+import os
+from typing import Callable, Dict, Iterable, List, Union
 
 import numpy as np
+import pandas as pd
 from scipy import stats
 from dependency_injector.wiring import inject, Provide
 
@@ -30,6 +34,12 @@ from studioai.analysis.stats.inferential.base import (
     StatTestResult,
     StatisticalTest,
 )
+from studioai.analysis.stats.inferential.multitest import adjust_pvalues
+from studioai import DataClass
+from studioai.util.io import IOService
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -41,7 +51,7 @@ class KSTestResult(StatTestResult):
 
     name: str = "Kolmogorov-Smirnov Test"
     a: np.ndarray = None
-    b: Union[np.ndarray, str] = None
+    b: Union[np.ndarray, str, ReferenceECDF] = None
     n: int = None
     advisory: str = None
 
@@ -72,9 +82,9 @@ class KSTest(StatisticalTest):
 
     Args:
         a (np.ndarray): 1D Numpy array of data to be tested.
-        b (Union[str, np.ndarray]): A 1-D array, or a string containing the name of the
-            reference distribution from the scipy list of Continuous Distributions
-            at https://docs.scipy.org/doc/scipy/reference/stats.html
+        b (Union[str, np.ndarray, ReferenceECDF]): A 1-D array, a pre-sorted ReferenceECDF,
+            or a string containing the name of the reference distribution from the scipy list
+            of Continuous Distributions at https://docs.scipy.org/doc/scipy/reference/stats.html
         a_name (str): The name of the sample distribution. Optional.
         b_name (str): The name of the sample 2 distribution, if two-sample test. Optional.
 
@@ -85,7 +95,7 @@ class KSTest(StatisticalTest):
     def __init__(
         self,
         a: np.ndarray,
-        b: Union[str, np.ndarray],
+        b: Union[str, np.ndarray, ReferenceECDF],
         alpha: float = 0.05,
     ) -> None:
         super().__init__()
@@ -112,7 +122,10 @@ class KSTest(StatisticalTest):
 
         # Conduct the two-sided ks test
         try:
-            result = stats.kstest(rvs=self._a, cdf=self._b, alternative="two-sided")
+            if isinstance(self._b, ReferenceECDF):
+                result = StreamingECDF(reference=self._b).update(self._a)
+            else:
+                result = stats.kstest(rvs=self._a, cdf=self._b, alternative="two-sided")
         except (
             AttributeError
         ) as e:  # pragma: no cover - actually pytest-coverage not picking this up.
@@ -139,3 +152,283 @@ class KSTest(StatisticalTest):
             advisory=advisory,
             alpha=self._alpha,
         )
+
+
+# ================================================================================================ #
+#                                        KS ENGINE                                                 #
+# ================================================================================================ #
+@dataclass
+class ReferenceECDF(DataClass):
+    """Empirical distribution of a reference sample, sorted once and stored compactly.
+
+    Args:
+        name (str): Name of the variable.
+        support (np.ndarray): The distinct values of the sample, in ascending order.
+        counts (np.ndarray): The number of observations of each distinct value.
+    """
+
+    name: str = None
+    support: np.ndarray = None
+    counts: np.ndarray = None
+
+    @property
+    def n(self) -> int:
+        """Returns the size of the reference sample."""
+        return int(self.counts.sum())
+
+    @property
+    def cdf(self) -> np.ndarray:
+        """Returns the ECDF of the reference sample at each support value."""
+        return np.cumsum(self.counts) / self.n
+
+    @classmethod
+    def from_sample(cls, x: Union[np.ndarray, pd.Series], name: str = None) -> ReferenceECDF:
+        """Creates the reference ECDF of the non-null values of a sample."""
+        x = np.asarray(x, dtype=np.float64)
+        support, counts = np.unique(x[~np.isnan(x)], return_counts=True)
+        return cls(name=name, support=support, counts=counts)
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class KSResult(DataClass):
+    """Two sample KS statistic and asymptotic p-value."""
+
+    statistic: float = None
+    pvalue: float = None
+
+
+# ------------------------------------------------------------------------------------------------ #
+class StreamingECDF:
+    """ECDF of a sample, accumulated incrementally on the support of a reference ECDF.
+
+    Only the number of observations falling at, and strictly between, the reference support
+    values are kept, so memory is proportional to the support of the reference, not to the
+    size of the sample. The two sample KS statistic computed from these counts is exact:
+    between consecutive reference values the reference ECDF is constant, so the largest
+    distance on each interval is attained at one of its ends.
+
+    Args:
+        reference (ReferenceECDF): The reference distribution.
+    """
+
+    def __init__(self, reference: ReferenceECDF) -> None:
+        self._reference = reference
+        size = len(reference.support) + 1
+        self._below = np.zeros(size, dtype=np.int64)  # counts by number of support values < x
+        self._at_or_below = np.zeros(size, dtype=np.int64)  # counts by number <= x
+        self._n = 0
+
+    @property
+    def n(self) -> int:
+        """Returns the number of observations accumulated."""
+        return self._n
+
+    @property
+    def statistic(self) -> float:
+        """Returns the KS statistic: the largest distance between the two ECDFs."""
+        if self._n == 0:
+            return np.nan
+        size = len(self._reference.support)
+        cdf = self._reference.cdf
+        # Sample ECDF at, and just below, each reference value.
+        at = np.cumsum(self._below)[:size] / self._n
+        below = np.cumsum(self._at_or_below)[:size] / self._n
+        # Just below each value, the reference ECDF takes its value at the previous one.
+        previous = np.concatenate([[0.0], cdf[:-1]])
+        return float(max(np.abs(cdf - at).max(), np.abs(previous - below).max()))
+
+    @property
+    def pvalue(self) -> float:
+        """Returns the asymptotic two-sided p-value of the KS statistic."""
+        n, m = self._reference.n, self._n
+        if m == 0:
+            return np.nan
+        return float(stats.kstwo.sf(self.statistic, np.round(n * m / (n + m))))
+
+    def update(self, x: Union[np.ndarray, pd.Series]) -> StreamingECDF:
+        """Adds the non-null values of x to the sample."""
+        x = np.asarray(x, dtype=np.float64)
+        x = x[~np.isnan(x)]
+        support = self._reference.support
+        size = len(support) + 1
+        self._below += np.bincount(np.searchsorted(support, x, side="left"), minlength=size)
+        self._at_or_below += np.bincount(np.searchsorted(support, x, side="right"), minlength=size)
+        self._n += len(x)
+        return self
+
+    def result(self) -> KSResult:
+        """Returns the KS statistic and its p-value."""
+        return KSResult(statistic=self.statistic, pvalue=self.pvalue)
+
+
+# ------------------------------------------------------------------------------------------------ #
+class KSEngine:
+    """Two sample KS tests of many variables against stored reference distributions.
+
+    Reference samples are sorted once, when the engine is fitted, and can be saved and
+    loaded with the IOService. Each comparison then needs only binary searches of the new
+    data in the sorted references.
+
+    Args:
+        references (Dict[str, ReferenceECDF]): Reference ECDFs by variable name.
+    """
+
+    def __init__(self, references: Dict[str, ReferenceECDF]) -> None:
+        self._references = references
+
+    @property
+    def references(self) -> Dict[str, ReferenceECDF]:
+        """Returns the reference ECDFs by variable name."""
+        return self._references
+
+    @classmethod
+    def fit(cls, data: pd.DataFrame, columns: List[str] = None) -> KSEngine:
+        """Creates an engine from reference data.
+
+        Args:
+            data (pd.DataFrame): The reference data.
+            columns (List[str]): Numeric variables to be monitored. Defaults to all numeric
+                variables in data.
+        """
+        columns = columns or list(data.select_dtypes(include=np.number).columns)
+        return cls(
+            references={col: ReferenceECDF.from_sample(x=data[col], name=col) for col in columns}
+        )
+
+    def save(self, filepath: str) -> None:
+        """Persists the reference ECDFs with the IOService.
+
+        Tabular formats such as parquet or csv store one row per variable and support value.
+        Other formats, e.g. pickle, store the ECDF objects.
+        """
+        if os.path.splitext(filepath)[1] in (".parquet", ".csv"):
+            data = pd.concat(
+                [
+                    pd.DataFrame({"variable": name, "value": ref.support, "count": ref.counts})
+                    for name, ref in self._references.items()
+                ],
+                ignore_index=True,
+            )
+        else:
+            data = self._references
+        IOService.write(filepath=filepath, data=data)
+
+    @classmethod
+    def load(cls, filepath: str) -> KSEngine:
+        """Loads reference ECDFs persisted with save."""
+        data = IOService.read(filepath)
+        if isinstance(data, pd.DataFrame):
+            data = {
+                name: ReferenceECDF(
+                    name=name,
+                    support=group["value"].to_numpy(dtype=np.float64),
+                    counts=group["count"].to_numpy(dtype=np.int64),
+                )
+                for name, group in data.groupby("variable", sort=False)
+            }
+        return cls(references=data)
+
+    def stream(self) -> KSStream:
+        """Returns an accumulator for a window of data, to be fed in chunks."""
+        return KSStream(engine=self)
+
+    def compare(
+        self, data: pd.DataFrame, alpha: float = 0.05, correction: str = None
+    ) -> pd.DataFrame:
+        """Tests each reference variable in data against its reference distribution.
+
+        Args:
+            data (pd.DataFrame): The current data.
+            alpha (float): The level of statistical significance for inference.
+            correction (str): Multiple testing correction across variables. One of 'holm',
+                'bh', 'bonferroni', or None. Default = None
+        """
+        return self.stream().update(data).result(alpha=alpha, correction=correction)
+
+
+# ------------------------------------------------------------------------------------------------ #
+class KSStream:
+    """Accumulates a window of data, chunk by chunk, for testing against a KSEngine.
+
+    Args:
+        engine (KSEngine): The engine holding the reference distributions.
+    """
+
+    def __init__(self, engine: KSEngine) -> None:
+        self._ecdfs = {name: StreamingECDF(ref) for name, ref in engine.references.items()}
+
+    def update(self, data: pd.DataFrame) -> KSStream:
+        """Adds a chunk of data to the window. Variables absent from the chunk are skipped."""
+        if not isinstance(data, pd.DataFrame):
+            msg = f"KSStream expects a DataFrame chunk, not {type(data).__name__}."
+            logger.error(msg)
+            raise TypeError(msg)
+        for name, ecdf in self._ecdfs.items():
+            if name in data:
+                ecdf.update(data[name])
+        return self
+
+    def result(self, alpha: float = 0.05, correction: str = None) -> pd.DataFrame:
+        """Returns the KS statistic and p-value of each variable.
+
+        Args:
+            alpha (float): The level of statistical significance for inference.
+            correction (str): Multiple testing correction across variables. One of 'holm',
+                'bh', 'bonferroni', or None. Default = None
+        """
+        result = pd.DataFrame(
+            [
+                {
+                    "variable": name,
+                    "n_reference": ecdf._reference.n,
+                    "n": ecdf.n,
+                    "statistic": ecdf.statistic,
+                    "pvalue": ecdf.pvalue,
+                }
+                for name, ecdf in self._ecdfs.items()
+            ]
+        )
+        result["pvalue_adj"] = adjust_pvalues(result["pvalue"].to_numpy(), method=correction)
+        result["significant"] = result["pvalue_adj"] < alpha
+        return result
+
+
+# ------------------------------------------------------------------------------------------------ #
+def kstest_many(
+    data: pd.DataFrame,
+    cdf: Union[str, Callable],
+    args: Iterable = (),
+    columns: List[str] = None,
+) -> pd.DataFrame:
+    """One sample two-sided KS tests of many variables against one distribution.
+
+    Each variable is sorted once, and its statistic is computed from the distribution's CDF
+    at the sorted values. P-values come from the exact Kolmogorov distribution.
+
+    Args:
+        data (pd.DataFrame): The data to be tested.
+        cdf (Union[str, Callable]): A scipy continuous distribution name, or a CDF function.
+        args (Iterable): Distribution parameters. Optional.
+        columns (List[str]): Variables to test. Defaults to all numeric variables in data.
+    """
+    if isinstance(cdf, str):
+        cdf = getattr(stats, cdf).cdf
+    columns = columns or list(data.select_dtypes(include=np.number).columns)
+    rows = []
+    for col in columns:
+        x = np.sort(data[col].dropna().to_numpy(dtype=np.float64))
+        n = len(x)
+        f = cdf(x, *args)
+        d_plus = (np.arange(1.0, n + 1) / n - f).max()
+        d_minus = (f - np.arange(0.0, n) / n).max()
+        statistic = max(d_plus, d_minus)
+        rows.append(
+            {
+                "variable": col,
+                "n": n,
+                "statistic": statistic,
+                "pvalue": float(np.clip(stats.kstwo.sf(statistic, n), 0, 1)),
+            }
+        )
+    return pd.DataFrame(rows)
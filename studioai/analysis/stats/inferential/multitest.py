@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /studioai/analysis/stats/inferential/multitest.py                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:21:54 pm                                                #
+# Modified   : Monday October 19th 2026 05:21:54 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Multiple Testing Correction Module"""
+import logging
+
+import numpy as np
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+CORRECTIONS = {
+    "bonferroni": "Bonferroni",
+    "holm": "Holm-Bonferroni",
+    "bh": "Benjamini-Hochberg",
+}
+
+
+# ------------------------------------------------------------------------------------------------ #
+def adjust_pvalues(pvalues: np.ndarray, method: str = "holm") -> np.ndarray:
+    """Adjusts p-values for multiple comparisons.
+
+    Bonferroni and Holm control the family-wise error rate; Benjamini-Hochberg controls the
+    false discovery rate. Missing p-values are excluded from the family and remain missing.
+
+    Args:
+        pvalues (np.ndarray): Unadjusted p-values.
+        method (str): One of 'bonferroni', 'holm' or 'bh'. If None, p-values are returned
+            unadjusted. Default = 'holm'
+    """
+    p = np.asarray(pvalues, dtype=float)
+    if method is None:
+        return p.copy()
+    if method not in CORRECTIONS:
+        msg = f"Correction {method} is not supported. Choose from {list(CORRECTIONS.keys())}."
+        logger.error(msg)
+        raise ValueError(msg)
+
+    adjusted = np.full(p.shape, np.nan)
+    valid = ~np.isnan(p)
+    q = p[valid]
+    m = len(q)
+    if m == 0:
+        return adjusted
+
+    if method == "bonferroni":
+        adjusted[valid] = np.minimum(q * m, 1.0)
+        return adjusted
+
+    order = np.argsort(q, kind="stable")
+    ranked = q[order]
+    if method == "holm":
+        ranked = np.maximum.accumulate((m - np.arange(m)) * ranked)
+    else:
+        ranked = np.minimum.accumulate((ranked * m / np.arange(1, m + 1))[::-1])[::-1]
+
+    result = np.empty(m)
+    result[order] = np.minimum(ranked, 1.0)
+    adjusted[valid] = result
+    return adjusted
@@ -0,0 +1,546 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /studioai/analysis/stats/inferential/resample.py                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:25:39 pm                                                #
+# Modified   : Monday October 19th 2026 06:36:16 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Resampling Inference Module"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterator, Tuple, Union
+
+import numpy as np
+from scipy import stats
+
+from studioai import DataClass
+from studioai.analysis.stats.inferential.base import (
+    StatAnalysis,
+    StatisticalTest,
+    StatTestResult,
+)
+from studioai.analysis.stats.inferential.profile import StatTestProfile
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+ALTERNATIVES = ["two-sided", "less", "greater"]
+# Memory budget of a block of resamples. A block holds an int64 index matrix and a float64
+# matrix of the resampled values, 16 bytes per resampled observation.
+BLOCK_BYTES = 256 * 2**20
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                   VECTORIZED STATISTICS                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Statistics are computed along the last axis, so a matrix with one resample per row yields
+# one statistic per resample.
+def _mean(x: np.ndarray) -> np.ndarray:
+    return x.mean(axis=-1)
+
+
+def _median(x: np.ndarray) -> np.ndarray:
+    return np.median(x, axis=-1)
+
+
+def _std(x: np.ndarray) -> np.ndarray:
+    return x.std(axis=-1, ddof=1)
+
+
+def _mean_diff(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return a.mean(axis=-1) - b.mean(axis=-1)
+
+
+def _median_diff(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.median(a, axis=-1) - np.median(b, axis=-1)
+
+
+def _welch_t(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    se = np.sqrt(a.var(axis=-1, ddof=1) / a.shape[-1] + b.var(axis=-1, ddof=1) / b.shape[-1])
+    return (a.mean(axis=-1) - b.mean(axis=-1)) / se
+
+
+def _pearson(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    xc = x - x.mean(axis=-1, keepdims=True)
+    yc = y - y.mean(axis=-1, keepdims=True)
+    return (xc * yc).sum(axis=-1) / np.sqrt((xc**2).sum(axis=-1) * (yc**2).sum(axis=-1))
+
+
+def _spearman(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    # Each resample is ranked, since resampling with replacement introduces ties.
+    return _pearson(stats.rankdata(x, axis=-1), stats.rankdata(y, axis=-1))
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class Statistic(DataClass):
+    """A statistic computed vectorized across resamples.
+
+    Args:
+        name (str): Name of the statistic.
+        func (Callable): Computes the statistic along the last axis of its arguments. Must be
+            defined at module level if resampling is to run in a process pool.
+        kind (str): 'one' for statistics of a single sample, 'two' for comparisons of two
+            independent samples, or 'paired' for statistics of paired observations.
+        transform (Callable): Applied elementwise to each sample before resampling, e.g. a log
+            transform. Transforms that depend on the whole sample, such as ranking, belong in
+            func, since they change under resampling. Optional.
+    """
+
+    name: str
+    func: Callable
+    kind: str = "two"
+    transform: Callable = None
+
+
+STATISTICS = {
+    "mean": Statistic(name="mean", func=_mean, kind="one"),
+    "median": Statistic(name="median", func=_median, kind="one"),
+    "std": Statistic(name="std", func=_std, kind="one"),
+    "mean_diff": Statistic(name="mean_diff", func=_mean_diff, kind="two"),
+    "median_diff": Statistic(name="median_diff", func=_median_diff, kind="two"),
+    "t": Statistic(name="t", func=_welch_t, kind="two"),
+    "pearson": Statistic(name="pearson", func=_pearson, kind="paired"),
+    "spearman": Statistic(name="spearman", func=_spearman, kind="paired"),
+}
+
+
+def get_statistic(statistic: Union[str, Statistic]) -> Statistic:
+    """Returns a registered statistic by name, or the statistic itself."""
+    if isinstance(statistic, Statistic):
+        return statistic
+    try:
+        return STATISTICS[statistic]
+    except KeyError:
+        msg = f"Statistic {statistic} is not supported. Choose from {list(STATISTICS.keys())}."
+        logger.error(msg)
+        raise ValueError(msg)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      BLOCK WORKERS                                               #
+# ------------------------------------------------------------------------------------------------ #
+def _permutation_block(
+    seed: np.random.SeedSequence,
+    a: np.ndarray,
+    b: np.ndarray,
+    statistic: Statistic,
+    observed: float,
+    size: int,
+) -> Tuple[int, int, int]:
+    """Computes the statistic on a block of permutations.
+
+    Returns the number of resampled statistics less than or equal to, and greater than or
+    equal to, the observed statistic, and the number of resamples.
+    """
+    rng = np.random.default_rng(seed)
+    if statistic.kind == "paired":
+        index = rng.permuted(np.broadcast_to(np.arange(len(b)), (size, len(b))), axis=1)
+        values = statistic.func(a[np.newaxis, :], b[index])
+    else:
+        pooled = np.concatenate([a, b])
+        index = rng.permuted(np.broadcast_to(np.arange(len(pooled)), (size, len(pooled))), axis=1)
+        resampled = pooled[index]
+        values = statistic.func(resampled[:, : len(a)], resampled[:, len(a) :])
+
+    # Tolerate rounding error, so that resamples equal to the observed value are counted.
+    tol = 1e-12 * max(1.0, abs(observed))
+    return (
+        int(np.count_nonzero(values <= observed + tol)),
+        int(np.count_nonzero(values >= observed - tol)),
+        size,
+    )
+
+
+def _bootstrap_block(
+    seed: np.random.SeedSequence,
+    a: np.ndarray,
+    b: np.ndarray,
+    statistic: Statistic,
+    size: int,
+) -> np.ndarray:
+    """Computes the statistic on a block of bootstrap resamples."""
+    rng = np.random.default_rng(seed)
+    index = rng.integers(0, len(a), size=(size, len(a)))
+    if statistic.kind == "one":
+        return statistic.func(a[index])
+    if statistic.kind == "paired":
+        return statistic.func(a[index], b[index])
+    return statistic.func(a[index], b[rng.integers(0, len(b), size=(size, len(b)))])
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     RESAMPLING ENGINE                                            #
+# ------------------------------------------------------------------------------------------------ #
+class ResamplingEngine:
+    """Runs blocks of resamples, in a process pool if more than one job is requested.
+
+    A child SeedSequence is spawned for every block, so results depend on the seed and block
+    size, but not on the number of jobs. Blocks are consumed in order, which allows callers
+    to stop after any block with a result identical to a sequential run.
+
+    Args:
+        n_resamples (int): Maximum number of resamples.
+        n_observations (int): Number of observations in each resample, across samples.
+            Default = 1
+        block_size (int): Number of resamples per block; each block holds an index matrix of
+            block_size rows. Defaults to as many as fit within BLOCK_BYTES, up to 1000.
+        n_jobs (int): Number of worker processes. Default = 1
+        random_state (int): Seed for the random number generator. Optional.
+    """
+
+    def __init__(
+        self,
+        n_resamples: int,
+        n_observations: int = 1,
+        block_size: int = None,
+        n_jobs: int = 1,
+        random_state: int = None,
+    ) -> None:
+        if n_resamples < 1:
+            msg = f"The number of resamples must be at least 1, not {n_resamples}."
+            logger.error(msg)
+            raise ValueError(msg)
+        self._n_resamples = n_resamples
+        self._block_size = block_size or min(1000, max(1, BLOCK_BYTES // (16 * n_observations)))
+        self._n_jobs = n_jobs
+        self._seed = np.random.SeedSequence(random_state)
+
+    def run(self, func: Callable, *args) -> Iterator:
+        """Yields the result of func(seed, *args, size) for each block, in order.
+
+        The generator may be closed early; outstanding blocks are then cancelled.
+        """
+        sizes = [self._block_size] * (self._n_resamples // self._block_size)
+        if self._n_resamples % self._block_size:
+            sizes.append(self._n_resamples % self._block_size)
+        seeds = self._seed.spawn(len(sizes))
+
+        if self._n_jobs == 1:
+            for seed, size in zip(seeds, sizes):
+                yield func(seed, *args, size)
+            return
+
+        with ProcessPoolExecutor(max_workers=self._n_jobs) as executor:
+            futures = [executor.submit(func, seed, *args, size) for seed, size in zip(seeds, sizes)]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                  PERMUTATION TEST RESULT                                         #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class PermutationTestResult(StatTestResult):
+    name: str = "Permutation Test"
+    measure: str = None
+    alternative: str = None
+    n_resamples: int = None
+    stopped_early: bool = None
+    pvalue_lower: float = None
+    pvalue_upper: float = None
+
+    def report(self) -> str:
+        significance = self._report_alpha() if self.pvalue < self.alpha else "not significant."
+        stopped = ", stopped early" if self.stopped_early else ""
+        return (
+            f"{self.name} ({self.alternative}) of {self.measure}: observed = {round(self.value, 4)}, "
+            f"{self._report_pvalue(self.pvalue)} ({self.n_resamples:,} resamples{stopped}), "
+            f"{significance}"
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     PERMUTATION TEST                                             #
+# ------------------------------------------------------------------------------------------------ #
+class PermutationTest(StatisticalTest):
+    """Permutation test of a statistic of two samples.
+
+    For two independent samples, the observations are relabeled at random between the
+    samples. For paired statistics, such as correlations, the pairing is broken by permuting
+    the second variable. Permutations are generated as index matrices, one block of
+    resamples at a time, and the statistic is computed for the whole block at once.
+
+    The p-value is estimated as (k + 1) / (n + 1), where k of n resampled statistics are at
+    least as extreme as the one observed. With early stopping, resampling ends as soon as
+    the exact Clopper-Pearson confidence interval of the p-value lies entirely above or
+    below alpha, since more resamples would not be expected to change the decision.
+
+    Args:
+        a (np.ndarray): The first sample, or the first variable of paired observations.
+        b (np.ndarray): The second sample, or the second variable of paired observations.
+        statistic (Union[str, Statistic]): One of 'mean_diff', 'median_diff', 't', 'pearson',
+            'spearman', or a custom Statistic of kind 'two' or 'paired'. Default = 'mean_diff'
+        alternative (str): One of 'two-sided', 'less', 'greater'. Default = 'two-sided'
+        alpha (float): The level of statistical significance for inference.
+        n_resamples (int): Maximum number of permutations. Default = 9999
+        block_size (int): Number of permutations per block. Defaults to as many as fit within
+            BLOCK_BYTES, up to 1000.
+        n_jobs (int): Number of worker processes. Default = 1
+        random_state (int): Seed for the random number generator. Optional.
+        early_stopping (bool): Whether to stop once the decision at alpha is settled.
+            Default = True
+        confidence (float): Confidence level of the p-value interval used for early
+            stopping. Default = 0.99
+    """
+
+    __id = "permutation"
+
+    def __init__(
+        self,
+        a: np.ndarray,
+        b: np.ndarray,
+        statistic: Union[str, Statistic] = "mean_diff",
+        alternative: str = "two-sided",
+        alpha: float = 0.05,
+        n_resamples: int = 9999,
+        block_size: int = None,
+        n_jobs: int = 1,
+        random_state: int = None,
+        early_stopping: bool = True,
+        confidence: float = 0.99,
+    ) -> None:
+        super().__init__()
+        self._statistic = get_statistic(statistic)
+        if self._statistic.kind == "one":
+            msg = f"Permutation tests require a two sample statistic, not {self._statistic.name}."
+            logger.error(msg)
+            raise ValueError(msg)
+        if alternative not in ALTERNATIVES:
+            msg = f"Alternative must be one of {ALTERNATIVES}, not {alternative}."
+            logger.error(msg)
+            raise ValueError(msg)
+        self._a, self._b = _prepare(a=a, b=b, statistic=self._statistic)
+        self._alternative = alternative
+        self._alpha = alpha
+        self._engine = ResamplingEngine(
+            n_resamples=n_resamples,
+            n_observations=len(self._a) + (0 if self._b is None else len(self._b)),
+            block_size=block_size,
+            n_jobs=n_jobs,
+            random_state=random_state,
+        )
+        self._early_stopping = early_stopping
+        self._confidence = confidence
+        self._profile = StatTestProfile.create(self.__id)
+        self._result = None
+
+    @property
+    def profile(self) -> StatTestProfile:
+        """Returns the statistical test profile."""
+        return self._profile
+
+    @property
+    def result(self) -> PermutationTestResult:
+        """Returns a Statistical Test Result object."""
+        return self._result
+
+    def run(self) -> None:
+        """Executes the permutation test."""
+        observed = float(self._statistic.func(self._a, self._b))
+
+        less = greater = n = 0
+        stopped_early = False
+        blocks = self._engine.run(_permutation_block, self._a, self._b, self._statistic, observed)
+        for block_less, block_greater, size in blocks:
+            less, greater, n = less + block_less, greater + block_greater, n + size
+            pvalue, lower, upper = self._pvalue(less=less, greater=greater, n=n)
+            if self._early_stopping and (upper < self._alpha or lower > self._alpha):
+                stopped_early = True
+                blocks.close()
+                break
+
+        self._result = PermutationTestResult(
+            H0=self._profile.H0,
+            statistic=self._profile.statistic,
+            hypothesis=self._profile.hypothesis,
+            measure=self._statistic.name,
+            alternative=self._alternative,
+            value=observed,
+            pvalue=pvalue,
+            alpha=self._alpha,
+            n_resamples=n,
+            stopped_early=stopped_early,
+            pvalue_lower=lower,
+            pvalue_upper=upper,
+        )
+
+    def _pvalue(self, less: int, greater: int, n: int) -> Tuple[float, float, float]:
+        """Returns the p-value and its Clopper-Pearson confidence interval."""
+        if self._alternative == "less":
+            k, factor = less, 1
+        elif self._alternative == "greater":
+            k, factor = greater, 1
+        else:
+            k, factor = min(less, greater), 2
+
+        # The estimate is of the add-one form, which counts the observed arrangement. The
+        # interval is the exact Clopper-Pearson interval for the probability of drawing a
+        # resample at least as extreme, given k such resamples in n.
+        tail = (1 - self._confidence) / 2
+        lower = 0.0 if k == 0 else stats.beta.ppf(tail, k, n - k + 1)
+        upper = 1.0 if k == n else stats.beta.ppf(1 - tail, k + 1, n - k)
+        return tuple(min(1.0, factor * p) for p in ((k + 1) / (n + 1), lower, upper))
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     BOOTSTRAP RESULT                                             #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class BootstrapResult(DataClass):
+    name: str = "Bootstrap Confidence Interval"
+    measure: str = None
+    method: str = None
+    value: float = None
+    lower: float = None
+    upper: float = None
+    confidence_level: float = None
+    standard_error: float = None
+    n_resamples: int = None
+    distribution: np.ndarray = None
+
+    def report(self) -> str:
+        level = int(self.confidence_level * 100)
+        return (
+            f"{self.name} of {self.measure}: {round(self.value, 4)}, {level}% CI "
+            f"[{round(self.lower, 4)}, {round(self.upper, 4)}], SE = {round(self.standard_error, 4)} "
+            f"({self.method}, {self.n_resamples:,} resamples)"
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        BOOTSTRAP                                                 #
+# ------------------------------------------------------------------------------------------------ #
+class Bootstrap(StatAnalysis):
+    """Bootstrap confidence interval for a statistic of one or two samples.
+
+    Resamples are drawn with replacement as index matrices, one block at a time, and the
+    statistic is computed for the whole block at once. Paired observations are resampled
+    as pairs; independent samples are resampled separately.
+
+    Args:
+        a (np.ndarray): The sample, or the first of two samples.
+        b (np.ndarray): The second sample, or the second variable of paired observations.
+            Required for two sample and paired statistics.
+        statistic (Union[str, Statistic]): A registered statistic name, e.g. 'mean', 'median',
+            'std', 'mean_diff', 'pearson', or a custom Statistic. Default = 'mean'
+        confidence_level (float): Confidence level of the interval. Default = 0.95
+        method (str): Either 'percentile' or 'basic'. Default = 'percentile'
+        n_resamples (int): Number of resamples. Default = 9999
+        block_size (int): Number of resamples per block. Defaults to as many as fit within
+            BLOCK_BYTES, up to 1000.
+        n_jobs (int): Number of worker processes. Default = 1
+        random_state (int): Seed for the random number generator. Optional.
+    """
+
+    __methods = ["percentile", "basic"]
+
+    def __init__(
+        self,
+        a: np.ndarray,
+        b: np.ndarray = None,
+        statistic: Union[str, Statistic] = "mean",
+        confidence_level: float = 0.95,
+        method: str = "percentile",
+        n_resamples: int = 9999,
+        block_size: int = None,
+        n_jobs: int = 1,
+        random_state: int = None,
+    ) -> None:
+        super().__init__()
+        self._statistic = get_statistic(statistic)
+        if (b is None) != (self._statistic.kind == "one"):
+            msg = f"Statistic {self._statistic.name} of kind {self._statistic.kind} requires "
+            msg += "one sample." if self._statistic.kind == "one" else "two samples."
+            logger.error(msg)
+            raise ValueError(msg)
+        if method not in self.__methods:
+            msg = f"Method must be one of {self.__methods}, not {method}."
+            logger.error(msg)
+            raise ValueError(msg)
+        self._a, self._b = _prepare(a=a, b=b, statistic=self._statistic)
+        self._confidence_level = confidence_level
+        self._method = method
+        self._engine = ResamplingEngine(
+            n_resamples=n_resamples,
+            n_observations=len(self._a) + (0 if self._b is None else len(self._b)),
+            block_size=block_size,
+            n_jobs=n_jobs,
+            random_state=random_state,
+        )
+        self._result = None
+
+    @property
+    def result(self) -> BootstrapResult:
+        """Returns the bootstrap result."""
+        return self._result
+
+    def run(self) -> None:
+        """Computes the bootstrap distribution and confidence interval."""
+        if self._statistic.kind == "one":
+            observed = float(self._statistic.func(self._a))
+        else:
+            observed = float(self._statistic.func(self._a, self._b))
+
+        distribution = np.concatenate(
+            list(self._engine.run(_bootstrap_block, self._a, self._b, self._statistic))
+        )
+        tail = (1 - self._confidence_level) / 2
+        lower, upper = np.nanquantile(distribution, [tail, 1 - tail])
+        if self._method == "basic":
+            lower, upper = 2 * observed - upper, 2 * observed - lower
+
+        self._result = BootstrapResult(
+            measure=self._statistic.name,
+            method=self._method,
+            value=observed,
+            lower=float(lower),
+            upper=float(upper),
+            confidence_level=self._confidence_level,
+            standard_error=float(np.nanstd(distribution, ddof=1)),
+            n_resamples=len(distribution),
+            distribution=distribution,
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _prepare(a: np.ndarray, b: np.ndarray, statistic: Statistic) -> Tuple[np.ndarray, np.ndarray]:
+    """Converts samples to float arrays, dropping missing values, and applies any transform.
+
+    Paired observations are dropped if either value is missing.
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = None if b is None else np.asarray(b, dtype=np.float64)
+    if statistic.kind == "paired":
+        if len(a) != len(b):
+            msg = "Paired statistics require samples of equal length."
+            logger.error(msg)
+            raise ValueError(msg)
+        valid = ~(np.isnan(a) | np.isnan(b))
+        a, b = a[valid], b[valid]
+    else:
+        a = a[~np.isnan(a)]
+        b = None if b is None else b[~np.isnan(b)]
+    if statistic.transform is not None:
+        a = statistic.transform(a)
+        b = None if b is None else statistic.transform(b)
+    return a, b
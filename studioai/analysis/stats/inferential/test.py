@@ -11,22 +11,23 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Friday September 29th 2023 10:45:53 am                                              #
-# Modified   : Thursday October 19th 2023 07:56:31 pm                                              #
+# Modified   : Monday October 19th 2026 05:31:22 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 import pandas as pd
 import numpy as np
-from typing import Union
+from typing import List, Sequence, Union
 
+from studioai.analysis.stats.descriptive.continuous import SufficientStats
 from studioai.analysis.stats.inferential.independence import (
     ChiSquareIndependenceTest,
     ChiSquareIndependenceResult,
 )
 from studioai.analysis.stats.inferential.association import CramersVAnalysis, CramersV
 from studioai.analysis.stats.inferential.association import KendallsTauAnalysis, KendallsTau
-from studioai.analysis.stats.inferential.gof import KSTest, KSTestResult
+from studioai.analysis.stats.inferential.gof import KSTest, KSTestResult, ReferenceECDF
 from studioai.analysis.stats.inferential.correlation import (
     PearsonCorrelationTest,
     PearsonCorrelationResult,
@@ -35,7 +36,19 @@ from studioai.analysis.stats.inferential.correlation import (
     SpearmanCorrelationTest,
     SpearmanCorrelationResult,
 )
-from studioai.analysis.stats.inferential.centrality import TTest, TTestResult
+from studioai.analysis.stats.inferential.resample import (
+    Bootstrap,
+    BootstrapResult,
+    PermutationTest,
+    PermutationTestResult,
+    Statistic,
+)
+from studioai.analysis.stats.inferential.centrality import (
+    GroupedTTest,
+    GroupedTTestResult,
+    TTest,
+    TTestResult,
+)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -74,13 +87,27 @@ class Inference:
         data: pd.DataFrame = None,
         variant: str = "c",
         alternative: str = "two-sided",
+        method: str = "auto",
+        sample_size: int = 100000,
+        random_state: int = None,
     ) -> KendallsTau:
         data = data if data is not None else self._data
-        test = KendallsTauAnalysis(data=data, a=a, b=b, variant=variant, alternative=alternative)
+        test = KendallsTauAnalysis(
+            data=data,
+            a=a,
+            b=b,
+            variant=variant,
+            alternative=alternative,
+            method=method,
+            sample_size=sample_size,
+            random_state=random_state,
+        )
         test.run()
         return test.result
 
-    def kstest(self, a: np.ndarray, b: Union[str, np.ndarray], alpha: float = 0.05) -> KSTestResult:
+    def kstest(
+        self, a: np.ndarray, b: Union[str, np.ndarray, ReferenceECDF], alpha: float = 0.05
+    ) -> KSTestResult:
         test = KSTest(a=a, b=b, alpha=alpha)
         test.run()
         return test.result
@@ -111,11 +138,13 @@ class Inference:
 
     def ttest(
         self,
-        a: np.ndarray,
-        b: np.ndarray,
+        a: np.ndarray = None,
+        b: np.ndarray = None,
         varname: str = None,
         alpha: float = 0.05,
         homoscedastic: bool = True,
+        a_stats: SufficientStats = None,
+        b_stats: SufficientStats = None,
     ) -> TTestResult:
         test = TTest(
             a=a,
@@ -123,6 +152,83 @@ class Inference:
             varname=varname,
             alpha=alpha,
             homoscedastic=homoscedastic,
+            a_stats=a_stats,
+            b_stats=b_stats,
+        )
+        test.run()
+        return test.result
+
+    def ttest_many(
+        self,
+        value_cols: Union[str, List[str]],
+        group_col: str,
+        segment_cols: Union[str, List[str]] = None,
+        data: pd.DataFrame = None,
+        groups: Sequence[str] = None,
+        alpha: float = 0.05,
+        homoscedastic: bool = True,
+        correction: str = "holm",
+    ) -> GroupedTTestResult:
+        data = data if data is not None else self._data
+        test = GroupedTTest(
+            data=data,
+            value_cols=value_cols,
+            group_col=group_col,
+            segment_cols=segment_cols,
+            groups=groups,
+            alpha=alpha,
+            homoscedastic=homoscedastic,
+            correction=correction,
         )
         test.run()
         return test.result
+
+    def permutation_test(
+        self,
+        a: np.ndarray,
+        b: np.ndarray,
+        statistic: Union[str, Statistic] = "mean_diff",
+        alternative: str = "two-sided",
+        alpha: float = 0.05,
+        n_resamples: int = 9999,
+        n_jobs: int = 1,
+        random_state: int = None,
+        early_stopping: bool = True,
+    ) -> PermutationTestResult:
+        test = PermutationTest(
+            a=a,
+            b=b,
+            statistic=statistic,
+            alternative=alternative,
+            alpha=alpha,
+            n_resamples=n_resamples,
+            n_jobs=n_jobs,
+            random_state=random_state,
+            early_stopping=early_stopping,
+        )
+        test.run()
+        return test.result
+
+    def bootstrap(
+        self,
+        a: np.ndarray,
+        b: np.ndarray = None,
+        statistic: Union[str, Statistic] = "mean",
+        confidence_level: float = 0.95,
+        method: str = "percentile",
+        n_resamples: int = 9999,
+        n_jobs: int = 1,
+        random_state: int = None,
+    ) -> BootstrapResult:
+        analysis = Bootstrap(
+            a=a,
+            b=b,
+            statistic=statistic,
+            confidence_level=confidence_level,
+            method=method,
+            n_resamples=n_resamples,
+            n_jobs=n_jobs,
+            random_state=random_state,
+        )
+        analysis.run()
+        return analysis.result
@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /studioai/analysis/visualize/aggregate.py                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:46:11 pm                                                #
+# Modified   : Monday October 19th 2026 06:12:09 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Aggregates for Plotting Large Datasets"""
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import Tuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy import signal, stats
+from scipy.cluster import hierarchy
+
+from studioai.util.cache import LRUCache
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+ArrayLike = Union[np.ndarray, pd.Series]
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      DENSITY GRID                                                #
+# ------------------------------------------------------------------------------------------------ #
+class DensityGrid:
+    """Counts of points in a regular 2D grid, accumulated chunk by chunk.
+
+    Points are assigned to cells arithmetically and counted with a single bincount, which is
+    considerably faster than np.histogram2d. Points outside the extent, or with missing
+    coordinates, are ignored.
+
+    Args:
+        extent (Tuple[float, float, float, float]): The grid limits as (xmin, xmax, ymin, ymax).
+        bins (Union[int, Tuple[int, int]]): Number of cells along x and y. Default = 200
+    """
+
+    def __init__(
+        self,
+        extent: Tuple[float, float, float, float],
+        bins: Union[int, Tuple[int, int]] = 200,
+    ) -> None:
+        self._extent = tuple(float(e) for e in extent)
+        self._bins = (bins, bins) if np.isscalar(bins) else tuple(bins)
+        self._counts = np.zeros(self._bins[0] * self._bins[1], dtype=np.int64)
+
+    @property
+    def extent(self) -> Tuple[float, float, float, float]:
+        """Returns the grid limits as (xmin, xmax, ymin, ymax)."""
+        return self._extent
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Returns the counts, indexed by x cell then y cell."""
+        return self._counts.reshape(self._bins)
+
+    @property
+    def n(self) -> int:
+        """Returns the number of points counted."""
+        return int(self._counts.sum())
+
+    @classmethod
+    def from_data(
+        cls, x: ArrayLike, y: ArrayLike, bins: Union[int, Tuple[int, int]] = 200
+    ) -> DensityGrid:
+        """Creates the grid spanning the data, and counts the data."""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        grid = cls(extent=data_extent(x, y), bins=bins)
+        return grid.update(x, y)
+
+    def update(self, x: ArrayLike, y: ArrayLike) -> DensityGrid:
+        """Adds points to the grid."""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        xmin, xmax, ymin, ymax = self._extent
+        nx, ny = self._bins
+        valid = (x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)
+        ix = _cells(x[valid], xmin, xmax, nx)
+        iy = _cells(y[valid], ymin, ymax, ny)
+        self._counts += np.bincount(ix * ny + iy, minlength=nx * ny)
+        return self
+
+
+def data_extent(x: np.ndarray, y: np.ndarray) -> Tuple[float, float, float, float]:
+    """Returns the limits (xmin, xmax, ymin, ymax) of the finite points."""
+    valid = np.isfinite(x) & np.isfinite(y)
+    x, y = x[valid], y[valid]
+    if len(x) == 0:
+        return (0.0, 1.0, 0.0, 1.0)
+    return (*_widen(x.min(), x.max()), *_widen(y.min(), y.max()))
+
+
+def _widen(lower: float, upper: float) -> Tuple[float, float]:
+    """Returns limits with a non-zero width."""
+    if lower == upper:
+        return lower - 0.5, upper + 0.5
+    return lower, upper
+
+
+def _cells(values: np.ndarray, lower: float, upper: float, bins: int) -> np.ndarray:
+    """Returns the cell of each value in a regular grid; the upper limit is in the last cell."""
+    cells = ((values - lower) * (bins / (upper - lower))).astype(np.int64)
+    return np.minimum(cells, bins - 1)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                   STREAMING HISTOGRAM                                            #
+# ------------------------------------------------------------------------------------------------ #
+class StreamingHistogram:
+    """Histogram with a fixed number of equal-width bins, accumulated chunk by chunk.
+
+    The range need not be known in advance. The first chunk sets the bins; when a later
+    chunk falls outside them, adjacent bins are merged in pairs, doubling their width, and
+    the freed bins extend the range towards the new values. The count, sum and sum of
+    squares are kept, for the bandwidth of kernel density estimates.
+
+    Args:
+        bins (int): Number of bins. Rounded up to an even number. Default = 1024
+    """
+
+    def __init__(self, bins: int = 1024) -> None:
+        self._bins = bins + bins % 2
+        self._counts = np.zeros(self._bins, dtype=np.int64)
+        self._lower = None
+        self._width = None
+        self._n = 0
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._min = np.inf
+        self._max = -np.inf
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Returns the number of values in each bin."""
+        return self._counts
+
+    @property
+    def edges(self) -> np.ndarray:
+        """Returns the bin edges."""
+        return self._lower + self._width * np.arange(self._bins + 1)
+
+    @property
+    def centers(self) -> np.ndarray:
+        """Returns the bin centers."""
+        return self._lower + self._width * (np.arange(self._bins) + 0.5)
+
+    @property
+    def width(self) -> float:
+        """Returns the bin width."""
+        return self._width
+
+    @property
+    def n(self) -> int:
+        """Returns the number of values counted."""
+        return self._n
+
+    @property
+    def mean(self) -> float:
+        """Returns the mean of the values counted."""
+        return self._sum / self._n
+
+    @property
+    def std(self) -> float:
+        """Returns the sample standard deviation of the values counted."""
+        if self._n < 2:
+            return 0.0
+        var = (self._sumsq - self._sum**2 / self._n) / (self._n - 1)
+        return float(np.sqrt(max(var, 0.0)))
+
+    @property
+    def min(self) -> float:
+        """Returns the smallest value counted."""
+        return self._min
+
+    @property
+    def max(self) -> float:
+        """Returns the largest value counted."""
+        return self._max
+
+    def update(self, x: ArrayLike) -> StreamingHistogram:
+        """Adds the finite values of x to the histogram."""
+        x = np.asarray(x, dtype=np.float64)
+        x = x[np.isfinite(x)]
+        if len(x) == 0:
+            return self
+        xmin, xmax = x.min(), x.max()
+        if self._lower is None:
+            span = xmax - xmin if xmax > xmin else max(abs(xmin), 1.0) * 1e-6
+            self._lower = xmin
+            # Widen slightly, so that the maximum falls inside the last bin.
+            self._width = span * (1 + 1e-9) / self._bins
+        while xmin < self._lower or xmax >= self._lower + self._bins * self._width:
+            self._expand(lower=xmin < self._lower)
+
+        index = ((x - self._lower) / self._width).astype(np.int64)
+        self._counts += np.bincount(np.clip(index, 0, self._bins - 1), minlength=self._bins)
+        self._n += len(x)
+        self._sum += float(x.sum())
+        self._sumsq += float(np.dot(x, x))
+        self._min = min(self._min, xmin)
+        self._max = max(self._max, xmax)
+        return self
+
+    def rebin(self, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns counts and edges with adjacent bins combined into at most `bins` bins,
+        trimmed to the range of the data."""
+        occupied = np.flatnonzero(self._counts)
+        counts = self._counts[occupied[0] : occupied[-1] + 1]
+        lower = self._lower + occupied[0] * self._width
+        factor = max(1, int(np.ceil(len(counts) / bins)))
+        counts = np.pad(counts, (0, -len(counts) % factor))
+        counts = counts.reshape(-1, factor).sum(axis=1)
+        edges = lower + factor * self._width * np.arange(len(counts) + 1)
+        return counts, edges
+
+    def _expand(self, lower: bool) -> None:
+        """Merges bins in pairs and extends the range downwards or upwards."""
+        half = self._bins // 2
+        merged = self._counts.reshape(half, 2).sum(axis=1)
+        self._width *= 2
+        if lower:
+            self._counts = np.concatenate([np.zeros(half, dtype=np.int64), merged])
+            self._lower -= half * self._width
+        else:
+            self._counts = np.concatenate([merged, np.zeros(half, dtype=np.int64)])
+
+
+def histogram_stat(counts: np.ndarray, edges: np.ndarray, stat: str = "density") -> np.ndarray:
+    """Normalizes histogram counts as seaborn's histplot does.
+
+    Args:
+        counts (np.ndarray): Bin counts.
+        edges (np.ndarray): Bin edges.
+        stat (str): One of 'count', 'frequency', 'probability', 'proportion', 'percent'
+            or 'density'. Default = 'density'
+    """
+    n, widths = counts.sum(), np.diff(edges)
+    if stat == "count":
+        return counts.astype(np.float64)
+    if stat == "frequency":
+        return counts / widths
+    if stat in ("probability", "proportion"):
+        return counts / n
+    if stat == "percent":
+        return counts / n * 100
+    if stat == "density":
+        return counts / (n * widths)
+    msg = f"stat {stat} is not supported."
+    logger.error(msg)
+    raise ValueError(msg)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       RING BUFFER                                                #
+# ------------------------------------------------------------------------------------------------ #
+class RingBuffer:
+    """Fixed-capacity buffer holding the most recent values appended to it.
+
+    Each value is written twice, at its position and one capacity further on, so the
+    buffered values are always a contiguous view of the underlying array. Appending costs
+    time proportional to the number of values appended, and reading costs nothing.
+
+    Args:
+        capacity (int): Maximum number of values held.
+        dtype: Data type of the values. Default = float64
+    """
+
+    def __init__(self, capacity: int, dtype: np.dtype = np.float64) -> None:
+        self._capacity = capacity
+        self._buffer = np.empty(2 * capacity, dtype=dtype)
+        self._end = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Returns the maximum number of values held."""
+        return self._capacity
+
+    @property
+    def values(self) -> np.ndarray:
+        """Returns a read-only view of the values, from oldest to newest."""
+        start = (self._end - self._size) % self._capacity
+        view = self._buffer[start : start + self._size]
+        view.flags.writeable = False
+        return view
+
+    def extend(self, values: ArrayLike) -> RingBuffer:
+        """Appends values, dropping the oldest beyond the capacity."""
+        values = np.asarray(values, dtype=self._buffer.dtype)[-self._capacity :]
+        positions = (self._end + np.arange(len(values))) % self._capacity
+        self._buffer[positions] = values
+        self._buffer[positions + self._capacity] = values
+        self._end = (self._end + len(values)) % self._capacity
+        self._size = min(self._size + len(values), self._capacity)
+        return self
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        BINNED KDE                                                #
+# ------------------------------------------------------------------------------------------------ #
+KDE_BINS = 4096  # Fine bins from which kernel density estimates are convolved.
+
+
+def binned_kde(
+    histogram: StreamingHistogram,
+    bw_adjust: float = 1.0,
+    cut: float = 3.0,
+    cumulative: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Gaussian kernel density estimate from binned data, by FFT convolution.
+
+    The bin counts are convolved with the Gaussian kernel sampled at the bin spacing, which
+    costs O(b log b) for b bins regardless of the number of observations. The bandwidth
+    follows Scott's rule, as in seaborn's kdeplot, and the curve extends `cut` bandwidths
+    beyond the data.
+
+    Args:
+        histogram (StreamingHistogram): The binned data. Fine bins give smooth curves.
+        bw_adjust (float): Factor that multiplies the bandwidth. Default = 1
+        cut (float): Number of bandwidths by which the curve extends beyond the data.
+            Default = 3
+        cumulative (bool): Whether to return the cumulative distribution. Default = False
+
+    Returns:
+        Grid points and the density, or cumulative probability, at each.
+    """
+    width = histogram.width
+    bandwidth = bw_adjust * histogram.std * histogram.n ** (-1 / 5)
+    occupied = np.flatnonzero(histogram.counts)
+    counts = histogram.counts[occupied[0] : occupied[-1] + 1].astype(np.float64)
+    lower = histogram.centers[occupied[0]]
+    if bandwidth <= 0:
+        x = lower + width * np.arange(len(counts))
+        y = counts / (histogram.n * width)
+        return x, np.cumsum(y) * width if cumulative else y
+
+    pad = int(np.ceil(cut * bandwidth / width))
+    counts = np.pad(counts, pad)
+    half = int(np.ceil(4 * bandwidth / width))
+    kernel = stats.norm.pdf(np.arange(-half, half + 1) * width / bandwidth) / bandwidth
+    density = np.maximum(signal.fftconvolve(counts, kernel, mode="same"), 0) / histogram.n
+    x = lower + width * (np.arange(len(counts)) - pad)
+    if cumulative:
+        return x, np.clip(np.cumsum(density) * width, 0, 1)
+    return x, density
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      QUANTILE SKETCH                                             #
+# ------------------------------------------------------------------------------------------------ #
+class QuantileSketch:
+    """Mergeable summary of a distribution for approximate quantiles and ECDFs.
+
+    Values are held as weighted centroids. When more than `size` centroids accumulate, they
+    are compressed into `size` groups of equal cumulative weight, each replaced by its
+    weighted mean, so the rank error of any quantile is about 1/size. Exact extremes are
+    retained.
+
+    Args:
+        size (int): Number of centroids retained. Default = 2000
+    """
+
+    def __init__(self, size: int = 2000) -> None:
+        self._size = size
+        self._values = np.empty(0)
+        self._weights = np.empty(0)
+        self._min = np.inf
+        self._max = -np.inf
+
+    @property
+    def size(self) -> int:
+        """Returns the number of centroids retained."""
+        return self._size
+
+    @property
+    def n(self) -> float:
+        """Returns the number of values summarized."""
+        return float(self._weights.sum())
+
+    @property
+    def min(self) -> float:
+        """Returns the smallest value summarized."""
+        return self._min
+
+    @property
+    def max(self) -> float:
+        """Returns the largest value summarized."""
+        return self._max
+
+    def update(self, x: ArrayLike) -> QuantileSketch:
+        """Adds the finite values of x to the sketch."""
+        x = np.asarray(x, dtype=np.float64)
+        x = x[np.isfinite(x)]
+        if len(x):
+            self._min = min(self._min, x.min())
+            self._max = max(self._max, x.max())
+            self._add(x, np.ones(len(x)))
+        return self
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        """Adds the centroids of another sketch."""
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        self._add(other._values, other._weights)
+        return self
+
+    def ecdf(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the values and cumulative proportions of the ECDF, from min to max."""
+        cumulative = np.cumsum(self._weights) / self.n
+        values = np.concatenate([[self._min], self._values, [self._max]])
+        proportions = np.concatenate([[0.0], cumulative, [1.0]])
+        return values, proportions
+
+    def quantile(self, q: Union[float, ArrayLike]) -> Union[float, np.ndarray]:
+        """Returns approximate quantiles by interpolating the centroids."""
+        midpoints = (np.cumsum(self._weights) - self._weights / 2) / self.n
+        values = np.concatenate([[self._min], self._values, [self._max]])
+        positions = np.concatenate([[0.0], midpoints, [1.0]])
+        return np.interp(q, positions, values)
+
+    def _add(self, values: np.ndarray, weights: np.ndarray) -> None:
+        values = np.concatenate([self._values, values])
+        weights = np.concatenate([self._weights, weights])
+        order = np.argsort(values, kind="stable")
+        values, weights = values[order], weights[order]
+        if len(values) > self._size:
+            # Group centroids into `size` intervals of equal cumulative weight.
+            cumulative = np.cumsum(weights)
+            groups = np.minimum(
+                ((cumulative - weights / 2) / cumulative[-1] * self._size).astype(np.int64),
+                self._size - 1,
+            )
+            totals = np.bincount(groups, weights=weights, minlength=self._size)
+            sums = np.bincount(groups, weights=values * weights, minlength=self._size)
+            keep = totals > 0
+            values, weights = sums[keep] / totals[keep], totals[keep]
+        self._values, self._weights = values, weights
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         MATRICES                                                 #
+# ------------------------------------------------------------------------------------------------ #
+_orders = LRUCache(maxsize=32)
+
+
+def cluster_order(
+    matrix: np.ndarray, method: str = "average", metric: str = "euclidean"
+) -> np.ndarray:
+    """Returns the leaf order of a hierarchical clustering of the rows of a matrix.
+
+    Missing values are treated as zeros. Orders are cached by the content of the matrix, so
+    redrawing the same matrix does not repeat the clustering.
+
+    Args:
+        matrix (np.ndarray): 2D array whose rows are clustered.
+        method (str): Linkage method passed to scipy.cluster.hierarchy.linkage.
+            Default = 'average'
+        metric (str): Distance metric between rows. Default = 'euclidean'
+    """
+    matrix = np.nan_to_num(np.asarray(matrix, dtype=np.float64))
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(matrix.shape).encode())
+    digest.update(np.ascontiguousarray(matrix).data)
+    key = (digest.hexdigest(), method, metric)
+    order = _orders.get(key)
+    if order is None:
+        if len(matrix) < 2:
+            order = np.arange(len(matrix))
+        else:
+            order = hierarchy.leaves_list(hierarchy.linkage(matrix, method=method, metric=metric))
+        order.setflags(write=False)
+        _orders.put(key, order)
+    return order
+
+
+def block_mean(
+    matrix: np.ndarray, shape: Tuple[int, int]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Downsamples a matrix to at most `shape` blocks by averaging contiguous cells.
+
+    Missing values are ignored; a block with none present is missing.
+
+    Returns:
+        The block means, and the first row and first column of each block.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    rows = _block_starts(matrix.shape[0], shape[0])
+    cols = _block_starts(matrix.shape[1], shape[1])
+    valid = np.isfinite(matrix)
+    sums = np.add.reduceat(np.add.reduceat(np.where(valid, matrix, 0), rows, axis=0), cols, axis=1)
+    counts = np.add.reduceat(np.add.reduceat(valid.astype(np.int64), rows, axis=0), cols, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / counts, np.nan), rows, cols
+
+
+def _block_starts(n: int, blocks: int) -> np.ndarray:
+    """Returns the starting index of each of at most `blocks` near-equal blocks of n."""
+    return np.unique(np.linspace(0, n, min(blocks, n) + 1).astype(np.int64)[:-1])
@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Saturday August 26th 2023 06:22:05 am                                               #
-# Modified   : Sunday December 24th 2023 03:33:04 pm                                               #
+# Modified   : Monday October 19th 2026 06:08:32 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
@@ -21,7 +21,6 @@ from dataclasses import dataclass
 from typing import Union
 
 import pandas as pd
-import seaborn as sns
 
 from studioai import DataClass
 from studioai.util.string import proper
@@ -74,8 +73,6 @@ class Visualizer(ABC):  # pragma: no cover
         """Defines the construction requirement for Visualizers"""
         self._canvas = canvas
         self._data = None
-        sns.set_style(style=self._canvas.style)
-        sns.set_palette(palette=self._canvas.palette)
 
     @property
     def data(self) -> pd.DataFrame:
@@ -92,8 +89,6 @@ class Visualizer(ABC):  # pragma: no cover
     @canvas.setter
     def canvas(self, canvas: Canvas) -> None:
         self._canvas = canvas
-        sns.set_style(style=canvas.style)
-        sns.set_palette(canvas.palette)
 
     @abstractmethod
     def lineplot(self, *args, **kwargs) -> None:  # pragma: no cover
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /studioai/analysis/visualize/batch.py                                               #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:54:01 pm                                                #
+# Modified   : Monday October 19th 2026 06:38:35 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Batch rendering of plots to image files."""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List
+
+import matplotlib
+import matplotlib.pyplot as plt
+import pandas as pd
+from matplotlib.figure import Figure
+
+from studioai import DataClass
+from studioai.analysis.visualize.visualizer import SeabornCanvas, Visualizer
+from studioai.util.io import IOService
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+_visualizer = None  # The Visualizer of a worker process, holding the data to be plotted.
+# Visualizer methods that can be rendered in a batch.
+PLOTS = frozenset(
+    [
+        "lineplot",
+        "scatterplot",
+        "histogram",
+        "boxplot",
+        "countplot",
+        "barplot",
+        "kdeplot",
+        "kdebox_one",
+        "ecdfplot",
+        "violinplot",
+        "regplot",
+        "pdfcdfplot",
+        "pairplot",
+        "jointplot",
+        "ttestplot",
+        "x2testplot",
+        "kstestplot",
+        "heatmap",
+    ]
+)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         PLOT SPEC                                                #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class PlotSpec(DataClass):
+    """Specification of a single plot in a batch.
+
+    Args:
+        plot (str): Name of the Visualizer method, e.g. 'histogram' or 'countplot'. One of PLOTS.
+        filepath (str): Output path. The extension, 'png', 'svg' or 'pdf', sets the format.
+        params (dict): Keyword arguments for the Visualizer method, such as x, hue or title.
+    """
+
+    plot: str
+    filepath: str
+    params: dict = field(default_factory=dict)
+
+
+@dataclass
+class RenderResult(DataClass):
+    """Outcome and timing of a rendered plot."""
+
+    plot: str
+    filepath: str
+    render_seconds: float = None
+    write_seconds: float = None
+    error: str = None
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          RENDER                                                  #
+# ------------------------------------------------------------------------------------------------ #
+def render(spec: PlotSpec, visualizer: Visualizer, dpi: int = 100) -> RenderResult:
+    """Renders a plot and writes it to file, closing every figure it creates.
+
+    Errors are logged and returned in the result, rather than raised, so that one failed plot
+    does not abandon the rest of a batch.
+
+    Args:
+        spec (PlotSpec): The plot to render.
+        visualizer (Visualizer): Visualizer holding the data to be plotted.
+        dpi (int): Resolution of raster images. Default = 100
+    """
+    result = RenderResult(plot=spec.plot, filepath=spec.filepath)
+    before = set(plt.get_fignums())
+    try:
+        with visualizer.canvas, visualizer.canvas.context():
+            start = time.perf_counter()
+            figure = _figure(getattr(visualizer, spec.plot)(**spec.params))
+            result.render_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            IOService.write(filepath=spec.filepath, data=figure, dpi=dpi)
+            result.write_seconds = time.perf_counter() - start
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+        logger.error(f"Unable to render {spec.plot} to {spec.filepath}.\n{result.error}")
+    finally:
+        # Seaborn may leave figures of its own in pyplot's manager.
+        for num in set(plt.get_fignums()) - before:
+            plt.close(num)
+    return result
+
+
+def render_batch(
+    specs: List[PlotSpec],
+    data: pd.DataFrame,
+    canvas: SeabornCanvas = None,
+    n_jobs: int = None,
+    dpi: int = 100,
+) -> pd.DataFrame:
+    """Renders plots of a dataset to files across a pool of worker processes.
+
+    Each worker uses the Agg backend and receives the data once, when it starts, rather than
+    with every plot. Every figure is closed as soon as it is written.
+
+    Args:
+        specs (List[PlotSpec]): The plots to render.
+        data (pd.DataFrame): The data to be plotted.
+        canvas (SeabornCanvas): Canvas configuration. Defaults to SeabornCanvas().
+        n_jobs (int): Number of worker processes. Defaults to the number of processors.
+            With n_jobs=1, plots are rendered in the calling process, with its backend.
+        dpi (int): Resolution of raster images. Default = 100
+
+    Returns:
+        DataFrame with one row per spec, in order, giving the plot, filepath, seconds to
+        render and to write, and any error.
+    """
+    canvas = canvas or SeabornCanvas()
+    unsupported = [spec.plot for spec in specs if spec.plot not in PLOTS]
+    if unsupported:
+        msg = f"Unsupported plots: {unsupported}. Plots must be one of {sorted(PLOTS)}."
+        logger.error(msg)
+        raise ValueError(msg)
+
+    if n_jobs == 1:
+        visualizer = Visualizer(canvas=canvas)
+        visualizer.data = data
+        results = [render(spec=spec, visualizer=visualizer, dpi=dpi) for spec in specs]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_jobs, initializer=_init_worker, initargs=(data, canvas, "Agg")
+        ) as executor:
+            results = list(executor.map(_render, specs, [dpi] * len(specs)))
+
+    return pd.DataFrame([result.as_dict() for result in results])
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _init_worker(data: pd.DataFrame, canvas: SeabornCanvas, backend: str = "Agg") -> None:
+    """Prepares a worker process with a Visualizer holding the data."""
+    global _visualizer
+    matplotlib.use(backend)
+    _visualizer = Visualizer(canvas=canvas)
+    _visualizer.data = data
+
+
+def _render(spec: PlotSpec, dpi: int) -> RenderResult:
+    return render(spec=spec, visualizer=_visualizer, dpi=dpi)
+
+
+def _figure(plotted) -> Figure:
+    """Returns the figure of a plot from whatever the Visualizer method returned."""
+    if isinstance(plotted, Figure):
+        return plotted
+    if getattr(plotted, "figure", None) is not None:
+        return plotted.figure
+    msg = "The plot returned no figure."
+    logger.error(msg)
+    raise ValueError(msg)
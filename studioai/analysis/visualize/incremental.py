@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /studioai/analysis/visualize/incremental.py                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 06:09:49 pm                                                #
+# Modified   : Monday October 19th 2026 06:09:49 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Plots Updated Incrementally as Data Arrives"""
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+from studioai.analysis.visualize.aggregate import RingBuffer, StreamingHistogram, histogram_stat
+from studioai.analysis.visualize.visualizer import SeabornCanvas
+from studioai.util.string import proper
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     INCREMENTAL PLOT                                             #
+# ------------------------------------------------------------------------------------------------ #
+class IncrementalPlot(ABC):
+    """Base class for plots that keep their aggregated state and artists between updates.
+
+    Each call to update adds a chunk of data to the state of the plot and sets the data of
+    its existing artists, rather than drawing the plot again. The figure is then marked for
+    a redraw, which interactive backends perform when idle.
+
+    Args:
+        hue (str): Grouping variable that will produce elements with different colors.
+        canvas (SeabornCanvas): Canvas configuration. Defaults to SeabornCanvas().
+        title (str): Title for the plot. Optional
+        figsize (tuple): Size of the figure. Ignored if ax is provided. Default = (12, 4)
+        ax (plt.Axes): A matplotlib Axes object. Optional.
+    """
+
+    def __init__(
+        self,
+        hue: str = None,
+        canvas: SeabornCanvas = None,
+        title: str = None,
+        figsize: tuple = (12, 4),
+        ax: plt.Axes = None,
+    ) -> None:
+        self._hue = hue
+        self._canvas = canvas or SeabornCanvas()
+        self._colors = {}
+        with self._canvas.context():
+            if ax is None:
+                ax = self._canvas.figure(figsize=figsize).subplots()
+            if title is not None:
+                ax.set_title(title)
+        self._ax = ax
+
+    @property
+    def ax(self) -> plt.Axes:
+        return self._ax
+
+    @property
+    def figure(self) -> Figure:
+        return self._ax.figure
+
+    def update(self, data: pd.DataFrame) -> IncrementalPlot:
+        """Adds a chunk of data to the plot and updates its artists in place.
+
+        Args:
+            data (pd.DataFrame): The new rows.
+        """
+        levels = len(self._colors)
+        if self._hue is None:
+            self._update(None, data)
+        else:
+            for level, group in data.groupby(self._hue, sort=False, observed=True):
+                self._update(level, group)
+        with self._canvas.context():
+            self._draw()
+            if self._hue is not None and len(self._colors) > levels:
+                self._ax.legend(title=proper(self._hue))
+            self._rescale()
+        self.figure.canvas.draw_idle()
+        return self
+
+    @abstractmethod
+    def _update(self, level, data: pd.DataFrame) -> None:
+        """Adds the rows of one hue level, or all rows if there is no hue, to the state."""
+
+    @abstractmethod
+    def _draw(self) -> None:
+        """Creates the artists of new hue levels and sets the data of those that changed."""
+
+    @abstractmethod
+    def _rescale(self) -> None:
+        """Fits the axes limits to the data."""
+
+    def _color(self, level) -> str:
+        """Returns the color of a hue level, assigning the next color of the palette to a
+        level not seen before."""
+        if level not in self._colors:
+            cycle = self._canvas.rc["axes.prop_cycle"].by_key()["color"]
+            self._colors[level] = cycle[len(self._colors) % len(cycle)]
+        return self._colors[level]
+
+    @staticmethod
+    def _label(level) -> str:
+        return None if level is None else str(level)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        HISTOGRAM                                                 #
+# ------------------------------------------------------------------------------------------------ #
+class IncrementalHistogram(IncrementalPlot):
+    """Histogram whose bin counts accumulate as data arrives.
+
+    The bins are those of a StreamingHistogram of all the data, shared by every hue level, so
+    an update costs time proportional to the size of the chunk and the number of bins. Only
+    the bars whose heights change are updated. When a chunk falls outside the range of the
+    bins, they double in width, the counts of each level are merged accordingly, and every
+    bar is moved.
+
+    Args:
+        x (str): Variable to be binned.
+        hue (str): Grouping variable that will produce histograms with different colors.
+        bins (int): Number of bins. Default = 50
+        stat (str): Aggregate statistic to compute in each bin. One of 'count', 'frequency',
+            'probability', 'proportion', 'percent' or 'density'. Default = 'count'
+        canvas (SeabornCanvas): Canvas configuration. Defaults to SeabornCanvas().
+        title (str): Title for the plot. Optional
+        figsize (tuple): Size of the figure. Ignored if ax is provided. Default = (12, 4)
+        ax (plt.Axes): A matplotlib Axes object. Optional.
+    """
+
+    def __init__(
+        self,
+        x: str,
+        hue: str = None,
+        bins: int = 50,
+        stat: str = "count",
+        canvas: SeabornCanvas = None,
+        title: str = None,
+        figsize: tuple = (12, 4),
+        ax: plt.Axes = None,
+    ) -> None:
+        super().__init__(hue=hue, canvas=canvas, title=title or proper(x), figsize=figsize, ax=ax)
+        self._x = x
+        self._stat = stat
+        self._histogram = StreamingHistogram(bins=bins)
+        self._counts = {}
+        self._bars = {}
+        self._heights = {}
+        self._layouts = {}
+        self._ax.set_xlabel(proper(x))
+        self._ax.set_ylabel(proper(stat))
+
+    @property
+    def histogram(self) -> StreamingHistogram:
+        """Returns the histogram of all the data, which defines the bins."""
+        return self._histogram
+
+    @property
+    def counts(self) -> dict:
+        """Returns the bin counts of each hue level, keyed by None without hue."""
+        return self._counts
+
+    def update(self, data: pd.DataFrame) -> IncrementalHistogram:
+        """Adds a chunk of data to the plot and updates its bars in place.
+
+        Args:
+            data (pd.DataFrame): The new rows.
+        """
+        layout = self._layout()
+        self._histogram.update(data[self._x])
+        if layout[1] is not None and self._layout() != layout:
+            for level, counts in self._counts.items():
+                self._counts[level] = self._merge(counts, *layout)
+        return super().update(data)
+
+    def _update(self, level, data: pd.DataFrame) -> None:
+        x = data[self._x].to_numpy(dtype=np.float64)
+        x = x[np.isfinite(x)]
+        counts = self._counts.setdefault(level, np.zeros_like(self._histogram.counts))
+        if len(x):
+            lower, width = self._layout()
+            index = ((x - lower) / width).astype(np.int64)
+            counts += np.bincount(np.clip(index, 0, len(counts) - 1), minlength=len(counts))
+
+    def _draw(self) -> None:
+        if self._histogram.n == 0:
+            return
+        edges = self._histogram.edges
+        layout = self._layout()
+        for level, counts in self._counts.items():
+            heights = histogram_stat(counts, edges, self._stat)
+            bars = self._bars.get(level)
+            if bars is None:
+                self._bars[level] = self._ax.bar(
+                    edges[:-1],
+                    heights,
+                    width=layout[1],
+                    align="edge",
+                    color=self._color(level),
+                    alpha=0.75 if self._hue is None else 0.5,
+                    edgecolor="white",
+                    linewidth=0.5,
+                    label=self._label(level),
+                )
+            else:
+                if layout != self._layouts[level]:
+                    for bar, left in zip(bars, edges[:-1]):
+                        bar.set_x(left)
+                        bar.set_width(layout[1])
+                    changed = np.arange(len(heights))
+                else:
+                    changed = np.flatnonzero(heights != self._heights[level])
+                for i in changed:
+                    bars[i].set_height(heights[i])
+            self._heights[level] = heights
+            self._layouts[level] = layout
+
+    def _rescale(self) -> None:
+        if self._histogram.n == 0:
+            return
+        lower, upper = self._histogram.min, self._histogram.max
+        margin = 0.05 * (upper - lower) or 0.5
+        self._ax.set_xlim(lower - margin, upper + margin)
+        top = max(heights.max() for heights in self._heights.values())
+        self._ax.set_ylim(0, 1.05 * top or 1)
+
+    def _layout(self) -> tuple:
+        """Returns the lower edge and width of the bins."""
+        return (
+            (self._histogram.edges[0], self._histogram.width) if self._histogram.n else (None, None)
+        )
+
+    def _merge(self, counts: np.ndarray, lower: float, width: float) -> np.ndarray:
+        """Returns counts binned at a previous layout, combined into the current bins."""
+        centers = lower + width * (np.arange(len(counts)) + 0.5)
+        index = ((centers - self._layout()[0]) / self._histogram.width).astype(np.int64)
+        return np.bincount(index, weights=counts, minlength=len(counts)).astype(np.int64)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        LINE PLOT                                                 #
+# ------------------------------------------------------------------------------------------------ #
+class IncrementalLineplot(IncrementalPlot):
+    """Line plot of a moving window of the most recent data.
+
+    The window of each line is held in ring buffers, so an update costs time proportional to
+    the size of the chunk rather than the data seen so far.
+
+    Args:
+        x (str): Variable on the x axis, typically a time.
+        y (str): Variable on the y axis.
+        hue (str): Grouping variable that will produce lines with different colors.
+        window (int): Number of most recent points shown on each line. Default = 10000
+        canvas (SeabornCanvas): Canvas configuration. Defaults to SeabornCanvas().
+        title (str): Title for the plot. Optional
+        figsize (tuple): Size of the figure. Ignored if ax is provided. Default = (12, 4)
+        ax (plt.Axes): A matplotlib Axes object. Optional.
+    """
+
+    def __init__(
+        self,
+        x: str,
+        y: str,
+        hue: str = None,
+        window: int = 10000,
+        canvas: SeabornCanvas = None,
+        title: str = None,
+        figsize: tuple = (12, 4),
+        ax: plt.Axes = None,
+    ) -> None:
+        title = title or f"{proper(y)} by {proper(x)}"
+        super().__init__(hue=hue, canvas=canvas, title=title, figsize=figsize, ax=ax)
+        self._x = x
+        self._y = y
+        self._window = window
+        self._buffers = {}
+        self._lines = {}
+        self._changed = set()
+        self._ax.set_xlabel(proper(x))
+        self._ax.set_ylabel(proper(y))
+
+    @property
+    def buffers(self) -> dict:
+        """Returns the x and y RingBuffers of each hue level, keyed by None without hue."""
+        return self._buffers
+
+    def _update(self, level, data: pd.DataFrame) -> None:
+        x = data[self._x].to_numpy()
+        y = data[self._y].to_numpy(dtype=np.float64)
+        if level not in self._buffers:
+            self._buffers[level] = (
+                RingBuffer(self._window, dtype=x.dtype),
+                RingBuffer(self._window),
+            )
+        xbuffer, ybuffer = self._buffers[level]
+        xbuffer.extend(x)
+        ybuffer.extend(y)
+        self._changed.add(level)
+
+    def _draw(self) -> None:
+        for level in self._changed:
+            xbuffer, ybuffer = self._buffers[level]
+            line = self._lines.get(level)
+            if line is None:
+                (self._lines[level],) = self._ax.plot(
+                    xbuffer.values,
+                    ybuffer.values,
+                    color=self._color(level),
+                    label=self._label(level),
+                )
+            else:
+                line.set_data(xbuffer.values, ybuffer.values)
+        self._changed.clear()
+
+    def _rescale(self) -> None:
+        self._ax.relim()
+        self._ax.autoscale_view()
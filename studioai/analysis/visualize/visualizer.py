@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Saturday August 26th 2023 06:25:27 am                                               #
-# Modified   : Friday June 7th 2024 02:39:46 pm                                                    #
+# Modified   : Monday October 19th 2026 06:39:15 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
@@ -19,21 +19,42 @@
 """Wrapper for several Seaborn plotting functions."""
 from __future__ import annotations
 
+import functools
 import logging
 import math
-from dataclasses import dataclass
-from typing import List, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Tuple, Union
 
+import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import seaborn as sns
+from matplotlib.colors import LinearSegmentedColormap, LogNorm, to_rgb
+from matplotlib.figure import Figure
 from matplotlib.gridspec import GridSpec
+from matplotlib.patches import Patch
+from cycler import cycler
 from scipy import stats
 
 from studioai import DataClass
+from studioai.analysis.visualize.aggregate import (
+    KDE_BINS,
+    DensityGrid,
+    QuantileSketch,
+    StreamingHistogram,
+    binned_kde,
+    block_mean,
+    cluster_order,
+    data_extent,
+    histogram_stat,
+)
 from studioai.analysis.visualize.base import Canvas, Colors
 from studioai.analysis.visualize.base import Visualizer as VisualizerABC
+from studioai.data.sample import sample
+from studioai.util.cache import LRUCache, freeze
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
@@ -51,48 +72,163 @@ class Palettes(DataClass):
     paired: str = "Paired"
     dark: str = "dark"
     colorblind: str = "colorblind"
-    darkblue = sns.dark_palette("#69d", reverse=False, as_cmap=False)
-    darkblue_r = sns.dark_palette("#69d", reverse=True, as_cmap=False)
-    winter_blue = sns.color_palette(
-        [
+
+    # Custom palettes are built on first use, rather than on import.
+    @property
+    def darkblue(self) -> list:
+        return _custom_palette("darkblue")
+
+    @property
+    def darkblue_r(self) -> list:
+        return _custom_palette("darkblue_r")
+
+    @property
+    def winter_blue(self) -> list:
+        return _custom_palette("winter_blue")
+
+    @property
+    def blue_orange(self) -> list:
+        return _custom_palette("blue_orange")
+
+
+@functools.lru_cache(maxsize=None)
+def _custom_palette(name: str) -> list:
+    if name == "darkblue":
+        return sns.dark_palette("#69d", reverse=False, as_cmap=False)
+    if name == "darkblue_r":
+        return sns.dark_palette("#69d", reverse=True, as_cmap=False)
+    if name == "winter_blue":
+        colors = [
             Colors.cool_black,
             Colors.police_blue,
             Colors.teal_blue,
             Colors.pale_robin_egg_blue,
-        ],
-        as_cmap=True,
-    )
-    blue_orange = sns.color_palette(
-        [
+        ]
+    else:
+        colors = [
             Colors.russian_violet,
             Colors.dark_cornflower_blue,
             Colors.meat_brown,
             Colors.peach,
-        ],
-        as_cmap=True,
-    )
+        ]
+    return sns.color_palette(colors, as_cmap=True)
 
 
 # ------------------------------------------------------------------------------------------------ #
 #                                            CANVAS                                                #
 # ------------------------------------------------------------------------------------------------ #
+# rcParams of each style and palette, shared by all canvases with that configuration.
+_styles = LRUCache(maxsize=32)
 
 
 @dataclass
 class SeabornCanvas(Canvas):
-    """SeabornCanvas class encapsulating figure level configuration."""
+    """SeabornCanvas class encapsulating figure level configuration.
+
+    Figures are owned by the canvas. Beyond max_figures live figures, the least recently
+    created is closed. Used as a context manager, the canvas closes every figure created
+    within the block on exit.
+
+    On interactive backends, including Jupyter's inline backend, figures are managed by
+    pyplot, so notebooks and plt.show display them. On non-interactive backends, such as Agg
+    in batch rendering and services, they are created through the object-oriented Figure
+    API, outside pyplot's figure manager, and are displayed only through show. Set managed
+    to override the choice.
+
+    The style and palette are applied to each plot through an rc_context, rather than by
+    changing matplotlib's global rcParams.
+    """
 
     width: int = 12  # The maximum width of the canvas
     height: int = 4  # The height of a single row.
     maxcols: int = 2  # The maximum number of columns in a multi-plot visualization.
     color = Colors().dark_blue
-    palette = Palettes().blues_r  # Seaborn palette or matplotlib colormap
+    palette: Union[str, list] = Palettes().blues_r  # Seaborn palette or colormap
     style: str = "whitegrid"  # A Seaborn aesthetic
     saturation: float = 0.5
     fontsize: int = 10
     fontsize_title: int = 16
     colors: Colors = Colors()
     palettes: Palettes = Palettes()
+    aggregate_threshold: int = 100000  # Rows above which points are binned.
+    gridsize: int = 200  # Number of cells along each axis of a density grid.
+    max_figures: int = 20  # Live figures kept before the oldest is closed.
+    heatmap_threshold: int = 2500  # Cells above which heatmaps are rasterized.
+    managed: bool = None  # Whether pyplot manages figures. Default: if interactive.
+    _figures: OrderedDict = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    _scopes: list = field(default_factory=list, init=False, repr=False, compare=False)
+
+    def __enter__(self) -> SeabornCanvas:
+        self._scopes.append(set())
+        return self
+
+    def __exit__(self, *args) -> None:
+        for key in self._scopes.pop():
+            figure = self._figures.pop(key, None)
+            if figure is not None:
+                self._release(figure)
+
+    @property
+    def rc(self) -> dict:
+        """Returns the rcParams of the style and palette, computed once per configuration."""
+        try:
+            key = (self.style, freeze(self.palette))
+        except TypeError:
+            return self._rc(self.style, self.palette)
+        rc = _styles.get(key)
+        if rc is None:
+            rc = self._rc(self.style, self.palette)
+            _styles.put(key, rc)
+        return rc
+
+    def context(self) -> mpl.rc_context:
+        """Returns a context in which matplotlib uses the style and palette of the canvas."""
+        return mpl.rc_context(self.rc)
+
+    @property
+    def figures(self) -> List[Figure]:
+        """Returns the live figures, from least to most recently used."""
+        return list(self._figures.values())
+
+    def figure(self, **kwargs) -> Figure:
+        """Creates a figure owned by the canvas. Keyword arguments are passed to Figure."""
+        managed = self.managed if self.managed is not None else _interactive()
+        return self.register(plt.figure(**kwargs) if managed else Figure(**kwargs))
+
+    def show(self, figure: Figure = None) -> None:
+        """Displays a figure or, if none is given, all live figures of the canvas.
+
+        Figures created outside pyplot first take over the manager of a new pyplot figure,
+        so that the backend can display them.
+        """
+        figures = self.figures if figure is None else [figure]
+        for figure in figures:
+            if figure.canvas.manager is None:
+                manager = plt.figure(figsize=figure.get_size_inches()).canvas.manager
+                manager.canvas.figure = figure
+                figure.set_canvas(manager.canvas)
+        plt.show()
+
+    def register(self, figure: Figure) -> Figure:
+        """Takes ownership of a figure, closing the least recently used beyond max_figures."""
+        key = id(figure)
+        self._figures[key] = figure
+        self._figures.move_to_end(key)
+        for scope in self._scopes:
+            scope.add(key)
+        while len(self._figures) > self.max_figures:
+            _, oldest = self._figures.popitem(last=False)
+            self._release(oldest)
+        return figure
+
+    def close(self, figure: Figure = None) -> None:
+        """Closes a figure owned by the canvas or, if none is given, all of them."""
+        figures = self.figures if figure is None else [figure]
+        for figure in figures:
+            self._figures.pop(id(figure), None)
+            self._release(figure)
 
     def get_figaxes(
         self, nplots: int = 1, figsize: tuple = None
@@ -106,12 +242,13 @@ class SeabornCanvas(Canvas):
         figsize = figsize or (self.width, self.height)
 
         if nplots == 1:
-            fig, axes = plt.subplots(figsize=figsize)
+            fig = self.figure(figsize=figsize)
+            axes = fig.subplots()
         else:
             nrows = math.ceil(nplots / self.maxcols)
             ncols = min(self.maxcols, nplots)
 
-            fig = plt.figure(layout="constrained", figsize=figsize)
+            fig = self.figure(layout="constrained", figsize=figsize)
             gs = GridSpec(nrows=nrows, ncols=ncols, figure=fig)
 
             axes = []
@@ -127,14 +264,106 @@ class SeabornCanvas(Canvas):
 
         return fig, axes
 
+    @staticmethod
+    def _rc(style: str, palette) -> dict:
+        """Returns the rcParams that sns.set_style and sns.set_palette would set."""
+        rc = dict(sns.axes_style(style))
+        rc["axes.prop_cycle"] = cycler(color=sns.color_palette(palette))
+        return rc
+
+    @staticmethod
+    def _release(figure: Figure) -> None:
+        """Closes a figure, including any pyplot manager, and frees its artists."""
+        plt.close(figure)
+        figure.clear()
+
+
+def _interactive() -> bool:
+    """Returns whether the matplotlib backend displays figures."""
+    try:
+        from matplotlib.backends import BackendFilter, backend_registry
+
+        non_interactive = backend_registry.list_builtin(BackendFilter.NON_INTERACTIVE)
+    except ImportError:  # matplotlib < 3.9
+        from matplotlib.rcsetup import non_interactive_bk as non_interactive
+    return plt.get_backend().lower() not in [
+        backend.lower() for backend in non_interactive
+    ]
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     HYPOTHESIS TESTS                                             #
+# ------------------------------------------------------------------------------------------------ #
+# Test statistic distributions and the probabilities bounding the plotted range of each.
+HYPOTHESIS_DISTRIBUTIONS = {
+    "t": (stats.t, 0.001, 0.999),
+    "chi2": (stats.chi2, 0.01, 0.99),
+    "kstwo": (stats.kstwo, 0.001, 0.999),
+}
+
+
+@functools.lru_cache(maxsize=128)
+def hypothesis_grid(
+    distribution: str, dof: int, alpha: float, tails: int = 2, num_points: int = 256
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Tuple[float, float]]:
+    """Returns the pdf of a test distribution on a grid, its reject region and critical values.
+
+    The grid combines points evenly spaced in value with points evenly spaced in probability,
+    so it is dense where the density is high, and includes the critical values, so the
+    reject region is shaded exactly to them. Results are cached and read-only.
+
+    Args:
+        distribution (str): One of 't', 'chi2' or 'kstwo'.
+        dof (int): Degrees of freedom, or the sample size for 'kstwo'.
+        alpha (float): The statistical significance.
+        tails (int): 2 for a two-tailed test, with alpha split between the tails, or 1 for an
+            upper-tailed test. Default = 2
+        num_points (int): Number of points of each kind in the grid. Default = 256
+
+    Returns:
+        Grid, pdf, boolean mask of the reject region, and the lower and upper critical
+        values. The lower critical value is None for an upper-tailed test.
+    """
+    dist, lower, upper = HYPOTHESIS_DISTRIBUTIONS[distribution]
+    tail = alpha / tails
+    critical = (dist.ppf(tail, dof) if tails == 2 else None, dist.ppf(1 - tail, dof))
+    x = np.concatenate(
+        [
+            np.linspace(dist.ppf(lower, dof), dist.ppf(upper, dof), num_points),
+            dist.ppf(np.linspace(lower, upper, num_points), dof),
+            [value for value in critical if value is not None],
+        ]
+    )
+    x = np.unique(x[np.isfinite(x)])
+    y = dist.pdf(x, dof)
+    reject = x >= critical[1]
+    if critical[0] is not None:
+        reject |= x <= critical[0]
+    for array in (x, y, reject):
+        array.setflags(write=False)
+    return x, y, reject, critical
+
+
+# ------------------------------------------------------------------------------------------------ #
+def styled(method: Callable) -> Callable:
+    """Renders a plot within the style and palette context of the visualizer's canvas."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._canvas.context():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
 
 # ------------------------------------------------------------------------------------------------ #
 class Visualizer(VisualizerABC):  # pragma: no cover
     """Wrapper for Seaborn plotizations."""
 
-    def __init__(self, canvas: SeabornCanvas = SeabornCanvas()):
-        super().__init__(canvas)
+    def __init__(self, canvas: SeabornCanvas = None):
+        super().__init__(canvas or SeabornCanvas())
 
+    @styled
     def lineplot(
         self,
         *args,
@@ -190,6 +419,7 @@ class Visualizer(VisualizerABC):  # pragma: no cover
 
         return ax
 
+    @styled
     def scatterplot(
         self,
         *args,
@@ -200,6 +430,7 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         title: str = None,
         figsize: bool = (12, 4),
         ax: plt.Axes = None,
+        aggregate: bool = None,
         **kwargs,
     ) -> plt.Axes:
         """Draw a scatter plot with possibility of several semantic groupings.
@@ -211,6 +442,9 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         often ineffective. Using redundant semantics (i.e. both hue and style for the same variable)
         can be helpful for making graphics more accessible.
 
+        Above the canvas aggregate_threshold number of rows, points are binned into a 2D
+        density grid and rendered as an image, rather than drawn one by one.
+
         Args: Args:
             data (Union[pd.DataFrame, np.ndarray]): Input data structure. Either a long-form
                 collection of vectors that can be assigned to named variables or a wide-form dataset
@@ -220,6 +454,8 @@ class Visualizer(VisualizerABC):  # pragma: no cover
             title (str): Title for the plot. Optional
             figsize (tuple): Size of figure in inches. Ignored if ax is provided.
             ax: (plt.Axes): A matplotlib Axes object. Optional. If not provide, one will be obtained from the canvas.
+            aggregate (bool): Whether to render a density grid. Defaults to True above the
+                canvas aggregate_threshold number of rows.
 
 
         """
@@ -230,21 +466,28 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         if ax is None:
             _, ax = self._canvas.get_figaxes(figsize=figsize)
 
-        ax = sns.scatterplot(
-            data=data,
-            x=x,
-            y=y,
-            hue=hue,
-            ax=ax,
-            palette=palette,
-            *args,
-            **kwargs,
-        )
+        if self._aggregates(data=data, aggregate=aggregate):
+            self._ignored("scatterplot", args=args, kwargs=kwargs, used=("alpha",))
+            ax = self._density(
+                ax=ax, data=data, x=x, y=y, hue=hue, alpha=kwargs.get("alpha")
+            )
+        else:
+            ax = sns.scatterplot(
+                data=data,
+                x=x,
+                y=y,
+                hue=hue,
+                ax=ax,
+                palette=palette,
+                *args,
+                **kwargs,
+            )
         if title is not None:
             _ = ax.set_title(title)
 
         return ax
 
+    @styled
     def histogram(
         self,
         *args,
@@ -259,6 +502,7 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         title: str = None,
         figsize: bool = (12, 4),
         ax: plt.Axes = None,
+        aggregate: bool = None,
         **kwargs,
     ) -> None:
         """Draw a scatter plot with possibility of several semantic groupings.
@@ -283,6 +527,9 @@ class Visualizer(VisualizerABC):  # pragma: no cover
                 See https://seaborn.pydata.org/generated/seaborn.histplot.html for valid values.
             element (str): Visual representation of the histogram statistic. Only relevant with univariate data. Optional. Default is 'bars'. fill (bool): If True, fill in the space under the histogram. Only relevant with univariate data.
             ax: (plt.Axes): A matplotlib Axes object. Optional. If not provide, one will be obtained from the canvas.
+            aggregate (bool): Whether to count bins in a single vectorized pass, chunk by chunk,
+                rather than through seaborn. Defaults to True for an iterable of chunks or more
+                rows than the canvas aggregate_threshold. Univariate only.
 
 
         """
@@ -293,6 +540,44 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         if ax is None:
             _, ax = self._canvas.get_figaxes(figsize=figsize)
 
+        if y is None and self._aggregates(data=data, aggregate=aggregate):
+            bins = kwargs.get("bins", 64)
+            bins = bins if isinstance(bins, int) else 64
+            histograms = self._accumulate(
+                data=data,
+                x=x,
+                hue=hue,
+                factories=(lambda: StreamingHistogram(16 * bins),),
+            )
+            total = sum(histogram.n for histogram, in histograms.values())
+            for level, (histogram,), color in self._colored(histograms, hue=hue):
+                counts, edges = histogram.rebin(bins)
+                heights = histogram_stat(counts, edges, stat=stat)
+                if stat not in ("count", "frequency"):
+                    heights = heights * histogram.n / total
+                if element == "poly":
+                    ax.plot(
+                        (edges[:-1] + edges[1:]) / 2, heights, color=color, label=level
+                    )
+                else:
+                    ax.stairs(
+                        heights,
+                        edges,
+                        fill=fill,
+                        color=color,
+                        alpha=0.5 if fill and hue is not None else None,
+                        label=level,
+                    )
+            ax.set_xlabel(x)
+            ax.set_ylabel(stat.capitalize())
+            if hue is not None:
+                ax.legend(title=hue)
+            if annotate:
+                ax = self._annotate(ax=ax, data=histograms, x=x)
+            if title is not None:
+                _ = ax.set_title(title)
+            return ax
+
         ax = sns.histplot(
             data=data,
             x=x,
@@ -315,6 +600,7 @@ class Visualizer(VisualizerABC):  # pragma: no cover
 
         return ax
 
+    @styled
     def boxplot(
         self,
         *args,
@@ -369,6 +655,7 @@ class Visualizer(VisualizerABC):  # pragma: no cover
 
         return ax
 
+    @styled
     def countplot(
         self,
         *args,
@@ -379,6 +666,7 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         orient: str = None,
         order_by_count: bool = False,
         plot_counts: bool = False,
+        top: int = None,
         title: str = None,
         figsize: bool = (12, 4),
         rotate_ticks: Tuple[str, int] = None,
@@ -401,10 +689,13 @@ class Visualizer(VisualizerABC):  # pragma: no cover
                 when both x and y are numeric or when plotting wide-form data.
             order_by_count (bool): If True, bars are ordered by counts.
             plot_counts (bool): If True, the bars are annotated with absolute and relative counts. Default = False
+            top (int): If given, only the top levels by count are drawn, with the remainder
+                combined in a final 'Other' bar. Optional.
             title (str): Title for the plot. Optional
             figsize (tuple): Size of figure in inches. Ignored if ax is provided.
             rotate_ticks (Tuple[str,int]): Tuple containing the axis and degrees of rotation. Default is None
             ax: (plt.Axes): A matplotlib Axes object. Optional. If not provide, one will be obtained from the canvas.
+            kwargs: Passed to matplotlib's bar or barh.
 
         """
 
@@ -418,47 +709,43 @@ class Visualizer(VisualizerABC):  # pragma: no cover
             else:
                 orient = "v"
 
-        if order_by_count:
-            col = x if x is not None else y
-            order = data[col].value_counts().index
-        else:
-            order = None
-
         if ax is None:
             _, ax = self._canvas.get_figaxes(figsize=figsize)
 
-        ax = sns.countplot(
-            data=data,
-            x=x,
-            y=y,
-            hue=hue,
+        col = x if x is not None else y
+        labels, counts, hue_levels = self._counts(
+            data=data, col=col, hue=hue, top=top, order_by_count=order_by_count
+        )
+        positions = np.arange(len(labels))
+        containers = self._count_bars(
             ax=ax,
-            order=order,
+            counts=counts,
+            hue_levels=hue_levels,
+            orient=orient,
             palette=palette,
-            *args,
             **kwargs,
         )
+        if hue is not None:
+            ax.legend(title=hue)
+
+        if orient == "v":
+            ax.set_xticks(positions, labels)
+            ax.set_xlabel(col)
+            ax.set_ylabel("count")
+        else:
+            ax.set_yticks(positions, labels)
+            ax.set_ylabel(col)
+            ax.set_xlabel("count")
+            ax.invert_yaxis()
 
         if plot_counts:
-            if orient == "v":
-                for p in ax.patches:
-                    x = p.get_bbox().get_points()[:, 0]
-                    y = p.get_bbox().get_points()[1, 1]
-                    ax.annotate(
-                        text=f"{round(y,0)}\n({round(y/total*100,1)}%)",
-                        xy=(x.mean(), y),
-                        ha="center",
-                        va="bottom",
-                    )
-            else:
-                for p in ax.patches:
-                    x = p.get_x() + p.get_width()
-                    y = p.get_y() + p.get_height() / 2
-                    ax.annotate(
-                        text=f"{round(p.get_width(),0)} ({round(p.get_width()/total*100,1)}%)",
-                        xy=(x, y),
-                        va="center",
-                    )
+            sep = "\n" if orient == "v" else " "
+            for container, values in zip(containers, counts.T):
+                percents = np.round(values / total * 100, 1)
+                ax.bar_label(
+                    container,
+                    labels=[f"{v}{sep}({p}%)" for v, p in zip(values, percents)],
+                )
 
         if rotate_ticks is not None:
             try:
@@ -475,6 +762,7 @@ class Visualizer(VisualizerABC):  # pragma: no cover
 
         return ax
 
+    @styled
     def barplot(
         self,
         *args,
@@ -544,10 +832,11 @@ class Visualizer(VisualizerABC):  # pragma: no cover
             _ = ax.set_title(title)
 
         if hue is not None:
-            plt.legend(loc="upper right")
+            ax.legend(loc="upper right")
 
         return ax
 
+    @styled
     def kdeplot(
         self,
         *args,
@@ -558,6 +847,7 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         title: str = None,
         figsize: bool = (12, 4),
         ax: plt.Axes = None,
+        aggregate: bool = None,
         **kwargs,
     ) -> plt.Axes:
         """Plot univariate or bivariate distributions using kernel density estimation.
@@ -575,6 +865,10 @@ class Visualizer(VisualizerABC):  # pragma: no cover
             title (str): Title for the plot. Optional
             figsize (tuple): Size of figure in inches. Ignored if ax is provided.
             ax: (plt.Axes): A matplotlib Axes object. Optional. If not provide, one will be obtained from the canvas.
+            aggregate (bool): Whether to estimate the density from binned data by FFT
+                convolution, chunk by chunk, rather than through seaborn. Defaults to True for
+                an iterable of chunks or more rows than the canvas aggregate_threshold.
+                Univariate only; bw_adjust, cut, cumulative and fill are honored.
 
 
         """
@@ -585,6 +879,28 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         if ax is None:
             _, ax = self._canvas.get_figaxes(figsize=figsize)
 
+        if y is None and self._aggregates(data=data, aggregate=aggregate):
+            histograms = self._accumulate(data=data, x=x, hue=hue)
+            total = sum(histogram.n for histogram, in histograms.values())
+            for level, (histogram,), color in self._colored(histograms, hue=hue):
+                # Each level is scaled by its share of the data, as with common_norm.
+                scale = histogram.n / total
+                self._kde(
+                    ax=ax,
+                    histogram=histogram,
+                    color=color,
+                    label=level,
+                    scale=scale,
+                    **kwargs,
+                )
+            ax.set_xlabel(x)
+            ax.set_ylabel("Density")
+            if hue is not None:
+                ax.legend(title=hue)
+            if title is not None:
+                _ = ax.set_title(title)
+            return ax
+
         ax = sns.kdeplot(
             data=data,
             x=x,
@@ -600,6 +916,7 @@ class Visualizer(VisualizerABC):  # pragma: no cover
 
         return ax
 
+    @styled
     def kdebox_one(
         self,
         *args,
@@ -608,6 +925,7 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         title: str = None,
         figsize: bool = (12, 4),
         annotate: bool = True,
+        aggregate: bool = None,
         **kwargs,
     ) -> plt.Axes:
         """A figure level visualization for univariate distributions.
@@ -629,6 +947,9 @@ class Visualizer(VisualizerABC):  # pragma: no cover
             title (str): Title for the plot. Optional
             figsize (tuple): Size of figure in inches. Ignored if ax is provided.
             annotate (bool): Whether to annotate plot with min, max, and mean
+            aggregate (bool): Whether to draw the KDE from binned data and the boxen plot from
+                a quantile sketch, chunk by chunk. Defaults to True for an iterable of chunks
+                or more rows than the canvas aggregate_threshold.
 
 
         """
@@ -636,37 +957,53 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         data = data if data is not None else self._data
         title = title or self.autotitle(x)
 
-        fig, axes = plt.subplots(
+        fig = self._canvas.figure(figsize=figsize)
+        axes = fig.subplots(
             nrows=2,
             ncols=1,
             gridspec_kw={"height_ratios": [3, 1]},
-            figsize=figsize,
             sharex=True,
         )
+        ax = axes[0]
+
+        if self._aggregates(data=data, aggregate=aggregate):
+            ((histogram, sketch),) = self._accumulate(
+                data=data,
+                x=x,
+                factories=(lambda: StreamingHistogram(KDE_BINS), QuantileSketch),
+            ).values()
+            color = self._canvas.colors.dark_blue
+            self._kde(ax=axes[0], histogram=histogram, color=color, **kwargs)
+            axes[0].set_ylabel("Density")
+            if annotate:
+                ax = self._annotate(ax=axes[0], data=histogram, x=x)
+            self._boxen(ax=axes[1], sketch=sketch, color=color)
+            axes[1].set_xlabel(x)
+        else:
+            # Density Plot
+            axes[0] = sns.kdeplot(
+                data=data,
+                x=x,
+                ax=axes[0],
+                palette=palette,
+                *args,
+                **kwargs,
+            )
 
-        # Density Plot
-        axes[0] = sns.kdeplot(
-            data=data,
-            x=x,
-            ax=axes[0],
-            palette=palette,
-            *args,
-            **kwargs,
-        )
-
-        # Annotations
-        if annotate:
-            ax = self._annotate(ax=axes[0], data=data, x=x)
+            # Annotations
+            if annotate:
+                ax = self._annotate(ax=axes[0], data=data, x=x)
 
-        # Boxen Plot
-        axes[1] = sns.boxenplot(data=data, x=x, orient="h")
+            # Boxen Plot
+            axes[1] = sns.boxenplot(data=data, x=x, orient="h", ax=axes[1])
 
         if title is not None:
             _ = fig.suptitle(title, weight="bold")
 
-        plt.tight_layout()
+        fig.tight_layout()
         return ax
 
+    @styled
     def ecdfplot(
         self,
         *args,
@@ -677,6 +1014,7 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         title: str = None,
         figsize: bool = (12, 4),
         ax: plt.Axes = None,
+        aggregate: bool = None,
         **kwargs,
     ) -> None:
         """Plot empirical cumulative distribution functions.
@@ -698,6 +1036,9 @@ class Visualizer(VisualizerABC):  # pragma: no cover
             title (str): Title for the plot. Optional
             figsize (tuple): Size of figure in inches. Ignored if ax is provided.
             ax: (plt.Axes): A matplotlib Axes object. Optional. If not provide, one will be obtained from the canvas.
+            aggregate (bool): Whether to draw the ECDF from a quantile sketch, chunk by chunk,
+                rather than from every observation. Defaults to True for an iterable of chunks
+                or more rows than the canvas aggregate_threshold. Univariate only.
 
         """
         palette = self._canvas.palette if hue is not None else "Blues_r"
@@ -707,6 +1048,21 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         if ax is None:
             _, ax = self._canvas.get_figaxes(figsize=figsize)
 
+        if y is None and self._aggregates(data=data, aggregate=aggregate):
+            sketches = self._accumulate(
+                data=data, x=x, hue=hue, factories=(QuantileSketch,)
+            )
+            for level, (sketch,), color in self._colored(sketches, hue=hue):
+                values, proportions = sketch.ecdf()
+                ax.step(values, proportions, where="post", color=color, label=level)
+            ax.set_xlabel(x)
+            ax.set_ylabel("Proportion")
+            if hue is not None:
+                ax.legend(title=hue)
+            if title is not None:
+                _ = ax.set_title(title)
+            return ax
+
         ax = sns.ecdfplot(
             data=data,
             x=x,
@@ -722,6 +1078,7 @@ class Visualizer(VisualizerABC):  # pragma: no cover
 
         return ax
 
+    @styled
     def violinplot(
         self,
         *args,
@@ -776,6 +1133,7 @@ class Visualizer(VisualizerABC):  # pragma: no cover
 
         return ax
 
+    @styled
     def regplot(
         self,
         *args,
@@ -785,10 +1143,14 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         title: str = None,
         figsize: bool = (12, 4),
         ax: plt.Axes = None,
+        aggregate: bool = None,
         **kwargs,
     ) -> plt.Axes:
         """Plot data and a linear regression model fit.
 
+        Above the canvas aggregate_threshold number of rows, the points are rendered as a
+        density grid and the least squares fit is drawn without a confidence interval.
+
         Args:
             data (Union[pd.DataFrame, np.ndarray]): Input data structure. Either a long-form
                 collection of vectors that can be assigned to named variables or a wide-form dataset
@@ -797,6 +1159,8 @@ class Visualizer(VisualizerABC):  # pragma: no cover
             title (str): Title for the plot. Optional
             figsize (tuple): Size of figure in inches. Ignored if ax is provided.
             ax: (plt.Axes): A matplotlib Axes object. Optional. If not provide, one will be obtained from the canvas.
+            aggregate (bool): Whether to render a density grid. Defaults to True above the
+                canvas aggregate_threshold number of rows.
 
 
         """
@@ -806,21 +1170,32 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         if ax is None:
             fig, ax = self._canvas.get_figaxes(figsize=figsize)
 
-        ax = sns.regplot(
-            data=data,
-            x=x,
-            y=y,
-            ax=ax,
-            fit_reg=True,
-            color=self._canvas.colors.dark_blue,
-            *args,
-            **kwargs,
-        )
+        if self._aggregates(data=data, aggregate=aggregate):
+            self._ignored("regplot", args=args, kwargs=kwargs, used=("alpha", "order"))
+            ax = self._density(ax=ax, data=data, x=x, y=y, alpha=kwargs.get("alpha"))
+            xv = data[x].to_numpy(dtype=np.float64)
+            yv = data[y].to_numpy(dtype=np.float64)
+            valid = np.isfinite(xv) & np.isfinite(yv)
+            coef = np.polyfit(xv[valid], yv[valid], deg=kwargs.get("order", 1))
+            xfit = np.linspace(xv[valid].min(), xv[valid].max(), 100)
+            ax.plot(xfit, np.polyval(coef, xfit), color=self._canvas.colors.orange)
+        else:
+            ax = sns.regplot(
+                data=data,
+                x=x,
+                y=y,
+                ax=ax,
+                fit_reg=True,
+                color=self._canvas.colors.dark_blue,
+                *args,
+                **kwargs,
+            )
         if title is not None:
             _ = ax.set_title(title)
 
         return ax
 
+    @styled
     def pdfcdfplot(
         self,
         *args,
@@ -829,6 +1204,7 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         y: str = None,
         title: str = None,
         figsize: bool = (12, 4),
+        aggregate: bool = None,
         **kwargs,
     ) -> plt.Figure:
         """Renders a combination of the probabiity density and cumulative distribution functions.
@@ -843,32 +1219,55 @@ class Visualizer(VisualizerABC):  # pragma: no cover
             x,y (str): Keys in data.numeric, although color mapping will behave differently in latter case.
             title (str): Title for the plot. Optional
             figsize (tuple): Size of figure in inches. Ignored if ax is provided.
+            aggregate (bool): Whether to estimate both functions from a single binned pass,
+                chunk by chunk. Defaults to True for an iterable of chunks or more rows than
+                the canvas aggregate_threshold.
         """
         data = data if data is not None else self._data
         title = title or self.autotitle(x, y)
 
         fig, ax1 = self._canvas.get_figaxes(figsize=figsize)
 
-        ax1 = sns.kdeplot(
-            data=data,
-            x=x,
-            y=y,
-            color=self._canvas.colors.dark_blue,
-            ax=ax1,
-            label="Probability Density Function",
-            legend=True,
-        )
-        ax2 = ax1.twinx()
-        ax2 = sns.kdeplot(
-            data=data,
-            x=x,
-            y=y,
-            cumulative=True,
-            ax=ax2,
-            color=self._canvas.colors.orange,
-            label="Cumulative Distribution Function",
-            legend=True,
-        )
+        if y is None and self._aggregates(data=data, aggregate=aggregate):
+            ((histogram,),) = self._accumulate(data=data, x=x).values()
+            self._kde(
+                ax=ax1,
+                histogram=histogram,
+                color=self._canvas.colors.dark_blue,
+                label="Probability Density Function",
+            )
+            ax2 = ax1.twinx()
+            self._kde(
+                ax=ax2,
+                histogram=histogram,
+                color=self._canvas.colors.orange,
+                label="Cumulative Distribution Function",
+                cumulative=True,
+            )
+            ax1.set_xlabel(x)
+            ax1.set_ylabel("Density")
+            ax2.set_ylabel("Density")
+        else:
+            ax1 = sns.kdeplot(
+                data=data,
+                x=x,
+                y=y,
+                color=self._canvas.colors.dark_blue,
+                ax=ax1,
+                label="Probability Density Function",
+                legend=True,
+            )
+            ax2 = ax1.twinx()
+            ax2 = sns.kdeplot(
+                data=data,
+                x=x,
+                y=y,
+                cumulative=True,
+                ax=ax2,
+                color=self._canvas.colors.orange,
+                label="Cumulative Distribution Function",
+                legend=True,
+            )
         title = "Probability Density Function and Cumulative Distribution Function"
 
         h1, l1 = ax1.get_legend_handles_labels()
@@ -878,10 +1277,9 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         fig.suptitle(title, fontsize=self._canvas.fontsize_title)
         fig.tight_layout()
 
-        plt.close()
-
         return fig
 
+    @styled
     def pairplot(
         self,
         *args,
@@ -890,6 +1288,10 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         hue: str = None,
         title: str = None,
         figsize: bool = (12, 4),
+        aggregate: bool = None,
+        off_diagonal: str = "density",
+        sample_size: int = 10000,
+        n_jobs: int = None,
         **kwargs,
     ) -> sns.PairGrid:
         """Plot pairwise relationships in a dataset.
@@ -911,12 +1313,33 @@ class Visualizer(VisualizerABC):  # pragma: no cover
             either categorical or numeric, although color mapping will behave differently in latter case.
             title (str): Title for the plot. Optional
             figsize (tuple): Size of figure in inches. Ignored if ax is provided.
+            aggregate (bool): Whether to render a scalable grid: pre-binned histograms on the
+                diagonal, density grids or a sample below it, and correlation coefficients
+                above it. Defaults to True above the canvas aggregate_threshold number of rows.
+            off_diagonal (str): For the scalable grid, 'density' for density grids or 'sample'
+                for scatter plots of a sample stratified by hue. Default = 'density'
+            sample_size (int): Size of the sample drawn for off_diagonal='sample'.
+                Default = 10000
+            n_jobs (int): Number of threads in which the cells of the scalable grid are
+                counted. Defaults to the ThreadPoolExecutor default.
 
 
         """
         palette = self._canvas.palette if hue is not None else "Blues_r"
         data = data if data is not None else self._data
 
+        if self._aggregates(data=data, aggregate=aggregate):
+            return self._pairgrid(
+                data=data,
+                include=include,
+                hue=hue,
+                title=title,
+                off_diagonal=off_diagonal,
+                sample_size=sample_size,
+                n_jobs=n_jobs,
+                **kwargs,
+            )
+
         g = sns.pairplot(
             data=data,
             vars=include,
@@ -925,12 +1348,14 @@ class Visualizer(VisualizerABC):  # pragma: no cover
             *args,
             **kwargs,
         )
+        self._canvas.register(g.figure)
         if title is not None:
             g.fig.suptitle(title)
         g.tight_layout()
 
         return g
 
+    @styled
     def jointplot(
         self,
         *args,
@@ -940,10 +1365,14 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         hue: str = None,
         title: str = None,
         figsize: bool = (12, 4),
+        aggregate: bool = None,
         **kwargs,
     ) -> sns.JointGrid:
         """Draw a plot of two variables with bivariate and univariate graphs.
 
+        Above the canvas aggregate_threshold number of rows, the joint distribution is
+        rendered as a density grid and the marginals as pre-binned histograms.
+
         Args:
             data (Union[pd.DataFrame, np.ndarray]): Input data structure. Either a long-form
                 collection of vectors that can be assigned to named variables or a wide-form dataset
@@ -952,6 +1381,8 @@ class Visualizer(VisualizerABC):  # pragma: no cover
             hue (str): Grouping variable that will produce lines with different colors. Can be either categorical or numeric, although color mapping will behave differently in latter case.
             title (str): Title for the plot. Optional
             figsize (tuple): Size of figure in inches. Ignored if ax is provided.
+            aggregate (bool): Whether to render a density grid. Defaults to True above the
+                canvas aggregate_threshold number of rows.
 
 
         """
@@ -960,21 +1391,53 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         data = data if data is not None else self._data
         title = title or self.autotitle(x, y)
 
-        g = sns.jointplot(
-            data=data,
-            x=x,
-            y=y,
-            hue=hue,
-            palette=palette,
-            *args,
-            **kwargs,
-        )
+        if self._aggregates(data=data, aggregate=aggregate):
+            self._ignored("jointplot", args=args, kwargs=kwargs, used=("alpha",))
+            g = sns.JointGrid()
+            self._density(
+                ax=g.ax_joint,
+                data=data,
+                x=x,
+                y=y,
+                hue=hue,
+                colorbar=False,
+                alpha=kwargs.get("alpha"),
+            )
+            bins = self._canvas.gridsize
+            for _, group, color in self._groups(data=data, hue=hue):
+                for var, ax, orientation in (
+                    (x, g.ax_marg_x, "vertical"),
+                    (y, g.ax_marg_y, "horizontal"),
+                ):
+                    values = group[var].to_numpy(dtype=np.float64)
+                    counts, edges = np.histogram(values[np.isfinite(values)], bins=bins)
+                    ax.stairs(
+                        counts,
+                        edges,
+                        fill=True,
+                        alpha=0.5,
+                        color=color,
+                        orientation=orientation,
+                    )
+            g.set_axis_labels(x, y)
+        else:
+            g = sns.jointplot(
+                data=data,
+                x=x,
+                y=y,
+                hue=hue,
+                palette=palette,
+                *args,
+                **kwargs,
+            )
+        self._canvas.register(g.figure)
         if title is not None:
             g.fig.suptitle(title)
         g.fig.tight_layout()
 
         return g
 
+    @styled
     def ttestplot(
         self,
         *args,
@@ -998,102 +1461,18 @@ class Visualizer(VisualizerABC):  # pragma: no cover
 
 
         """
-        if ax is None:
-            _, ax = self._canvas.get_figaxes(figsize=figsize)
-
-        # Render the probability distribution
-        x = np.linspace(stats.t.ppf(0.001, dof), stats.t.ppf(0.999, dof), 500)
-        y = stats.t.pdf(x, dof)
-        ax = sns.lineplot(x=x, y=y, markers=False, dashes=False, sort=True, ax=ax)
-
-        # Compute reject region
-        lower = x[0]
-        upper = x[-1]
-        lower_alpha = alpha / 2
-        upper_alpha = 1 - (alpha / 2)
-        lower_critical = stats.t.ppf(lower_alpha, dof)
-        upper_critical = stats.t.ppf(upper_alpha, dof)
-
-        # Fill lower tail
-        xlower = np.arange(lower, lower_critical, 0.001)
-        ax.fill_between(
-            x=xlower,
-            y1=0,
-            y2=stats.t.pdf(xlower, dof),
-            color=self._canvas.colors.orange,
-        )
-
-        # Fill Upper Tail
-        xupper = np.arange(upper_critical, upper, 0.001)
-        ax.fill_between(
-            x=xupper,
-            y1=0,
-            y2=stats.t.pdf(xupper, dof),
-            color=self._canvas.colors.orange,
-        )
-
-        # Plot the statistic
-        line = ax.lines[0]
-        xdata = line.get_xydata()[:, 0]
-        ydata = line.get_xydata()[:, 1]
-        statistic = round(statistic, 4)
-
-        try:
-            idx = np.where(xdata > statistic)[0][0]
-            x = xdata[idx]
-            y = ydata[idx]
-            _ = sns.regplot(
-                x=np.array([x]),
-                y=np.array([y]),
-                scatter=True,
-                fit_reg=False,
-                marker="o",
-                scatter_kws={"s": 100},
-                ax=ax,
-                color=self._canvas.colors.dark_blue,
-            )
-            ytext = 10
-            if np.isclose(statistic, 0, atol=1e-1):
-                ytext *= -2
-
-            ax.annotate(
-                f"t = {str(statistic)}",
-                (x, y),
-                textcoords="offset points",
-                xytext=(0, ytext),
-                ha="center",
-            )
-        except IndexError:
-            pass
-
-        ax.annotate(
-            "Critical Value",
-            (lower_critical, 0),
-            textcoords="offset points",
-            xytext=(20, 15),
-            ha="left",
-            arrowprops={"width": 2, "headwidth": 4, "shrink": 0.05},
-        )
-
-        ax.annotate(
-            "Critical Value",
-            (upper_critical, 0),
-            xycoords="data",
-            textcoords="offset points",
-            xytext=(-20, 15),
-            ha="right",
-            arrowprops={"width": 2, "headwidth": 4, "shrink": 0.05},
-        )
-
-        _ = ax.set_title(
-            f"{title}",
-            fontsize=self._canvas.fontsize_title,
+        return self._hypothesisplot(
+            distribution="t",
+            dof=dof,
+            statistic=statistic,
+            alpha=alpha,
+            label="t",
+            title=title,
+            figsize=figsize,
+            ax=ax,
         )
 
-        plt.tight_layout()
-
-        return ax
-
+    @styled
     def x2testplot(
         self,
         *args,
@@ -1105,78 +1484,21 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         ax: plt.Axes = None,
         **kwargs,
     ) -> plt.Axes:
-        if ax is None:
-            _, ax = self._canvas.get_figaxes(figsize=figsize)
-
-        # Render the probability distribution
-        x = np.linspace(stats.chi2.ppf(0.01, dof), stats.chi2.ppf(0.99, dof), 100)
-        y = stats.chi2.pdf(x, dof)
-        ax = sns.lineplot(x=x, y=y, markers=False, dashes=False, sort=True, ax=ax)
-
-        # Compute reject region
-        upper = x[-1]
-        upper_alpha = 1 - alpha
-        critical = stats.chi2.ppf(upper_alpha, dof)
-
-        # Fill Upper Tail
-        x = np.arange(critical, upper, 0.001)
-        ax.fill_between(
-            x=x,
-            y1=0,
-            y2=stats.chi2.pdf(x, dof),
-            color=self._canvas.colors.orange,
-        )
-
-        # Plot the statistic
-        line = ax.lines[0]
-        xdata = line.get_xydata()[:, 0]
-        ydata = line.get_xydata()[:, 1]
-        statistic = round(statistic, 4)
-        try:
-            idx = np.where(xdata > statistic)[0][0]
-            x = xdata[idx]
-            y = ydata[idx]
-            _ = sns.regplot(
-                x=np.array([x]),
-                y=np.array([y]),
-                scatter=True,
-                fit_reg=False,
-                marker="o",
-                scatter_kws={"s": 100},
-                ax=ax,
-                color=self._canvas.colors.dark_blue,
-            )
-            ax.annotate(
-                rf"$X^2$ = {str(statistic)}",
-                (x, y),
-                textcoords="offset points",
-                xytext=(0, 20),
-                ha="center",
-            )
-        except IndexError:
-            pass
-
-        ax.annotate(
-            "Critical Value",
-            (critical, 0),
-            xycoords="data",
-            textcoords="offset points",
-            xytext=(-20, 15),
-            ha="right",
-            arrowprops={"width": 2, "headwidth": 4, "shrink": 0.05},
-        )
-
-        _ = ax.set_title(
-            f"{title}",
-            fontsize=self._canvas.fontsize_title,
+        return self._hypothesisplot(
+            distribution="chi2",
+            dof=dof,
+            statistic=statistic,
+            alpha=alpha,
+            tails=1,
+            label=r"$X^2$",
+            xlabel=r"$X^2$",
+            ylabel="Probability Density",
+            title=title,
+            figsize=figsize,
+            ax=ax,
         )
 
-        ax.set_xlabel(r"$X^2$")
-        ax.set_ylabel("Probability Density")
-        plt.tight_layout()
-
-        return ax
-
+    @styled
     def kstestplot(
         self,
         *args,
@@ -1200,102 +1522,18 @@ class Visualizer(VisualizerABC):  # pragma: no cover
 
 
         """
-        if ax is None:
-            _, ax = self._canvas.get_figaxes(figsize=figsize)
-
-        # Render the probability distribution
-        x = np.linspace(stats.kstwo.ppf(0.001, n), stats.kstwo.ppf(0.999, n), 500)
-        y = stats.kstwo.pdf(x, n)
-        ax = sns.lineplot(x=x, y=y, markers=False, dashes=False, sort=True, ax=ax)
-
-        # Compute reject region
-        lower = x[0]
-        upper = x[-1]
-        lower_alpha = alpha / 2
-        upper_alpha = 1 - (alpha / 2)
-        lower_critical = stats.kstwo.ppf(lower_alpha, n)
-        upper_critical = stats.kstwo.ppf(upper_alpha, n)
-
-        # Fill lower tail
-        xlower = np.arange(lower, lower_critical, 0.001)
-        ax.fill_between(
-            x=xlower,
-            y1=0,
-            y2=stats.kstwo.pdf(xlower, n),
-            color=self._canvas.colors.orange,
-        )
-
-        # Fill Upper Tail
-        xupper = np.arange(upper_critical, upper, 0.001)
-        ax.fill_between(
-            x=xupper,
-            y1=0,
-            y2=stats.kstwo.pdf(xupper, n),
-            color=self._canvas.colors.orange,
-        )
-
-        # Plot the statistic
-        line = ax.lines[0]
-        xdata = line.get_xydata()[:, 0]
-        ydata = line.get_xydata()[:, 1]
-        statistic = round(statistic, 4)
-
-        try:
-            idx = np.where(xdata > statistic)[0][0]
-            x = xdata[idx]
-            y = ydata[idx]
-            _ = sns.regplot(
-                x=np.array([x]),
-                y=np.array([y]),
-                scatter=True,
-                fit_reg=False,
-                marker="o",
-                scatter_kws={"s": 100},
-                ax=ax,
-                color=self._canvas.colors.dark_blue,
-            )
-            ytext = 10
-            if np.isclose(statistic, 0, atol=1e-1):
-                ytext *= -2
-
-            ax.annotate(
-                f"t = {str(statistic)}",
-                (x, y),
-                textcoords="offset points",
-                xytext=(0, ytext),
-                ha="center",
-            )
-        except IndexError:
-            pass
-
-        ax.annotate(
-            "Critical Value",
-            (lower_critical, 0),
-            textcoords="offset points",
-            xytext=(20, 15),
-            ha="left",
-            arrowprops={"width": 2, "headwidth": 4, "shrink": 0.05},
-        )
-
-        ax.annotate(
-            "Critical Value",
-            (upper_critical, 0),
-            xycoords="data",
-            textcoords="offset points",
-            xytext=(-20, 15),
-            ha="right",
-            arrowprops={"width": 2, "headwidth": 4, "shrink": 0.05},
-        )
-
-        _ = ax.set_title(
-            f"{title}",
-            fontsize=self._canvas.fontsize_title,
+        return self._hypothesisplot(
+            distribution="kstwo",
+            dof=n,
+            statistic=statistic,
+            alpha=alpha,
+            label="D",
+            title=title,
+            figsize=figsize,
+            ax=ax,
         )
 
-        plt.tight_layout()
-
-        return ax
-
+    @styled
     def heatmap(
         self,
         *args,
@@ -1317,6 +1555,9 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         ax: plt.Axes = None,
         title: str = None,
         figsize: bool = (12, 4),
+        raster: bool = None,
+        cluster: bool = False,
+        blocks: int = None,
         **kwargs,
     ) -> plt.Axes:
         """Plot rectangular data as a color-encoded matrix.
@@ -1341,6 +1582,13 @@ class Visualizer(VisualizerABC):  # pragma: no cover
             ax (matplotlib.Axes): Axes in which to draw the plot, otherwise use the currently-active Axes.
             title (str): Title for the plot. Optional
             figsize (tuple): Size of figure in inches. Ignored if ax is provided.
+            raster (bool): Whether to draw the matrix as a single image, without annotations.
+                Defaults to True above the canvas heatmap_threshold number of cells.
+            cluster (bool): Whether to reorder rows and columns by hierarchical clustering. A
+                square matrix with matching labels, such as a correlation matrix, is ordered
+                once for both axes. Default = False
+            blocks (int): If given, the matrix is downsampled to at most this many blocks along
+                each axis, each the mean of its cells, for an overview of very large matrices.
             kwargs (dict): All other keyword arguments are passed to matplotlib.axes.Axes.pcolormesh().
 
         Returns: ax (matplotlib.Axes): Axes object with the heatmap.
@@ -1350,6 +1598,46 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         if ax is None:
             _, ax = self._canvas.get_figaxes(figsize=figsize)
 
+        data = pd.DataFrame(data)
+        if mask is not None:
+            data = data.mask(np.asarray(mask, dtype=bool))
+            mask = None
+        if cluster:
+            rows = cluster_order(data.to_numpy(dtype=np.float64))
+            if data.shape[0] == data.shape[1] and data.index.equals(data.columns):
+                cols = rows
+            else:
+                cols = cluster_order(data.to_numpy(dtype=np.float64).T)
+            data = data.iloc[rows, cols]
+        if blocks is not None and max(data.shape) > blocks:
+            values, rows, cols = block_mean(
+                data.to_numpy(dtype=np.float64), (blocks, blocks)
+            )
+            data = pd.DataFrame(
+                values, index=data.index[rows], columns=data.columns[cols]
+            )
+        if raster is None:
+            raster = data.size > self._canvas.heatmap_threshold
+
+        if raster:
+            ax = self._raster(
+                ax=ax,
+                data=data,
+                vmin=vmin,
+                vmax=vmax,
+                cmap=cmap,
+                robust=robust,
+                cbar=cbar,
+                cbar_kws=cbar_kws,
+                cbar_ax=cbar_ax,
+                square=square,
+                xticklabels=xticklabels,
+                yticklabels=yticklabels,
+            )
+            if title is not None:
+                _ = ax.set_title(title)
+            return ax
+
         _ = sns.heatmap(
             data=data,
             vmin=vmin,
@@ -1373,6 +1661,543 @@ class Visualizer(VisualizerABC):  # pragma: no cover
 
         return ax
 
+    def _raster(
+        self,
+        ax: plt.Axes,
+        data: pd.DataFrame,
+        vmin: float = None,
+        vmax: float = None,
+        cmap: str = "crest",
+        robust: bool = False,
+        cbar: bool = True,
+        cbar_kws: dict = None,
+        cbar_ax: plt.Axes = None,
+        square: bool = True,
+        xticklabels: Union["str", "bool", list, int] = "auto",
+        yticklabels: Union["str", "bool", list, int] = "auto",
+    ) -> plt.Axes:
+        """Draws a matrix as a single image, with seaborn's color limits and tick labels."""
+        values = np.ma.masked_invalid(data.to_numpy(dtype=np.float64))
+        if robust:
+            low, high = np.nanpercentile(values.filled(np.nan), [2, 98])
+        else:
+            low, high = values.min(), values.max()
+        image = ax.imshow(
+            values,
+            cmap=cmap,
+            vmin=low if vmin is None else vmin,
+            vmax=high if vmax is None else vmax,
+            aspect="equal" if square else "auto",
+            interpolation="nearest",
+        )
+        if cbar:
+            ax.figure.colorbar(image, ax=ax, cax=cbar_ax, **(cbar_kws or {}))
+
+        # Length of each axis in points, from which the number of legible labels follows.
+        width, height = ax.figure.get_size_inches() * ax.get_position().size * 72
+        for labels, ticklabels, set_ticks, length in (
+            (data.columns, xticklabels, ax.set_xticks, width),
+            (data.index, yticklabels, ax.set_yticks, height),
+        ):
+            if ticklabels is False:
+                set_ticks([])
+                continue
+            if isinstance(ticklabels, (list, tuple, np.ndarray, pd.Index)):
+                labels, step = ticklabels, 1
+            elif isinstance(ticklabels, str):
+                capacity = max(1, int(length / (1.5 * self._canvas.fontsize)))
+                step = max(1, math.ceil(len(labels) / capacity))
+            elif ticklabels is True:
+                step = 1
+            else:
+                step = ticklabels
+            positions = np.arange(0, len(labels), step)
+            set_ticks(positions, [str(labels[i]) for i in positions])
+        ax.tick_params(axis="x", labelrotation=90)
+        ax.grid(False)
+        return ax
+
+    def _hypothesisplot(
+        self,
+        distribution: str,
+        dof: int,
+        statistic: float,
+        alpha: float = 0.05,
+        tails: int = 2,
+        label: str = None,
+        xlabel: str = None,
+        ylabel: str = None,
+        title: str = None,
+        figsize: tuple = (12, 4),
+        ax: plt.Axes = None,
+    ) -> plt.Axes:
+        """Draws a test distribution, its reject region, critical values and the statistic."""
+        if ax is None:
+            _, ax = self._canvas.get_figaxes(figsize=figsize)
+
+        x, y, reject, (lower_critical, upper_critical) = hypothesis_grid(
+            distribution, dof, alpha, tails
+        )
+        ax.plot(x, y, color=self._canvas.colors.dark_blue)
+        ax.fill_between(x, 0, y, where=reject, color=self._canvas.colors.orange)
+
+        # Statistics beyond the plotted range are not drawn.
+        statistic = round(statistic, 4)
+        if statistic < x[-1]:
+            dist = HYPOTHESIS_DISTRIBUTIONS[distribution][0]
+            density = dist.pdf(statistic, dof)
+            ax.scatter(
+                [statistic],
+                [density],
+                s=100,
+                color=self._canvas.colors.dark_blue,
+                zorder=3,
+            )
+            if tails == 1:
+                ytext = 20
+            elif np.isclose(statistic, 0, atol=1e-1):
+                ytext = -20
+            else:
+                ytext = 10
+            ax.annotate(
+                f"{label} = {str(statistic)}",
+                (statistic, density),
+                textcoords="offset points",
+                xytext=(0, ytext),
+                ha="center",
+            )
+
+        if lower_critical is not None:
+            ax.annotate(
+                "Critical Value",
+                (lower_critical, 0),
+                textcoords="offset points",
+                xytext=(20, 15),
+                ha="left",
+                arrowprops={"width": 2, "headwidth": 4, "shrink": 0.05},
+            )
+        ax.annotate(
+            "Critical Value",
+            (upper_critical, 0),
+            xycoords="data",
+            textcoords="offset points",
+            xytext=(-20, 15),
+            ha="right",
+            arrowprops={"width": 2, "headwidth": 4, "shrink": 0.05},
+        )
+
+        _ = ax.set_title(
+            f"{title}",
+            fontsize=self._canvas.fontsize_title,
+        )
+        if xlabel is not None:
+            ax.set_xlabel(xlabel)
+        if ylabel is not None:
+            ax.set_ylabel(ylabel)
+
+        ax.figure.tight_layout()
+
+        return ax
+
+    def _factorize(self, values: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+        """Encodes values as integer codes, with -1 for missing values.
+
+        Levels follow seaborn's order: categories for categorical data, sorted values for
+        numeric data, and order of appearance otherwise.
+        """
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            return values.cat.codes.to_numpy(dtype=np.int64), values.cat.categories
+        sort = pd.api.types.is_numeric_dtype(values)
+        codes, levels = pd.factorize(values, sort=sort)
+        return codes.astype(np.int64), levels
+
+    def _pairgrid(
+        self,
+        data: pd.DataFrame,
+        include: list = None,
+        hue: str = None,
+        title: str = None,
+        off_diagonal: str = "density",
+        sample_size: int = 10000,
+        n_jobs: int = None,
+        height: float = 2.5,
+        bins: int = 50,
+    ) -> sns.PairGrid:
+        """Renders a pair grid whose cost grows with the number of cells, not rows.
+
+        Histograms and density grids for every cell are counted in a thread pool, and then
+        drawn. Correlation coefficients for the upper triangle are computed in one matrix
+        product over the standardized complete rows.
+        """
+        if off_diagonal not in ("density", "sample"):
+            msg = f"off_diagonal must be 'density' or 'sample', not {off_diagonal}."
+            logger.error(msg)
+            raise ValueError(msg)
+        variables = include or [
+            col for col in data.select_dtypes(include="number").columns if col != hue
+        ]
+        g = sns.PairGrid(data=data, vars=variables, hue=hue, height=height)
+        self._canvas.register(g.figure)
+        groups = self._groups(data=data[variables + ([hue] if hue else [])], hue=hue)
+
+        def diagonal(var: str) -> tuple:
+            values = data[var].to_numpy(dtype=np.float64)
+            edges = np.histogram_bin_edges(values[np.isfinite(values)], bins=bins)
+            counts = [
+                np.histogram(group[var].to_numpy(dtype=np.float64), bins=edges)[0]
+                for _, group, _ in groups
+            ]
+            return edges, counts
+
+        pairs = [(i, j) for i in range(len(variables)) for j in range(i)]
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            histograms = list(executor.map(diagonal, variables))
+            if off_diagonal == "density":
+                grids = list(
+                    executor.map(
+                        lambda pair: self._density_grids(
+                            data=data,
+                            x=variables[pair[1]],
+                            y=variables[pair[0]],
+                            hue=hue,
+                        ),
+                        pairs,
+                    )
+                )
+
+        for i, (edges, counts) in enumerate(histograms):
+            # Rows and columns share the range of their variable, as in seaborn's pairplot.
+            g.axes[i, i].set_xlim(edges[0], edges[-1])
+            g.axes[i, i].set_ylim(edges[0], edges[-1])
+            ax = g.axes[i, i].twinx()
+            ax.set_axis_off()
+            for count, (_, _, color) in zip(counts, groups):
+                ax.stairs(count, edges, fill=True, alpha=0.5, color=color)
+
+        if off_diagonal == "density":
+            for (i, j), grid in zip(pairs, grids):
+                ax = self._density(
+                    ax=g.axes[i, j],
+                    data=data,
+                    x=variables[j],
+                    y=variables[i],
+                    hue=hue,
+                    colorbar=False,
+                    grids=grid,
+                )
+                if ax.get_legend() is not None:
+                    ax.get_legend().remove()
+        else:
+            sampled = sample(
+                data=[data],
+                n=sample_size,
+                by=hue,
+                allocation="proportional",
+                random_state=0,
+            )
+            sampled_groups = self._groups(data=sampled, hue=hue)
+            for i, j in pairs:
+                for _, group, color in sampled_groups:
+                    g.axes[i, j].scatter(
+                        group[variables[j]],
+                        group[variables[i]],
+                        s=2,
+                        alpha=0.5,
+                        color=color,
+                    )
+
+        values = data[variables].to_numpy(dtype=np.float64)
+        values = values[np.isfinite(values).all(axis=1)]
+        z = (values - values.mean(axis=0)) / values.std(axis=0, ddof=1)
+        corr = z.T @ z / (len(z) - 1)
+        for i, j in zip(*np.triu_indices(len(variables), k=1)):
+            ax = g.axes[i, j]
+            ax.grid(False)
+            ax.text(
+                0.5,
+                0.5,
+                f"r = {corr[i, j]:.2f}",
+                transform=ax.transAxes,
+                ha="center",
+                va="center",
+                fontsize=self._canvas.fontsize + 6 * abs(np.nan_to_num(corr[i, j])),
+                color=self._canvas.colors.dark_blue,
+            )
+
+        if hue is not None:
+            g.add_legend(
+                legend_data={
+                    str(level): Patch(color=color) for level, _, color in groups
+                },
+                title=hue,
+            )
+        if title is not None:
+            g.figure.suptitle(title)
+        g.tight_layout()
+        return g
+
+    def _aggregates(self, data: pd.DataFrame, aggregate: bool = None) -> bool:
+        """Returns whether data are to be aggregated rather than drawn point by point."""
+        if aggregate is not None:
+            return aggregate
+        if not isinstance(data, (pd.DataFrame, pd.Series, np.ndarray)):
+            return True
+        return len(data) > self._canvas.aggregate_threshold
+
+    def _ignored(self, plot: str, args: tuple, kwargs: dict, used: tuple = ()) -> None:
+        """Warns of plotting arguments that are not applied when data are aggregated."""
+        ignored = [repr(arg) for arg in args] + [
+            key for key in kwargs if key not in used
+        ]
+        if ignored:
+            logger.warning(
+                f"{plot} renders a density grid for aggregated data and ignores: "
+                f"{', '.join(ignored)}."
+            )
+
+    def _accumulate(
+        self,
+        data: Union[pd.DataFrame, np.ndarray, Iterable],
+        x: str = None,
+        hue: str = None,
+        factories: Tuple[Callable, ...] = (lambda: StreamingHistogram(KDE_BINS),),
+    ) -> dict:
+        """Accumulates the values of x for each level of hue, chunk by chunk.
+
+        Data may be a DataFrame, an array, or an iterable of either, which is read once.
+        Returns, in level order, a tuple of accumulators made by the factories for each level.
+        """
+        accumulators = {}
+        chunks = (
+            [data] if isinstance(data, (pd.DataFrame, pd.Series, np.ndarray)) else data
+        )
+        for chunk in chunks:
+            groups = (
+                [(None, chunk)] if hue is None else chunk.groupby(hue, observed=True)
+            )
+            for level, group in groups:
+                values = group[x] if x is not None else np.asarray(group).ravel()
+                if level not in accumulators:
+                    accumulators[level] = tuple(factory() for factory in factories)
+                for accumulator in accumulators[level]:
+                    accumulator.update(values)
+        levels = sorted(accumulators) if hue is not None else accumulators
+        return {level: accumulators[level] for level in levels}
+
+    def _counts(
+        self,
+        data: pd.DataFrame,
+        col: str,
+        hue: str = None,
+        top: int = None,
+        order_by_count: bool = False,
+    ) -> Tuple[List[str], np.ndarray, list]:
+        """Returns the bar labels, the counts by bar and hue level, and the hue levels.
+
+        Counts are aggregated in a single pass. Levels beyond the top are combined in a final
+        'Other' bar.
+        """
+        codes, levels = self._factorize(data[col])
+        if hue is None:
+            hue_codes, hue_levels = np.zeros(len(codes), dtype=np.int64), [None]
+        else:
+            hue_codes, hue_levels = self._factorize(data[hue])
+        valid = (codes >= 0) & (hue_codes >= 0)
+        counts = np.bincount(
+            codes[valid] * len(hue_levels) + hue_codes[valid],
+            minlength=len(levels) * len(hue_levels),
+        ).reshape(len(levels), len(hue_levels))
+
+        totals = counts.sum(axis=1)
+        keep = np.arange(len(levels))
+        if top is not None and len(levels) > top:
+            keep = np.sort(np.argsort(-totals, kind="stable")[:top])
+        if order_by_count:
+            keep = keep[np.argsort(-totals[keep], kind="stable")]
+        labels = [str(level) for level in np.asarray(levels, dtype=object)[keep]]
+        if len(keep) < len(levels):
+            other = np.ones(len(levels), dtype=bool)
+            other[keep] = False
+            counts = np.vstack([counts[keep], counts[other].sum(axis=0)])
+            labels.append("Other")
+        else:
+            counts = counts[keep]
+        return labels, counts, hue_levels
+
+    def _count_bars(
+        self,
+        ax: plt.Axes,
+        counts: np.ndarray,
+        hue_levels: list,
+        orient: str,
+        palette: Union[str, list],
+        **kwargs,
+    ) -> list:
+        """Draws the counts as bars, dodged by hue level, and returns the bar containers."""
+        positions = np.arange(len(counts))
+        bar = ax.bar if orient == "v" else ax.barh
+        if len(hue_levels) == 1 and hue_levels[0] is None:
+            colors = sns.color_palette(palette, n_colors=len(counts))
+            return [bar(positions, counts[:, 0], 0.8, color=colors, **kwargs)]
+        width = 0.8 / len(hue_levels)
+        colors = sns.color_palette(palette, n_colors=len(hue_levels))
+        return [
+            bar(
+                positions + (i - (len(hue_levels) - 1) / 2) * width,
+                counts[:, i],
+                width,
+                color=color,
+                label=str(level),
+                **kwargs,
+            )
+            for i, (level, color) in enumerate(zip(hue_levels, colors))
+        ]
+
+    def _colored(self, accumulators: dict, hue: str = None) -> list:
+        """Returns (level, accumulators, color) for each level, colored as by _groups."""
+        if hue is None:
+            return [
+                (None, value, self._canvas.colors.dark_blue)
+                for value in accumulators.values()
+            ]
+        colors = sns.color_palette(self._canvas.palette, n_colors=len(accumulators))
+        return [
+            (level, value, color)
+            for (level, value), color in zip(accumulators.items(), colors)
+        ]
+
+    def _kde(
+        self,
+        ax: plt.Axes,
+        histogram: StreamingHistogram,
+        color: str,
+        label: str = None,
+        scale: float = 1.0,
+        **kwargs,
+    ) -> plt.Axes:
+        """Draws a binned kernel density estimate, honoring seaborn's bw_adjust, cut,
+        cumulative and fill arguments."""
+        x, y = binned_kde(
+            histogram,
+            bw_adjust=kwargs.get("bw_adjust", 1.0),
+            cut=kwargs.get("cut", 3.0),
+            cumulative=kwargs.get("cumulative", False),
+        )
+        ax.plot(x, y * scale, color=color, label=label)
+        if kwargs.get("fill", False):
+            ax.fill_between(x, y * scale, color=color, alpha=0.25)
+        return ax
+
+    def _boxen(self, ax: plt.Axes, sketch: QuantileSketch, color: str) -> plt.Axes:
+        """Draws a horizontal boxen plot from the letter values of a quantile sketch.
+
+        Boxes span the quartiles, eighths, sixteenths and so on, to the depth of Tukey's
+        rule, limited by the resolution of the sketch.
+        """
+        depth = max(1, min(int(np.log2(sketch.n)) - 3, int(np.log2(sketch.size)) - 1))
+        colors = sns.light_palette(color, n_colors=depth + 1)[::-1]
+        for level in range(depth, 0, -1):
+            tail = 2.0 ** -(level + 1)
+            lower, upper = sketch.quantile([tail, 1 - tail])
+            height = 0.8 * (depth - level + 1) / depth
+            ax.barh(
+                0, upper - lower, left=lower, height=height, color=colors[level - 1]
+            )
+        ax.vlines(sketch.quantile(0.5), -0.4, 0.4, color="white", lw=2)
+        ax.set_yticks([])
+        return ax
+
+    def _groups(self, data: pd.DataFrame, hue: str = None) -> list:
+        """Returns (level, data, color) for each level of hue, or for all data."""
+        if hue is None:
+            return [(None, data, self._canvas.colors.dark_blue)]
+        groups = list(data.groupby(hue, observed=True, sort=True))
+        colors = sns.color_palette(self._canvas.palette, n_colors=len(groups))
+        return [(level, group, color) for (level, group), color in zip(groups, colors)]
+
+    def _density(
+        self,
+        ax: plt.Axes,
+        data: pd.DataFrame,
+        x: str,
+        y: str,
+        hue: str = None,
+        colorbar: bool = True,
+        grids: tuple = None,
+        alpha: float = None,
+    ) -> plt.Axes:
+        """Renders points as a 2D density grid.
+
+        Counts are shown on a log scale, with empty cells left transparent. With hue, a grid
+        is counted for each level and drawn in the level's color, with opacity increasing
+        with the density. Grids already counted by _density_grids may be passed in. Alpha,
+        if given, scales the opacity of the grids.
+        """
+        extent, layers = grids or self._density_grids(data=data, x=x, y=y, hue=hue)
+
+        if hue is None:
+            counts = np.ma.masked_equal(layers[0][2].counts.T, 0)
+            cmap = LinearSegmentedColormap.from_list(
+                "density", ["#FFFFFF", self._canvas.colors.dark_blue]
+            )
+            image = ax.imshow(
+                counts,
+                origin="lower",
+                extent=extent,
+                aspect="auto",
+                interpolation="nearest",
+                cmap=cmap,
+                norm=LogNorm(vmin=1, vmax=max(counts.max(), 1)),
+                alpha=alpha,
+            )
+            if colorbar:
+                ax.figure.colorbar(image, ax=ax, label="Count")
+        else:
+            vmax = np.log1p(max(grid.counts.max() for _, _, grid in layers))
+            handles = []
+            for level, color, grid in layers:
+                rgba = np.zeros((*grid.counts.T.shape, 4))
+                rgba[..., :3] = to_rgb(color)
+                rgba[..., 3] = np.log1p(grid.counts.T) / max(vmax, 1e-12)
+                rgba[..., 3] *= 1 if alpha is None else alpha
+                ax.imshow(
+                    rgba,
+                    origin="lower",
+                    extent=extent,
+                    aspect="auto",
+                    interpolation="nearest",
+                )
+                handles.append(Patch(color=color, label=str(level)))
+            ax.legend(handles=handles, title=hue)
+
+        ax.grid(False)
+        ax.set_xlabel(x)
+        ax.set_ylabel(y)
+        return ax
+
+    def _density_grids(
+        self, data: pd.DataFrame, x: str, y: str, hue: str = None
+    ) -> Tuple[tuple, list]:
+        """Counts density grids over the extent of x and y.
+
+        Returns the extent and a (level, color, DensityGrid) for each level of hue, or for
+        all data.
+        """
+        extent = data_extent(
+            data[x].to_numpy(dtype=np.float64), data[y].to_numpy(dtype=np.float64)
+        )
+        layers = [
+            (
+                level,
+                color,
+                DensityGrid(extent=extent, bins=self._canvas.gridsize).update(
+                    group[x], group[y]
+                ),
+            )
+            for level, group, color in self._groups(data=data, hue=hue)
+        ]
+        return extent, layers
+
     def _wrap_ticklabels(
         self, axis: str, axes: List[plt.Axes], fontsize: int = 8
     ) -> List[plt.Axes]:
@@ -1397,8 +2222,17 @@ class Visualizer(VisualizerABC):  # pragma: no cover
         self, ax: plt.Axes, data: Union[pd.DataFrame, np.ndarray], x: str
     ) -> plt.Axes:
         """Annotates an axis with min, max, and mean lines and text annotations."""
+        # Aggregated data carry their own summary statistics.
+        if isinstance(data, StreamingHistogram):
+            x_min, x_mean, x_max = data.min, data.mean, data.max
+        elif isinstance(data, dict):
+            histograms = [accumulators[0] for accumulators in data.values()]
+            n = sum(histogram.n for histogram in histograms)
+            x_min = min(histogram.min for histogram in histograms)
+            x_mean = sum(histogram.mean * histogram.n for histogram in histograms) / n
+            x_max = max(histogram.max for histogram in histograms)
         # If x is not None, we assume a dataframe.
-        if x is not None:
+        elif x is not None:
             x_min = np.min(data[x])
             x_mean = np.mean(data[x])
             x_max = np.max(data[x])
@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Thursday August 10th 2023 08:29:08 pm                                               #
-# Modified   : Wednesday June 26th 2024 07:13:44 pm                                                #
+# Modified   : Monday October 19th 2026 05:09:48 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
@@ -23,6 +23,7 @@ from typing import Callable, Union, List
 
 import pandas as pd
 
+from studioai.analysis.stats.descriptive.frequency import FrequencyDistribution
 from studioai.analysis.stats.descriptive.summary import SummaryStats
 from studioai.analysis.visualize.visualizer import Visualizer, SeabornCanvas
 
@@ -248,35 +249,15 @@ class Dataset(ABC):
             sort (bool): Whether to sort by frequencies. If False, sorting will done by label.
             ascending (bool): Whether to sort ascending.
             formatting (bool): Whether to format the DataFrame for presentation.
-            bins (int): Rather than count values, group them into half-open bins, only works with numeric data.
+            bins (int): Rather than count values, group them into half-open bins. Only applies to a single numeric variable.
 
         """
 
-        if isinstance(self._df[x], pd.Series):
-            abs = (
-                self._df[x]
-                .value_counts(
-                    normalize=False, sort=sort, bins=bins, ascending=ascending
-                )
-                .to_frame()
-            )
-            rel = (
-                self._df[x]
-                .value_counts(normalize=True, sort=sort, bins=bins, ascending=ascending)
-                .to_frame()
-            )
-        else:
-            abs = (
-                self._df[x]
-                .value_counts(normalize=False, sort=sort, ascending=ascending)
-                .to_frame()
-            )
-            rel = (
-                self._df[x]
-                .value_counts(normalize=True, sort=sort, ascending=ascending)
-                .to_frame()
-            )
-        freq = abs.join(rel, on=x)
+        freq = FrequencyDistribution.describe(data=self._df, x=x, bins=bins).to_frame(
+            sort=sort, ascending=ascending
+        )
+        if not isinstance(freq.index, pd.MultiIndex):
+            freq.index = freq.index.astype(object)
         freq.loc["Total"] = freq.sum()
         freq["cumulative"] = freq["proportion"].cumsum()
         freq.loc[freq.index[-1], freq.columns[-1]] = " "
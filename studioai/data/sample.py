@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /studioai/data/sample.py                                                            #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:15:08 pm                                                #
+# Modified   : Monday October 19th 2026 06:40:52 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Sampling Module"""
+
+from __future__ import annotations
+
+import logging
+import math
+import zlib
+from typing import Dict, Hashable, Iterable, Union
+
+import numpy as np
+import pandas as pd
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+RandomState = Union[int, np.random.SeedSequence, np.random.Generator, None]
+
+
+# ------------------------------------------------------------------------------------------------ #
+def seed_sequence(random_state: RandomState = None) -> np.random.SeedSequence:
+    """Returns a SeedSequence for an integer seed, an existing SeedSequence, or None.
+
+    A Generator is accepted too; the seed is drawn from it, advancing its state.
+    """
+    if isinstance(random_state, np.random.SeedSequence):
+        return random_state
+    if isinstance(random_state, np.random.Generator):
+        return np.random.SeedSequence(int(random_state.integers(2**63)))
+    return np.random.SeedSequence(random_state)
+
+
+def stratum_seed(seed: np.random.SeedSequence, stratum: Hashable) -> np.random.SeedSequence:
+    """Derives the seed of a stratum from the parent seed and the stratum value.
+
+    The child seed depends only on the value, not on the order in which strata are
+    encountered, so the same stratum is sampled identically in every partition and process.
+    """
+    key = zlib.crc32(repr(_python_scalar(stratum)).encode("utf-8"))
+    return np.random.SeedSequence(entropy=seed.entropy, spawn_key=(*seed.spawn_key, key))
+
+
+def _python_scalar(value: Hashable) -> Hashable:
+    """Converts numpy scalars, including those in tuples, to their Python equivalents, so
+    that equal values have equal representations whichever type a partition yields. Missing
+    values, which do not compare equal to themselves, become None."""
+    if isinstance(value, tuple):
+        return tuple(_python_scalar(v) for v in value)
+    if pd.isna(value):
+        return None
+    if isinstance(value, np.datetime64):
+        return pd.Timestamp(value)
+    if isinstance(value, np.timedelta64):
+        return pd.Timedelta(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    RESERVOIR SAMPLER                                             #
+# ------------------------------------------------------------------------------------------------ #
+class ReservoirSampler:
+    """Uniform random sample of fixed size from a stream of DataFrames.
+
+    Implements Li's Algorithm L, which draws the number of rows to skip before the next
+    replacement, rather than a random number per row. Only O(n(1 + log(N/n))) random
+    numbers are drawn for a stream of N rows. The skip state is carried across chunks, so
+    for a given seed the sample does not depend on how the stream was chunked.
+
+    Samples of disjoint partitions, drawn independently, can be combined with `merge`.
+
+    Args:
+        n (int): Size of the sample.
+        random_state (Union[int, np.random.SeedSequence]): Seed for the random number generator.
+    """
+
+    def __init__(self, n: int, random_state: RandomState = None) -> None:
+        if n < 1:
+            msg = f"Sample size must be a positive integer, not {n}."
+            logger.error(msg)
+            raise ValueError(msg)
+        self._n = n
+        self._seed = seed_sequence(random_state)
+        self._rng = np.random.default_rng(self._seed)
+        self._reservoir = None
+        self._count = 0
+        self._w = math.exp(math.log(self._rng.random()) / n)
+        self._next = n + self._skip()
+
+    @property
+    def n(self) -> int:
+        """Returns the maximum size of the sample."""
+        return self._n
+
+    @property
+    def count(self) -> int:
+        """Returns the number of rows seen."""
+        return self._count
+
+    @property
+    def sample(self) -> pd.DataFrame:
+        """Returns the sampled rows."""
+        return self._reservoir
+
+    def update(self, data: pd.DataFrame) -> ReservoirSampler:
+        """Offers the rows of a chunk to the reservoir.
+
+        Args:
+            data (pd.DataFrame): The next chunk of the stream.
+        """
+        start, stop = self._count, self._count + len(data)
+        self._count = stop
+
+        # Fill the reservoir with the first n rows.
+        fill = max(0, min(self._n - start, len(data)))
+        if fill:
+            head = data.iloc[:fill]
+            self._reservoir = (
+                head if self._reservoir is None else pd.concat([self._reservoir, head])
+            )
+
+        # Replace random slots at the positions chosen by the skip distribution.
+        slots, rows = [], []
+        while self._next < stop:
+            slots.append(self._rng.integers(self._n))
+            rows.append(self._next - start)
+            self._w *= math.exp(math.log(self._rng.random()) / self._n)
+            self._next += self._skip() + 1
+
+        if rows:
+            self._replace(data=data, slots=np.array(slots), rows=np.array(rows))
+        return self
+
+    def merge(self, other: ReservoirSampler) -> ReservoirSampler:
+        """Combines the sample of this stream with that of a disjoint stream.
+
+        The number of rows taken from each sample is hypergeometric in the number of rows
+        each has seen, so the result is a uniform sample of the union of both streams.
+
+        Args:
+            other (ReservoirSampler): Sampler of the same size over another partition.
+        """
+        if other.n != self._n:
+            msg = f"Unable to merge a sample of size {other.n} with a sample of size {self._n}."
+            logger.error(msg)
+            raise ValueError(msg)
+
+        merged = ReservoirSampler(n=self._n, random_state=self._seed.spawn(1)[0])
+        merged._count = self._count + other.count
+        merged._next = merged._count  # Merged samplers are not updated further.
+        samples = [s for s in (self.sample, other.sample) if s is not None]
+        if merged._count <= self._n:
+            merged._reservoir = pd.concat(samples) if samples else None
+            return merged
+
+        k = merged._rng.hypergeometric(ngood=self._count, nbad=other.count, nsample=self._n)
+        parts = []
+        for sample, size in ((self.sample, k), (other.sample, self._n - k)):
+            if size:
+                idx = merged._rng.choice(len(sample), size=size, replace=False)
+                parts.append(sample.iloc[np.sort(idx)])
+        merged._reservoir = pd.concat(parts)
+        return merged
+
+    def __add__(self, other: ReservoirSampler) -> ReservoirSampler:
+        return self.merge(other)
+
+    def _skip(self) -> int:
+        """Draws the number of rows passed over before the next replacement."""
+        if self._w >= 1.0:  # pragma: no cover
+            return 0
+        return int(math.floor(math.log(self._rng.random()) / math.log1p(-self._w)))
+
+    def _replace(self, data: pd.DataFrame, slots: np.ndarray, rows: np.ndarray) -> None:
+        """Replaces the reservoir slots with rows of the chunk. Later replacements win."""
+        # Keep only the last replacement of each slot.
+        _, last = np.unique(slots[::-1], return_index=True)
+        last = len(slots) - 1 - last
+        slots, rows = slots[last], rows[last]
+        combined = pd.concat([self._reservoir, data.iloc[rows]])
+        take = np.arange(self._n)
+        take[slots] = self._n + np.arange(len(rows))
+        self._reservoir = combined.iloc[take]
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    STRATIFIED SAMPLER                                            #
+# ------------------------------------------------------------------------------------------------ #
+class StratifiedSampler:
+    """Stratified random sample from a stream of DataFrames, with a reservoir per stratum.
+
+    Each stratum has its own ReservoirSampler, seeded from the stratum value. Samples are
+    therefore reproducible across partitions and chunkings of the data. Rows with a missing
+    stratum value are sampled as a stratum of their own, keyed by None.
+
+    Args:
+        by (str): The column that defines the strata.
+        n (int): Sample size. The size of each stratum sample under 'equal' allocation, or the
+            total sample size under 'proportional' allocation.
+        allocation (str): Either 'equal' or 'proportional'. Under proportional allocation, each
+            stratum contributes rows in proportion to its size in the stream. Default = 'equal'
+        random_state (Union[int, np.random.SeedSequence]): Seed for the random number generator.
+    """
+
+    __allocations = ["equal", "proportional"]
+
+    def __init__(
+        self, by: str, n: int, allocation: str = "equal", random_state: RandomState = None
+    ) -> None:
+        if allocation not in self.__allocations:
+            msg = f"Allocation must be one of {self.__allocations}, not {allocation}."
+            logger.error(msg)
+            raise ValueError(msg)
+        self._by = by
+        self._n = n
+        self._allocation = allocation
+        self._seed = seed_sequence(random_state)
+        self._reservoirs: Dict[Hashable, ReservoirSampler] = {}
+
+    @property
+    def count(self) -> pd.Series:
+        """Returns the number of rows seen in each stratum."""
+        return pd.Series({k: r.count for k, r in self._reservoirs.items()}, name="count")
+
+    @property
+    def sample(self) -> pd.DataFrame:
+        """Returns the sampled rows of all strata."""
+        if not self._reservoirs:
+            return None
+        if self._allocation == "equal":
+            return pd.concat([r.sample for r in self._reservoirs.values()])
+
+        counts = self.count
+        sizes = self._allocate(counts=counts)
+        rng = np.random.default_rng(self._seed.spawn(1)[0])
+        parts = []
+        for reservoir, size in zip(self._reservoirs.values(), sizes):
+            if size:
+                idx = rng.choice(len(reservoir.sample), size=size, replace=False)
+                parts.append(reservoir.sample.iloc[np.sort(idx)])
+        return pd.concat(parts)
+
+    def update(self, data: pd.DataFrame) -> StratifiedSampler:
+        """Offers the rows of a chunk to the reservoir of their stratum.
+
+        Args:
+            data (pd.DataFrame): The next chunk of the stream.
+        """
+        for stratum, group in data.groupby(by=self._by, sort=False, observed=True, dropna=False):
+            stratum = _python_scalar(stratum)
+            if stratum not in self._reservoirs:
+                self._reservoirs[stratum] = ReservoirSampler(
+                    n=self._n, random_state=stratum_seed(seed=self._seed, stratum=stratum)
+                )
+            self._reservoirs[stratum].update(group)
+        return self
+
+    def merge(self, other: StratifiedSampler) -> StratifiedSampler:
+        """Combines the samples of this stream with those of a disjoint stream.
+
+        Args:
+            other (StratifiedSampler): Sampler of the same strata over another partition.
+        """
+        merged = StratifiedSampler(
+            by=self._by, n=self._n, allocation=self._allocation, random_state=self._seed
+        )
+        merged._reservoirs = dict(self._reservoirs)
+        for stratum, reservoir in other._reservoirs.items():
+            if stratum in merged._reservoirs:
+                merged._reservoirs[stratum] = merged._reservoirs[stratum].merge(reservoir)
+            else:
+                merged._reservoirs[stratum] = reservoir
+        return merged
+
+    def __add__(self, other: StratifiedSampler) -> StratifiedSampler:
+        return self.merge(other)
+
+    def _allocate(self, counts: pd.Series) -> pd.Series:
+        """Allocates the total sample size to strata in proportion to their counts.
+
+        Uses the largest remainder method, so sizes sum to n.
+        """
+        n = min(self._n, int(counts.sum()))
+        quotas = counts / counts.sum() * n
+        sizes = np.floor(quotas).astype(int)
+        remainder = n - sizes.sum()
+        if remainder:
+            order = np.argsort(-(quotas - sizes).to_numpy(), kind="stable")
+            sizes.iloc[order[:remainder]] += 1
+        return sizes
+
+
+# ------------------------------------------------------------------------------------------------ #
+def sample(
+    data: Iterable[pd.DataFrame],
+    n: int,
+    by: str = None,
+    allocation: str = "equal",
+    random_state: RandomState = None,
+) -> pd.DataFrame:
+    """Draws a simple or stratified random sample from a stream of DataFrames in one pass.
+
+    Args:
+        data (Iterable[pd.DataFrame]): The chunks of the stream.
+        n (int): Sample size. For stratified samples see StratifiedSampler.
+        by (str): The column that defines the strata. Optional.
+        allocation (str): Allocation of a stratified sample. Either 'equal' or 'proportional'.
+        random_state (Union[int, np.random.SeedSequence]): Seed for the random number generator.
+    """
+    if by is None:
+        sampler = ReservoirSampler(n=n, random_state=random_state)
+    else:
+        sampler = StratifiedSampler(by=by, n=n, allocation=allocation, random_state=random_state)
+    for chunk in data:
+        sampler.update(chunk)
+    return sampler.sample
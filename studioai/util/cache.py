@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /studioai/util/cache.py                                                             #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:16:27 pm                                                #
+# Modified   : Monday October 19th 2026 05:16:27 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+"""Memoization Module"""
+from __future__ import annotations
+
+import functools
+import inspect
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+import numpy as np
+import pandas as pd
+
+from studioai import DataClass
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+_MISSING = object()
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class CacheStats(DataClass):
+    """Hit and miss statistics of a cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    maxsize: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Returns the proportion of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          LRU CACHE                                               #
+# ------------------------------------------------------------------------------------------------ #
+class LRUCache:
+    """Bounded cache that evicts the least recently used entry when full.
+
+    Args:
+        maxsize (int): Maximum number of entries held. Default = 128
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def stats(self) -> CacheStats:
+        """Returns the hit and miss statistics of the cache."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._entries),
+            maxsize=self._maxsize,
+        )
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the entry for key, marking it as most recently used."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self._misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Adds an entry, evicting the least recently used entry if the cache is full."""
+        if self._maxsize <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """Removes all entries. Statistics are retained."""
+        self._entries.clear()
+
+
+# ------------------------------------------------------------------------------------------------ #
+def freeze(value: Any) -> Hashable:
+    """Converts an argument into a hashable cache key component.
+
+    Raises TypeError for values that cannot be keyed.
+    """
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(freeze(v) for v in value))
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((k, freeze(v)) for k, v in value.items())))
+    if isinstance(value, (set, frozenset)):
+        return ("set", frozenset(freeze(v) for v in value))
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return (type(value).__name__, freeze(value.to_numpy()), freeze(value.name))
+    hash(value)
+    return value
+
+
+# ------------------------------------------------------------------------------------------------ #
+def memoize(method: Callable) -> Callable:
+    """Caches the results of a method in the instance's LRU cache.
+
+    Results are keyed by the method name, the data version of the instance, and the bound
+    arguments, with defaults applied, so equivalent calls share an entry. The instance must
+    provide `_cache` (an LRUCache) and `_version` attributes. Calls with arguments that
+    cannot be keyed are computed without caching. DataFrames and Series are returned as
+    copies, so callers cannot alter the cached result.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = tuple(freeze(v) for k, v in bound.arguments.items() if k != "self")
+            key = (method.__name__, self._version, arguments)
+        except TypeError:
+            return method(self, *args, **kwargs)
+
+        result = self._cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = method(self, *args, **kwargs)
+            self._cache.put(key, result)
+        return _copy(result)
+
+    return wrapper
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _copy(result: Any) -> Any:
+    """Copies pandas results, including those returned in tuples."""
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return result.copy()
+    if isinstance(result, tuple):
+        return tuple(_copy(r) for r in result)
+    return result
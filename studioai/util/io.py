@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Tuesday August 22nd 2023 06:27:41 pm                                                #
-# Modified   : Saturday August 26th 2023 05:43:39 am                                               #
+# Modified   : Monday October 19th 2026 05:55:09 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
@@ -273,6 +273,23 @@ class JsonIO(IO):  # pragma: no cover
                     raise
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                                         FIGURE                                                   #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class FigureIO(IO):  # pragma: no cover
+    @classmethod
+    def _read(cls, filepath: str, **kwargs) -> Any:
+        """Figures are rendered images and are not read back."""
+        raise NotImplementedError
+
+    @classmethod
+    def _write(cls, filepath: str, data: Any, dpi: int = None, **kwargs) -> None:
+        """Renders a matplotlib Figure in the format given by the file extension."""
+        data.savefig(filepath, dpi=dpi, **kwargs)
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                                       IO SERVICE                                                 #
 # ------------------------------------------------------------------------------------------------ #
@@ -289,6 +306,9 @@ class IOService:  # pragma: no cover
         "xlsx": ExcelIO,
         "xls": ExcelIO,
         "parquet": ParquetIO,
+        "png": FigureIO,
+        "svg": FigureIO,
+        "pdf": FigureIO,
     }
     _logger = logging.getLogger(
         f"{__module__}.{__name__}",
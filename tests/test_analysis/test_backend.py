@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /tests/test_analysis/test_backend.py                                                #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:20:47 pm                                                #
+# Modified   : Monday October 19th 2026 06:40:10 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from studioai.analysis.backend import AVAILABLE, PandasBackend, get_backend
+from studioai.analysis.explore.example import CreditScoreExplorer
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.backend
+class TestBackend:  # pragma: no cover
+    # ============================================================================================ #
+    def test_backends(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        reference = PandasBackend()
+        df = credit.copy()
+        df.loc[3, "Income"] = np.nan
+        df.loc[5, "Gender"] = None
+        for name in [name for name, available in AVAILABLE.items() if available]:
+            backend = get_backend(name)
+            assert backend.count(df).equals(reference.count(df))
+            assert backend.nunique(df).equals(reference.nunique(df))
+            for columns in [["Gender"], ["Age"], ["Gender", "Education"]]:
+                counts = backend.value_counts(df=df, columns=columns).sort_index()
+                expected = reference.value_counts(df=df, columns=columns).sort_index()
+                assert np.array_equal(counts.values, expected.values)
+                assert counts.index.equals(expected.index)
+            assert (
+                backend.nlargest(df=df, x="Age", n=5)["Age"].tolist()
+                == df.nlargest(5, "Age")["Age"].tolist()
+            )
+            columns = ["Gender", "Education"]
+            assert backend.drop_duplicates(df[columns]).equals(
+                reference.drop_duplicates(df[columns])
+            )
+            assert np.allclose(backend.describe(df), reference.describe(df), equal_nan=True)
+            logger.info(f"Backend {name} agrees with pandas.")
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_fallback(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        backend = get_backend("arrow")
+        df = pd.DataFrame({"a": [1, "x", 2.0, None, "x"]})
+        assert backend.nunique(df).tolist() == [3]
+        assert backend.value_counts(df=df, columns=["a"]).sum() == 4
+        with pytest.raises(ValueError):
+            get_backend("spark")
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_explorer_backends(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        pandas = CreditScoreExplorer(df=credit, backend="pandas")
+        arrow = CreditScoreExplorer(df=credit, backend="arrow")
+        assert arrow.backend.name == "arrow"
+        assert CreditScoreExplorer(df=credit).backend.name == "pandas"
+        assert arrow.info.data.equals(pandas.info.data)
+        assert arrow.frequency(x=["Gender", "Education"]).equals(
+            pandas.frequency(x=["Gender", "Education"])
+        )
+        assert arrow.unique(columns=["Gender", "Own"]).equals(
+            pandas.unique(columns=["Gender", "Own"])
+        )
+        assert np.allclose(arrow.describe().numeric, pandas.describe().numeric)
+        assert arrow.countstats(x="Education")[1].equals(pandas.countstats(x="Education")[1])
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
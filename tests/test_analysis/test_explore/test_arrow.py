@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /tests/test_analysis/test_explore/test_arrow.py                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:13:35 pm                                                #
+# Modified   : Monday October 19th 2026 06:26:29 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+from datetime import datetime
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from studioai.analysis.explore.arrow import DistinctCounter
+from studioai.analysis.explore.eda import Explorer
+from studioai.analysis.explore.example import CreditScoreExplorer
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.explorer
+@pytest.mark.arrow
+class TestArrowExplorer:  # pragma: no cover
+    # ============================================================================================ #
+    def test_metadata(self, credit, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        path = tmp_path / "credit.parquet"
+        credit.to_parquet(path, row_group_size=50)
+        eda = Explorer.from_dataset(path=str(path), batch_size=40)
+        assert len(eda) == len(credit)
+        assert eda.shape == credit.shape
+        assert list(eda.columns) == list(credit.columns)
+        assert eda.dtypes["Count"].sum() == credit.shape[1]
+        assert eda.size > 0
+        assert eda.overview.data.shape == (4, 2)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_info(self, credit, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        path = tmp_path / "credit.parquet"
+        credit.to_parquet(path, row_group_size=50)
+        eda = Explorer.from_dataset(path=str(path), batch_size=40)
+        info = eda.info.data
+        expected = CreditScoreExplorer(df=credit).info.data
+        assert list(info.columns) == list(expected.columns)
+        for col in ["Complete", "Null", "Unique", "Duplicate"]:
+            assert np.array_equal(info[col].values, expected[col].values)
+        logger.info(info)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_frequency(self, credit, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        path = tmp_path / "credit.parquet"
+        credit.to_parquet(path, row_group_size=50)
+        eda = Explorer.from_dataset(path=str(path), batch_size=40)
+        inmem = CreditScoreExplorer(df=credit)
+        for x, bins in [("Gender", None), ("Income", 4), (["Gender", "Education"], None)]:
+            freq = eda.frequency(x=x, bins=bins, formatting=False)
+            expected = inmem.frequency(x=x, bins=bins, formatting=False)
+            assert np.array_equal(freq["count"].values, expected["count"].values)
+            logger.info(freq)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_sample_describe(self, credit, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        path = tmp_path / "credit.parquet"
+        credit.to_parquet(path, row_group_size=50)
+        eda = Explorer.from_dataset(path=str(path), batch_size=40)
+        sample = eda.sample(n=10, random_state=55)
+        assert sample.shape == (10, credit.shape[1])
+        assert sample.equals(eda.sample(n=10, random_state=55))
+        stats = eda.describe()
+        expected = credit.describe()
+        assert np.allclose(
+            stats.numeric.loc[["count", "mean", "std", "min", "max"]].values.astype(float),
+            expected.loc[["count", "mean", "std", "min", "max"]].values,
+        )
+        assert (
+            stats.categorical.loc["count"] == credit.select_dtypes(exclude=np.number).count()
+        ).all()
+        assert (
+            eda.top_n(x="Income", n=5)["Income"].tolist()
+            == credit.nlargest(5, "Income")["Income"].tolist()
+        )
+        logger.info(stats.numeric)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_stratified_sample(self, credit, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        path = tmp_path / "credit.parquet"
+        credit.to_parquet(path, row_group_size=50)
+        eda = Explorer.from_dataset(path=str(path), batch_size=40, sample_size=100, random_state=5)
+        sample = eda.sample(n=5, by="Gender", random_state=55)
+        assert (sample.groupby("Gender").size() == 5).all()
+        assert sample.equals(eda.sample(n=5, by="Gender", random_state=55))
+        assert len(eda._working_sample()) == 100
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_distinct_counter(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(5)
+        values = rng.permutation(np.repeat(np.arange(200000), 2))
+        counter = DistinctCounter(limit=1000)
+        for chunk in np.array_split(values, 10):
+            counter.update(pa.array(chunk))
+        assert counter.approximate
+        assert counter.count() == pytest.approx(200000, rel=0.03)
+        counter = DistinctCounter(limit=1000)
+        counter.update(pa.array(["a", "b", None, "a"])).update(pa.array(["c", None]))
+        assert not counter.approximate
+        assert counter.count() == 3
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
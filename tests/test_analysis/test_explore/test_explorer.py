@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Tuesday August 15th 2023 05:59:13 pm                                                #
-# Modified   : Monday May 20th 2024 05:11:29 am                                                    #
+# Modified   : Monday October 19th 2026 05:18:10 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
@@ -724,4 +724,51 @@ class TestExplorer:  # pragma: no cover
                 end.strftime("%m/%d/%Y"),
             )
         )
-        logger.info(single_line)
\ No newline at end of file
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_cache(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        eda = CreditScoreExplorer(df=credit, cache_size=4)
+        freq = eda.frequency(x="Gender")
+        assert eda.cache_info.misses == 1
+        assert eda.frequency(x="Gender", sort=False).equals(freq)
+        assert eda.cache_info.hits == 1
+        freq.loc["Total", "count"] = 0
+        assert not eda.frequency(x="Gender").equals(freq)
+        for x in ["Age", "Income", "Education", "Children"]:
+            eda.frequency(x=x)
+        assert eda.cache_info.size == 4
+        assert eda.cache_info.evictions >= 1
+        eda.df = credit.iloc[:100]
+        assert eda.cache_info.size == 0
+        assert eda.overview.data["Total"].iloc[0] == 100
+        eda.df.loc[eda.df.index[0], "Gender"] = None
+        eda.refresh()
+        assert eda.info.data["Null"].sum() == 1
+        logger.info(eda.cache_info)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /tests/test_analysis/test_stats/test_descriptive/test_frequency.py                  #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:09:36 pm                                                #
+# Modified   : Monday October 19th 2026 05:09:36 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import pandas as pd
+
+from studioai.analysis.stats.descriptive.frequency import FrequencyDistribution
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.frequency
+class TestFrequencyDistribution:  # pragma: no cover
+    # ============================================================================================ #
+    def test_single_variable(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        freq = FrequencyDistribution.describe(data=credit, x="Education")
+        expected = credit["Education"].value_counts()
+        assert freq.total == len(credit)
+        assert freq.counts.sort_index().to_dict() == expected.sort_index().to_dict()
+        assert freq.proportions.sum() == pytest.approx(1.0)
+        df = freq.to_frame(sort=True, ascending=False)
+        assert isinstance(df, pd.DataFrame)
+        assert list(df.columns) == ["count", "proportion"]
+        assert df["count"].is_monotonic_decreasing
+        logger.debug(f"\n{df}")
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_multiple_variables(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        freq = FrequencyDistribution.describe(data=credit, x=["Education", "Gender"])
+        expected = credit[["Education", "Gender"]].value_counts()
+        assert freq.total == len(credit)
+        assert freq.counts.sort_index().to_dict() == expected.sort_index().to_dict()
+        logger.debug(f"\n{freq.to_frame()}")
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_object_variable(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        freq = FrequencyDistribution.describe(data=credit["Marital Status"], bins=4)
+        expected = credit["Marital Status"].value_counts()
+        assert freq.name == "Marital Status"
+        assert freq.counts.sort_index().to_dict() == expected.sort_index().to_dict()
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_merge(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        x = ["Education", "Credit Rating"]
+        a = FrequencyDistribution.describe(data=credit.iloc[:100], x=x)
+        b = FrequencyDistribution.describe(data=credit.iloc[100:], x=x)
+        full = FrequencyDistribution.describe(data=credit, x=x)
+        merged = a + b
+        assert merged.total == full.total
+        assert merged.counts.sort_index().to_dict() == full.counts.sort_index().to_dict()
+
+        bins = [0, 50000, 100000, 150000, 200000]
+        parts = [
+            FrequencyDistribution.describe(data=credit.iloc[i : i + 50], x="Income", bins=bins)
+            for i in range(0, len(credit), 50)
+        ]
+        merged = FrequencyDistribution.combine(parts)
+        full = FrequencyDistribution.describe(data=credit, x="Income", bins=bins)
+        assert merged.counts.to_dict() == full.counts.to_dict()
+
+        with pytest.raises(ValueError):
+            a.merge(FrequencyDistribution.describe(data=credit, x="Gender"))
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
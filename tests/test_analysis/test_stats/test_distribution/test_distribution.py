@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Sunday May 28th 2023 12:41:00 am                                                    #
-# Modified   : Thursday October 19th 2023 07:45:51 pm                                              #
+# Modified   : Monday October 19th 2026 05:45:13 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
@@ -22,11 +22,18 @@ import pytest
 import logging
 
 import numpy as np
+from scipy import stats
 
 from studioai.analysis.stats.distribution.generate import (
     RVSDistribution,
+    CDF,
     DISTRIBUTIONS,
+    FAMILIES,
     Distribution,
+    curves,
+    register,
+    sample_rvs,
+    x_grid,
 )
 
 
@@ -80,3 +87,200 @@ class TestRVSDistribution:  # pragma: no cover
             )
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_lazy(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = credit["Income"].values
+        dg = RVSDistribution()
+        dg(data=data, distribution="gamma", size=50, num_points=100)
+        # Nothing is computed until read.
+        assert callable(dg.rvs._members["y"])
+        assert callable(dg.cdf._members["y"])
+        assert len(dg.cdf.y) == 100
+        assert dg.cdf.x is dg.pdf.x
+        assert callable(dg.rvs._members["y"])
+        assert len(dg.rvs.y) == 50
+        assert dg.rvs.y is dg.rvs.y
+        assert np.all(np.diff(dg.cdf.y) >= 0)
+        assert "loc" in dg.pdf.params
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_registry(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = credit["Income"].values
+        assert set(FAMILIES) == set(DISTRIBUTIONS) == set(CDF)
+        assert "pareto" in FAMILIES
+        register(key="laplace", dist=stats.laplace)
+        try:
+            dg = RVSDistribution()
+            dg(data=data, distribution="laplace", num_points=200)
+            assert dg.pdf.name == "Laplace Distribution"
+            assert np.allclose(dg.cdf.y, stats.laplace.cdf(dg.cdf.x, *stats.laplace.fit(data)))
+            with pytest.raises(NotImplementedError):
+                dg(data=data, distribution="cauchy")
+        finally:
+            for registry in (FAMILIES, DISTRIBUTIONS, CDF):
+                registry.pop("laplace")
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_curves(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = credit["Income"].values
+        pdf = curves(data=data, distributions=["norm", "gamma", "lognorm"], num_points=300)
+        assert list(pdf.columns) == ["norm", "gamma", "lognorm"]
+        assert len(pdf) == 300
+        dg = RVSDistribution()
+        dg(data=data, distribution="gamma", num_points=300)
+        assert np.allclose(pdf["gamma"], dg.pdf.y)
+        # The grid is shared and cannot be altered by callers.
+        assert x_grid(data.min(), data.max(), 300) is dg.pdf.x
+        assert not dg.pdf.x.flags.writeable
+        with pytest.raises(ValueError):
+            curves(data=data, kind="ppf")
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_random_state(self, credit, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = credit["Income"].values
+        a = RVSDistribution()(data=data, distribution="gamma", size=2500, random_state=3)
+        b = RVSDistribution()(
+            data=data, distribution="gamma", size=2500, random_state=3, n_jobs=4, chunk_size=1000
+        )
+        c = RVSDistribution()(
+            data=data, distribution="gamma", size=2500, random_state=3, n_jobs=1, chunk_size=1000
+        )
+        assert np.array_equal(b.rvs.y, c.rvs.y)
+        assert np.array_equal(
+            a.rvs.y, RVSDistribution()(data, "gamma", size=2500, random_state=3).rvs.y
+        )
+        assert not np.array_equal(a.rvs.y, b.rvs.y)
+        # Generators are accepted, and variates can be written to a memory-mapped file.
+        filepath = str(tmp_path / "rvs.npy")
+        params = stats.norm.fit(data)
+        rvs = sample_rvs(
+            dist=stats.norm,
+            params=params,
+            size=3000,
+            random_state=np.random.default_rng(1),
+            n_jobs=2,
+            chunk_size=1000,
+            out=filepath,
+        )
+        assert isinstance(rvs, np.memmap)
+        assert np.array_equal(np.load(filepath), rvs)
+        buffer = np.zeros(3000)
+        assert (
+            sample_rvs(
+                stats.norm,
+                params,
+                3000,
+                random_state=np.random.default_rng(1),
+                out=buffer,
+                chunk_size=1000,
+            )
+            is buffer
+        )
+        assert np.array_equal(buffer, rvs)
+        with pytest.raises(ValueError):
+            sample_rvs(stats.norm, params, 3000, out=np.zeros(10))
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /tests/test_analysis/test_stats/test_distribution/test_estimate.py                  #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:39:58 pm                                                #
+# Modified   : Monday October 19th 2026 06:22:04 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+from scipy import stats
+
+from studioai.analysis.stats.distribution.estimate import (
+    cache_info,
+    clear_cache,
+    fit_params,
+    guess_params,
+    stratified_subsample,
+)
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.rvs
+@pytest.mark.fit
+class TestFitParams:  # pragma: no cover
+    # ============================================================================================ #
+    def test_guess_params(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = stats.gamma.rvs(2.5, scale=3, size=5000, random_state=1)
+        shapes, kwargs = guess_params(data, stats.gamma)
+        assert shapes[0] == pytest.approx(2.5, rel=0.1)
+        assert kwargs["scale"] == pytest.approx(3, rel=0.1)
+        data = stats.beta.rvs(2, 5, size=5000, random_state=1)
+        shapes, kwargs = guess_params(data, stats.beta)
+        assert all(s > 0 for s in shapes)
+        assert kwargs["loc"] < data.min()
+        assert kwargs["loc"] + kwargs["scale"] > data.max()
+        assert guess_params(data, stats.f) == ((), {})
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_stratified_subsample(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = stats.lognorm.rvs(1, size=50000, random_state=1)
+        sample = stratified_subsample(data, n=1000, random_state=2)
+        assert len(sample) == pytest.approx(1000, abs=20)
+        assert sample.min() == data.min()
+        assert sample.max() == data.max()
+        assert np.isin(sample, data).all()
+        assert np.array_equal(sample, stratified_subsample(data, n=1000, random_state=2))
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_fit_params(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = stats.gamma.rvs(2.5, loc=1, scale=3, size=20000, random_state=1)
+        clear_cache()
+        before = cache_info()
+        params = fit_params(data=data, dist=stats.gamma, sample_size=2000)
+        expected = stats.gamma.fit(data)
+        # The refined fit is as likely as the full fit, to within a small tolerance.
+        assert stats.gamma.nnlf(params, data) <= stats.gamma.nnlf(expected, data) + 1
+        assert params == pytest.approx(expected, rel=0.05)
+        assert cache_info().misses == before.misses + 1
+        assert fit_params(data=data, dist=stats.gamma, sample_size=2000) == params
+        assert cache_info().hits == before.hits + 1
+        # Small data are fitted in full, matching scipy.
+        small = data[:500]
+        assert fit_params(data=small, dist=stats.gamma, cache=False) == pytest.approx(
+            stats.gamma.fit(small), rel=1e-3
+        )
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_fit_params_negative_data(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Starting values must not place data outside the support of the distribution.
+        data = stats.norm.rvs(5, 3, size=10000, random_state=1)
+        for dist in (stats.gamma, stats.chi2, stats.weibull_min):
+            shapes, kwargs = guess_params(data, dist)
+            assert kwargs["loc"] < data.min()
+            baseline = dist.logpdf(data, *dist.fit(data)).sum()
+            loglik = dist.logpdf(data, *fit_params(data, dist, cache=False)).sum()
+            assert loglik >= baseline or np.isclose(loglik, baseline)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
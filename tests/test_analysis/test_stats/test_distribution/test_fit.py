@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /tests/test_analysis/test_stats/test_distribution/test_fit.py                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:32:28 pm                                                #
+# Modified   : Monday October 19th 2026 06:38:13 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from studioai.analysis.stats.distribution.fit import fit_best
+from studioai.analysis.stats.distribution.generate import DISTRIBUTIONS
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.rvs
+@pytest.mark.fit
+class TestFitBest:  # pragma: no cover
+    # ============================================================================================ #
+    def test_fit_best(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = stats.gamma.rvs(2.5, scale=3, size=2000, random_state=1)
+        result = fit_best(data=data, families=["gamma", "norm", "exponential", "uniform"], n_jobs=2)
+        assert isinstance(result, pd.DataFrame)
+        assert list(result.index) == [1, 2, 3, 4]
+        assert result.iloc[0]["distribution"] == "gamma"
+        assert result["aic"].is_monotonic_increasing
+        params = result.iloc[0]["params"]
+        expected = stats.kstest(data, "gamma", args=params)
+        assert result.iloc[0]["ks_statistic"] == pytest.approx(expected.statistic)
+        assert result.iloc[0]["ks_pvalue"] == pytest.approx(expected.pvalue)
+        # Serial fits give the same table, and other scores can rank the fits.
+        serial = fit_best(data=data, families=["gamma", "norm", "exponential", "uniform"], n_jobs=1)
+        assert np.allclose(serial["aic"], result["aic"])
+        assert fit_best(data=data, families=["gamma", "norm"], n_jobs=1, rank_by="ad")[
+            "ad_statistic"
+        ].is_monotonic_increasing
+        with pytest.raises(ValueError):
+            fit_best(data=data, rank_by="r2")
+        with pytest.raises(ValueError):
+            fit_best(data=data, families=["gamma", "cauchy"])
+        # Families that cannot be fitted leave an unranked leaderboard, rather than an error.
+        failed = fit_best(data=np.array([np.nan]), families=["gamma", "norm"], n_jobs=1)
+        assert list(failed["distribution"]) == ["gamma", "norm"]
+        assert failed["params"].isna().all() and failed["aic"].isna().all()
+        logger.debug(result)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_fit_best_all(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        result = fit_best(data=credit["Income"].values)
+        assert len(result) == len(DISTRIBUTIONS)
+        assert result["ks_pvalue"].between(0, 1).all()
+        logger.debug(result)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
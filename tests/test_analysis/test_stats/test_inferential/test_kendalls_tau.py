@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Monday June 5th 2023 09:32:36 pm                                                    #
-# Modified   : Thursday October 19th 2023 07:21:57 pm                                              #
+# Modified   : Monday October 19th 2026 05:28:32 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
@@ -20,7 +20,9 @@ import inspect
 from datetime import datetime
 import pytest
 import logging
+import numpy as np
 import pandas as pd
+from scipy import stats
 
 from studioai.analysis.stats.inferential.association import KendallsTauAnalysis
 
@@ -73,3 +75,88 @@ class TestKendallsTau:  # pragma: no cover
             )
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_kendalls_tau_methods(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        for variant in ["b", "c"]:
+            expected = stats.kendalltau(
+                credit["Education"].values, credit["Credit Rating"].values, variant=variant
+            )
+            for method in ["contingency", "exact"]:
+                test = KendallsTauAnalysis(
+                    data=credit, a="Education", b="Credit Rating", variant=variant, method=method
+                )
+                test.run()
+                assert test.result.method == method
+                assert np.isclose(test.result.value, expected.statistic)
+                assert np.isclose(test.result.pvalue, expected.pvalue)
+                assert test.result.lower < test.result.value < test.result.upper
+        test = KendallsTauAnalysis(data=credit, a="Education", b="Credit Rating")
+        test.run()
+        assert test.result.method == "contingency"
+        assert test.result.data.values.sum() == len(credit)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_kendalls_tau_sample(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        test = KendallsTauAnalysis(
+            data=credit, a="Age", b="Income", method="sample", sample_size=100, random_state=5
+        )
+        test.run()
+        assert test.result.method == "sample"
+        assert test.result.n == 100
+        assert test.result.data is None
+        full = stats.kendalltau(credit["Age"].values, credit["Income"].values, variant="c")
+        assert test.result.lower < full.statistic < test.result.upper
+        logger.info(test.result)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
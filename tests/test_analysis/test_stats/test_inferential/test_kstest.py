@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Thursday June 8th 2023 03:48:00 am                                                  #
-# Modified   : Thursday October 19th 2023 07:21:57 pm                                              #
+# Modified   : Monday October 19th 2026 06:35:40 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
@@ -23,7 +23,14 @@ import logging
 import pandas as pd
 import numpy as np
 
-from studioai.analysis.stats.inferential.gof import KSTest
+from scipy import stats
+
+from studioai.analysis.stats.inferential.gof import (
+    KSEngine,
+    KSTest,
+    ReferenceECDF,
+    kstest_many,
+)
 from studioai.analysis.stats.inferential.base import StatTestProfile
 
 
@@ -272,3 +279,101 @@ class TestKSTest:  # pragma: no cover
             )
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_ks_engine(self, tmp_path):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(5)
+        reference = pd.DataFrame(
+            {"x": rng.normal(size=3000), "y": rng.integers(0, 10, 3000).astype(float)}
+        )
+        current = pd.DataFrame(
+            {"x": rng.normal(0.1, size=2500), "y": rng.integers(0, 11, 2500).astype(float)}
+        )
+        engine = KSEngine.fit(reference)
+        result = engine.compare(current, correction="holm")
+        for _, row in result.iterrows():
+            expected = stats.ks_2samp(reference[row.variable], current[row.variable])
+            assert row.statistic == pytest.approx(expected.statistic)
+            assert row.pvalue == pytest.approx(expected.pvalue, rel=0.05)
+        assert (result["pvalue_adj"] >= result["pvalue"]).all()
+        # Streaming chunks gives the same statistics as one batch
+        stream = engine.stream()
+        for chunk in np.array_split(np.arange(len(current)), 7):
+            stream.update(current.iloc[chunk])
+        assert np.allclose(stream.result()["statistic"], result["statistic"])
+        with pytest.raises(TypeError):
+            stream.update(current.values)
+        # Persisted references give the same statistics
+        for ext in ("parquet", "pkl"):
+            filepath = str(tmp_path / f"reference.{ext}")
+            engine.save(filepath)
+            loaded = KSEngine.load(filepath)
+            assert np.allclose(loaded.compare(current)["statistic"], result["statistic"])
+        # The test accepts a pre-sorted reference
+        test = KSTest(a=current["x"].values, b=ReferenceECDF.from_sample(reference["x"]))
+        test.run()
+        assert test.result.value == pytest.approx(result["statistic"][0])
+        logging.debug(result)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_kstest_many(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(6)
+        data = pd.DataFrame({"a": rng.normal(size=800), "b": rng.normal(1, 2, size=800)})
+        result = kstest_many(data, cdf="norm")
+        for _, row in result.iterrows():
+            expected = stats.kstest(data[row.variable], "norm")
+            assert row.statistic == pytest.approx(expected.statistic)
+            assert row.pvalue == pytest.approx(expected.pvalue)
+        logging.debug(result)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
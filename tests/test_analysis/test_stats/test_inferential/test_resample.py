@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /tests/test_analysis/test_stats/test_inferential/test_resample.py                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:26:16 pm                                                #
+# Modified   : Monday October 19th 2026 06:25:16 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+from datetime import datetime
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from studioai.analysis.stats.inferential.resample import (
+    BLOCK_BYTES,
+    Bootstrap,
+    PermutationTest,
+    ResamplingEngine,
+    get_statistic,
+)
+from studioai.analysis.stats.inferential.test import Inference
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.stats
+@pytest.mark.resample
+class TestResample:  # pragma: no cover
+    # ============================================================================================ #
+    def test_permutation(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        male = credit[credit["Gender"] == "Male"]["Income"]
+        female = credit[credit["Gender"] == "Female"]["Income"]
+        test = PermutationTest(a=male, b=female, random_state=55, early_stopping=False)
+        test.run()
+        expected = stats.permutation_test(
+            (male.values, female.values),
+            lambda x, y, axis: x.mean(axis=axis) - y.mean(axis=axis),
+            n_resamples=9999,
+            vectorized=True,
+            random_state=55,
+        )
+        assert test.result.n_resamples == 9999
+        assert np.isclose(test.result.value, expected.statistic)
+        assert abs(test.result.pvalue - expected.pvalue) < 0.03
+        assert test.result.pvalue_lower <= test.result.pvalue <= test.result.pvalue_upper
+        logger.info(test.result.report())
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_permutation_reproducible(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        male = credit[credit["Gender"] == "Male"]["Income"]
+        female = credit[credit["Gender"] == "Female"]["Income"]
+        results = []
+        for n_jobs in [1, 2]:
+            test = PermutationTest(a=male, b=female, statistic="t", random_state=5, n_jobs=n_jobs)
+            test.run()
+            results.append((test.result.pvalue, test.result.n_resamples))
+        assert results[0] == results[1]
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_early_stopping(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(5)
+        a, b = rng.lognormal(size=200), rng.lognormal(mean=1, size=200)
+        result = Inference().permutation_test(a=a, b=b, random_state=5)
+        assert result.stopped_early
+        assert result.n_resamples < 9999
+        assert result.pvalue < result.alpha
+        x = rng.normal(size=100)
+        result = Inference().permutation_test(a=x, b=x + rng.normal(size=100), statistic="pearson")
+        assert result.pvalue < 0.05
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_bootstrap(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        income = credit["Income"]
+        result = Inference().bootstrap(a=income, random_state=55, n_jobs=2)
+        expected = stats.bootstrap((income.values,), np.mean, method="percentile", random_state=55)
+        assert result.lower < result.value < result.upper
+        assert abs(result.lower - expected.confidence_interval.low) < 0.05 * income.std()
+        assert abs(result.upper - expected.confidence_interval.high) < 0.05 * income.std()
+        assert len(result.distribution) == 9999
+        analysis = Bootstrap(
+            a=credit["Age"], b=credit["Income"], statistic="spearman", random_state=5
+        )
+        analysis.run()
+        assert -1 <= analysis.result.lower <= analysis.result.upper <= 1
+        logger.info(analysis.result.report())
+        with pytest.raises(ValueError):
+            Bootstrap(a=income, statistic="mean_diff")
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_block_size(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Blocks of resamples of large samples are bounded by the memory budget.
+        assert ResamplingEngine(n_resamples=9999, n_observations=100)._block_size == 1000
+        engine = ResamplingEngine(n_resamples=9999, n_observations=1_000_000)
+        assert 1 <= engine._block_size <= BLOCK_BYTES // (16 * 1_000_000)
+        assert ResamplingEngine(n_resamples=10, n_observations=10**10)._block_size == 1
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_bootstrap_spearman(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Resamples drawn with replacement contain ties, so each is ranked anew.
+        rng = np.random.default_rng(5)
+        x = rng.normal(size=200)
+        y = x + rng.normal(size=200)
+        index = rng.integers(0, 200, size=200)
+        spearman = get_statistic("spearman").func(x[index], y[index])
+        assert spearman == pytest.approx(stats.spearmanr(x[index], y[index])[0])
+        analysis = Bootstrap(a=x, b=y, statistic="spearman", n_resamples=2000, random_state=5)
+        analysis.run()
+        expected = stats.bootstrap(
+            (x, y),
+            lambda a, b: stats.spearmanr(a, b)[0],
+            paired=True,
+            vectorized=False,
+            n_resamples=2000,
+            method="percentile",
+            random_state=5,
+        )
+        assert analysis.result.lower == pytest.approx(expected.confidence_interval.low, abs=0.02)
+        assert analysis.result.upper == pytest.approx(expected.confidence_interval.high, abs=0.02)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_invalid_resamples(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        a, b = np.arange(10.0), np.arange(10.0) + 1
+        with pytest.raises(ValueError):
+            PermutationTest(a=a, b=b, n_resamples=0)
+        with pytest.raises(ValueError):
+            Bootstrap(a=a, n_resamples=0)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/studioai                                           #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Thursday June 8th 2023 03:48:00 am                                                  #
-# Modified   : Thursday October 19th 2023 07:21:57 pm                                              #
+# Modified   : Monday October 19th 2026 06:39:43 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
@@ -20,9 +20,14 @@ import inspect
 from datetime import datetime
 import pytest
 import logging
+import numpy as np
 import pandas as pd
+from scipy import stats
 
+from studioai.analysis.stats.descriptive.continuous import SufficientStats
 from studioai.analysis.stats.inferential.centrality import TTest
+from studioai.analysis.stats.inferential.multitest import adjust_pvalues
+from studioai.analysis.stats.inferential.test import Inference
 from studioai.analysis.stats.inferential.base import StatTestProfile
 
 
@@ -119,3 +124,157 @@ class TestTTest:  # pragma: no cover
             )
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_ttest_many(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        result = Inference().ttest_many(
+            data=credit, value_cols=["Income", "Age"], group_col="Gender", segment_cols="Own"
+        )
+        table = result.table
+        assert len(table) == 4
+        assert list(table.columns[:2]) == ["Own", "variable"]
+        for homoscedastic in [True, False]:
+            result = Inference().ttest_many(
+                data=credit,
+                value_cols=["Income", "Age"],
+                group_col="Gender",
+                segment_cols="Own",
+                homoscedastic=homoscedastic,
+                correction="bh",
+            )
+            row = result.table.set_index(["Own", "variable"]).loc[("Rented", "Income")]
+            rented = credit[credit["Own"] == "Rented"]
+            expected = stats.ttest_ind(
+                rented[rented["Gender"] == result.a_name]["Income"],
+                rented[rented["Gender"] == result.b_name]["Income"],
+                equal_var=homoscedastic,
+            )
+            assert np.isclose(row["t"], expected.statistic)
+            assert np.isclose(row["pvalue"], expected.pvalue)
+            assert np.isclose(row["dof"], expected.df)
+            assert (result.table["pvalue_adj"] >= result.table["pvalue"]).all()
+        assert "significant at 5% with" in result.report()
+        logger.info(result.report())
+        with pytest.raises(ValueError):
+            Inference().ttest_many(data=credit, value_cols="Income", group_col="Education")
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_adjust_pvalues(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        p = np.array([0.01, 0.04, 0.03, np.nan, 0.2, 0.001])
+        assert np.allclose(
+            adjust_pvalues(p, "holm"), [0.04, 0.09, 0.09, np.nan, 0.2, 0.005], equal_nan=True
+        )
+        assert np.allclose(
+            adjust_pvalues(p, "bh"), [0.025, 0.05, 0.05, np.nan, 0.2, 0.005], equal_nan=True
+        )
+        assert np.allclose(
+            adjust_pvalues(p, "bonferroni"), [0.05, 0.2, 0.15, np.nan, 1.0, 0.005], equal_nan=True
+        )
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_ttest_sufficient_stats(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        male = credit[credit["Gender"] == "Male"]["Income"]
+        female = credit[credit["Gender"] == "Female"]["Income"]
+        for homoscedastic in [True, False]:
+            test = TTest(a=male, b=female, homoscedastic=homoscedastic)
+            test.run()
+            expected = stats.ttest_ind(male, female, equal_var=homoscedastic)
+            assert np.isclose(test.result.value, abs(expected.statistic))
+            assert np.isclose(test.result.pvalue, expected.pvalue)
+            assert np.isclose(test.result.dof, expected.df)
+            assert test.result.a_stats.count == len(male)
+            assert np.isclose(test.result.a_stats.std, male.std())
+
+            summary = TTest(
+                a_stats=SufficientStats.from_summary(
+                    count=len(male), mean=male.mean(), std=male.std()
+                ),
+                b_stats=SufficientStats.from_summary(
+                    count=len(female), mean=female.mean(), std=female.std()
+                ),
+                homoscedastic=homoscedastic,
+            )
+            summary.run()
+            assert np.isclose(summary.result.pvalue, test.result.pvalue)
+            assert summary.result.a is None
+            logger.info(summary.result.report())
+        with pytest.raises(ValueError):
+            TTest(a=male)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /tests/test_analysis/test_visual/test_aggregate.py                                  #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:47:33 pm                                                #
+# Modified   : Monday October 19th 2026 06:39:15 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+
+from scipy import stats
+from scipy.integrate import trapezoid
+
+from studioai.analysis.visualize.aggregate import (
+    KDE_BINS,
+    DensityGrid,
+    QuantileSketch,
+    RingBuffer,
+    StreamingHistogram,
+    binned_kde,
+    histogram_stat,
+)
+from studioai.analysis.visualize.visualizer import SeabornCanvas, Visualizer
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.visual
+@pytest.mark.aggregate
+class TestAggregate:  # pragma: no cover
+    # ============================================================================================ #
+    def test_density_grid(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(1)
+        x, y = rng.normal(size=10000), rng.exponential(size=10000)
+        x[:5] = np.nan
+        grid = DensityGrid.from_data(x, y, bins=(30, 20))
+        valid = ~np.isnan(x)
+        expected, _, _ = np.histogram2d(
+            x[valid], y[valid], bins=(30, 20), range=[grid.extent[:2], grid.extent[2:]]
+        )
+        assert np.array_equal(grid.counts, expected)
+        assert grid.n == valid.sum()
+        # Chunks accumulate to the same counts.
+        chunked = DensityGrid(extent=grid.extent, bins=(30, 20))
+        for xs, ys in zip(np.array_split(x, 4), np.array_split(y, 4)):
+            chunked.update(xs, ys)
+        assert np.array_equal(chunked.counts, grid.counts)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_density_plots(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(2)
+        data = pd.DataFrame(
+            {
+                "a": rng.normal(size=5000),
+                "b": rng.normal(size=5000),
+                "g": rng.choice(["x", "y"], 5000),
+            }
+        )
+        viz = Visualizer(canvas=SeabornCanvas(aggregate_threshold=1000, gridsize=50))
+        ax = viz.scatterplot(data=data, x="a", y="b")
+        assert len(ax.images) == 1
+        assert len(ax.collections) == 0
+        ax = viz.scatterplot(data=data, x="a", y="b", hue="g")
+        assert len(ax.images) == 2
+        ax = viz.regplot(data=data, x="a", y="b")
+        assert len(ax.lines) == 1
+        g = viz.jointplot(data=data, x="a", y="b", hue="g")
+        assert len(g.ax_joint.images) == 2
+        # Alpha applies to the grid, and arguments without meaning for it are reported.
+        with caplog.at_level(logging.WARNING):
+            ax = viz.scatterplot(data=data, x="a", y="b", alpha=0.5, style="g", size="g")
+        assert ax.images[0].get_alpha() == 0.5
+        assert "ignores: style, size" in caplog.text
+        # Below the threshold, points are drawn.
+        ax = viz.scatterplot(data=data.head(500), x="a", y="b")
+        assert len(ax.images) == 0
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_streaming_histogram(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(2)
+        x = rng.gamma(2.0, size=50000)
+        histogram = StreamingHistogram(bins=512)
+        for chunk in np.array_split(rng.permutation(x), 7):
+            histogram.update(chunk)
+        assert histogram.n == len(x)
+        assert histogram.counts.sum() == len(x)
+        assert histogram.min == x.min() and histogram.max == x.max()
+        assert np.isclose(histogram.mean, x.mean())
+        assert np.isclose(histogram.std, x.std(ddof=1))
+        expected, _ = np.histogram(x, bins=histogram.edges)
+        assert np.abs(expected - histogram.counts).sum() <= 2
+        counts, edges = histogram.rebin(40)
+        assert len(counts) <= 40 and counts.sum() == len(x)
+        assert edges[0] <= x.min() and edges[-1] >= x.max()
+        assert np.isclose((histogram_stat(counts, edges) * np.diff(edges)).sum(), 1)
+        assert np.isclose(histogram_stat(counts, edges, stat="percent").sum(), 100)
+        with pytest.raises(ValueError):
+            histogram_stat(counts, edges, stat="mode")
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_binned_kde(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(3)
+        x = np.concatenate([rng.normal(size=20000), rng.normal(4, 0.5, size=10000)])
+        histogram = StreamingHistogram(KDE_BINS).update(x)
+        grid, density = binned_kde(histogram)
+        kde = stats.gaussian_kde(x, bw_method="scott")
+        assert np.abs(density - kde(grid)).max() < 1e-3
+        assert np.isclose(trapezoid(density, grid), 1, atol=1e-3)
+        assert grid[0] < x.min() and grid[-1] > x.max()
+        _, cdf = binned_kde(histogram, cumulative=True)
+        assert np.all(np.diff(cdf) >= 0) and np.isclose(cdf[-1], 1, atol=1e-3)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_quantile_sketch(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(4)
+        x = rng.lognormal(size=200000)
+        sketch = QuantileSketch(size=1000)
+        halves = np.array_split(x, 2)
+        for chunk in np.array_split(halves[0], 10):
+            sketch.update(chunk)
+        sketch.merge(QuantileSketch(size=1000).update(halves[1]))
+        assert sketch.n == len(x)
+        assert sketch.min == x.min() and sketch.max == x.max()
+        q = [0.01, 0.25, 0.5, 0.75, 0.99]
+        ranks = np.searchsorted(np.sort(x), sketch.quantile(q)) / len(x)
+        assert np.abs(ranks - q).max() < 2 / 1000
+        values, proportions = sketch.ecdf()
+        exact = np.searchsorted(np.sort(x), values, side="right") / len(x)
+        assert np.abs(exact - proportions).max() < 2 / 1000
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_distribution_plots(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(5)
+        n = 300000
+        df = pd.DataFrame(
+            {"value": rng.normal(size=n), "group": rng.choice(["a", "b", "c"], size=n)}
+        )
+        viz = Visualizer(canvas=SeabornCanvas(aggregate_threshold=100000))
+        ax = viz.histogram(data=df, x="value", hue="group", annotate=True)
+        assert len(ax.patches) == 3
+        ax = viz.kdeplot(data=df, x="value", hue="group", fill=True)
+        assert len(ax.get_lines()) == 3
+        ax = viz.ecdfplot(data=df, x="value")
+        assert ax.get_lines()[0].get_ydata()[-1] == 1
+        fig = viz.pdfcdfplot(data=df, x="value")
+        assert len(fig.axes) == 2
+        viz.kdebox_one(data=df, x="value")
+        # Chunked input is read once, whatever its size.
+        chunks = (df.iloc[i : i + 50000] for i in range(0, n, 50000))
+        ax = viz.kdeplot(data=chunks, x="value")
+        line = ax.get_lines()[0]
+        assert np.isclose(trapezoid(line.get_ydata(), line.get_xdata()), 1, atol=1e-3)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_pairplot(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(9)
+        values = rng.multivariate_normal(np.zeros(3), [[1, 0.8, 0], [0.8, 1, 0], [0, 0, 1]], 5000)
+        data = pd.DataFrame(values, columns=["a", "b", "c"])
+        data["g"] = rng.choice(["x", "y"], 5000)
+        viz = Visualizer(canvas=SeabornCanvas(aggregate_threshold=1000, gridsize=50))
+        g = viz.pairplot(data=data, hue="g", n_jobs=2)
+        assert g.axes.shape == (3, 3)
+        assert len(g.axes[1, 0].images) == 2
+        expected = data[["a", "b", "c"]].corr().to_numpy()
+        assert g.axes[0, 1].texts[0].get_text() == f"r = {expected[0, 1]:.2f}"
+        assert g.axes[0, 2].texts[0].get_text() == f"r = {expected[0, 2]:.2f}"
+        g = viz.pairplot(data=data, include=["a", "b"], off_diagonal="sample", sample_size=500)
+        assert len(g.axes[1, 0].collections[0].get_offsets()) == 500
+        with pytest.raises(ValueError):
+            viz.pairplot(data=data, off_diagonal="hexbin")
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_ring_buffer(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        buffer = RingBuffer(capacity=5)
+        buffer.extend([1, 2, 3])
+        assert list(buffer.values) == [1, 2, 3]
+        buffer.extend([4, 5, 6, 7])
+        assert list(buffer.values) == [3, 4, 5, 6, 7]
+        buffer.extend(np.arange(20))
+        assert list(buffer.values) == [15, 16, 17, 18, 19]
+        assert len(buffer) == buffer.capacity == 5
+        assert not buffer.values.flags.writeable
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /tests/test_analysis/test_visual/test_batch.py                                      #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:54:53 pm                                                #
+# Modified   : Monday October 19th 2026 06:38:35 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+import os
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from studioai.analysis.visualize.batch import PlotSpec, render_batch
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.visual
+@pytest.mark.batch
+class TestBatch:  # pragma: no cover
+    # ============================================================================================ #
+    def test_render_batch(self, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(6)
+        data = pd.DataFrame(
+            {
+                "a": rng.normal(size=2000),
+                "b": rng.exponential(size=2000),
+                "g": rng.choice(["x", "y"], 2000),
+            }
+        )
+        specs = [
+            PlotSpec(plot="histogram", filepath=str(tmp_path / "png" / "a.png"), params={"x": "a"}),
+            PlotSpec(plot="boxplot", filepath=str(tmp_path / "svg" / "b.svg"), params={"x": "b"}),
+            PlotSpec(
+                plot="kdebox_one", filepath=str(tmp_path / "png" / "k.png"), params={"x": "a"}
+            ),
+            PlotSpec(
+                plot="histogram", filepath=str(tmp_path / "png" / "bad.png"), params={"x": "z"}
+            ),
+        ]
+        before = plt.get_fignums()
+        for n_jobs in (1, 2):
+            result = render_batch(specs=specs, data=data, n_jobs=n_jobs)
+            assert list(result["filepath"]) == [spec.filepath for spec in specs]
+            assert result["error"].iloc[:3].isna().all()
+            assert result["error"].iloc[3] is not None
+            assert (result["render_seconds"].iloc[:3] > 0).all()
+            assert (result["write_seconds"].iloc[:3] > 0).all()
+            for spec in specs[:3]:
+                assert os.path.getsize(spec.filepath) > 0
+            assert not os.path.exists(specs[3].filepath)
+            assert plt.get_fignums() == before
+        for plot in ("pie", "canvas", "_density"):
+            with pytest.raises(ValueError):
+                render_batch(specs=[PlotSpec(plot=plot, filepath="plot.png")], data=data)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
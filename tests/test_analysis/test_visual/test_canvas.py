@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /tests/test_analysis/test_visual/test_canvas.py                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:56:22 pm                                                #
+# Modified   : Monday October 19th 2026 06:37:20 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from studioai.analysis.visualize.visualizer import SeabornCanvas, Visualizer
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.visual
+@pytest.mark.canvas
+class TestCanvas:  # pragma: no cover
+    # ============================================================================================ #
+    def test_figure_cap(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        canvas = SeabornCanvas(max_figures=3)
+        before = plt.get_fignums()
+        figures = [canvas.get_figaxes()[0] for _ in range(5)]
+        assert plt.get_fignums() == before
+        assert canvas.figures == figures[2:]
+        # The least recently used figures are closed.
+        assert all(len(figure.axes) == 0 for figure in figures[:2])
+        assert all(len(figure.axes) == 1 for figure in figures[2:])
+        canvas.register(figures[2])
+        canvas.figure()
+        assert canvas.figures[0] is figures[4]
+        canvas.close()
+        assert canvas.figures == []
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_context_manager(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(7)
+        data = pd.DataFrame({"a": rng.normal(size=500), "b": rng.normal(size=500)})
+        canvas = SeabornCanvas()
+        viz = Visualizer(canvas=canvas)
+        kept = viz.histogram(data=data, x="a").figure
+        before = plt.get_fignums()
+        with canvas:
+            ax = viz.kdebox_one(data=data, x="a", annotate=False)
+            viz.jointplot(data=data, x="a", y="b")
+            assert len(canvas.figures) == 3
+        assert canvas.figures == [kept]
+        assert len(ax.figure.axes) == 0
+        assert plt.get_fignums() == before
+        canvas.close(kept)
+        assert canvas.figures == []
+        # Default-constructed visualizers do not share a figure registry
+        assert Visualizer().canvas is not Visualizer().canvas
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_style(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rc = dict(plt.rcParams)
+        canvas = SeabornCanvas(style="darkgrid", palette="Greens")
+        for _ in range(10):
+            viz = Visualizer(canvas=canvas)
+        assert dict(plt.rcParams) == rc
+        assert canvas.rc is SeabornCanvas(style="darkgrid", palette="Greens").rc
+
+        viz.data = pd.DataFrame({"a": np.arange(20), "b": np.arange(20) ** 2})
+        ax = viz.lineplot(x="a", y="b")
+        assert ax.get_facecolor()[:3] == pytest.approx((0.918, 0.918, 0.949), abs=1e-3)
+        assert ax.lines[0].get_color() == canvas.rc["axes.prop_cycle"].by_key()["color"][0]
+        assert dict(plt.rcParams) == rc
+        canvas.close()
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_show(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = pd.DataFrame({"a": np.random.default_rng(0).normal(size=100)})
+        canvas = SeabornCanvas()
+        ax = Visualizer(canvas=canvas).histogram(data=data, x="a")
+        canvas.show(ax.figure)
+        manager = ax.figure.canvas.manager
+        assert manager is not None
+        assert manager.num in plt.get_fignums()
+        assert plt.gcf() is ax.figure
+        ax.figure.show()
+        canvas.close()
+        assert manager.num not in plt.get_fignums()
+
+        # Figures of a managed canvas are displayed by pyplot without show.
+        canvas = SeabornCanvas(managed=True)
+        ax = Visualizer(canvas=canvas).histogram(data=data, x="a")
+        assert ax.figure.number in plt.get_fignums()
+        canvas.close()
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /tests/test_analysis/test_visual/test_countplot.py                                  #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:59:30 pm                                                #
+# Modified   : Monday October 19th 2026 05:59:30 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+
+from studioai.analysis.visualize.visualizer import Visualizer
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.visual
+@pytest.mark.countplot
+class TestCountPlot:  # pragma: no cover
+    # ============================================================================================ #
+    def test_countplot(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(8)
+        data = pd.DataFrame(
+            {
+                "level": rng.choice(list("abcdefghij"), size=10000, p=np.arange(1, 11) / 55),
+                "group": rng.choice(["x", "y"], size=10000),
+            }
+        )
+        data.loc[:9, "level"] = np.nan
+        expected = data["level"].value_counts()
+        viz = Visualizer()
+        ax = viz.countplot(data=data, x="level", order_by_count=True, top=3, plot_counts=True)
+        labels = [label.get_text() for label in ax.get_xticklabels()]
+        assert labels == list(expected.index[:3]) + ["Other"]
+        heights = [patch.get_height() for patch in ax.patches]
+        assert heights == list(expected.iloc[:3]) + [expected.iloc[3:].sum()]
+        assert ax.texts[0].get_text().startswith(f"{expected.iloc[0]}\n")
+        ax = viz.countplot(data=data, y="level", hue="group")
+        assert len(ax.patches) == 20
+        crosstab = pd.crosstab(data["level"], data["group"])
+        levels = data["level"].dropna().unique()
+        widths = [patch.get_width() for patch in ax.patches]
+        assert widths == [
+            crosstab.loc[level, group] for group in data["group"].unique() for level in levels
+        ]
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
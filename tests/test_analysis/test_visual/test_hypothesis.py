@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /tests/test_analysis/test_visual/test_hypothesis.py                                 #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:58:15 pm                                                #
+# Modified   : Monday October 19th 2026 05:58:15 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+from scipy import stats
+
+from studioai.analysis.visualize.visualizer import Visualizer, hypothesis_grid
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.visual
+@pytest.mark.hypothesis
+class TestHypothesisPlot:  # pragma: no cover
+    # ============================================================================================ #
+    def test_hypothesis_grid(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        x, y, reject, (lower, upper) = hypothesis_grid("t", 20, 0.05)
+        assert np.isclose(lower, stats.t.ppf(0.025, 20)) and np.isclose(
+            upper, stats.t.ppf(0.975, 20)
+        )
+        assert lower in x and upper in x
+        assert np.all(np.diff(x) > 0)
+        assert np.allclose(y, stats.t.pdf(x, 20))
+        assert np.array_equal(reject, (x <= lower) | (x >= upper))
+        assert not x.flags.writeable
+        assert hypothesis_grid("t", 20, 0.05)[0] is x
+        x, _, reject, (lower, upper) = hypothesis_grid("chi2", 100000, 0.05, tails=1)
+        assert lower is None and len(x) <= 2 * 256 + 1
+        assert np.array_equal(reject, x >= upper)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_hypothesis_plots(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        viz = Visualizer()
+        ax = viz.ttestplot(statistic=2.5, dof=30, title="t")
+        assert len(ax.collections) == 2
+        assert np.allclose(ax.collections[1].get_offsets(), [[2.5, stats.t.pdf(2.5, 30)]])
+        ax = viz.x2testplot(statistic=10**6, dof=10**4, title="chi2")
+        # A statistic beyond the plotted range is not drawn.
+        assert len(ax.collections) == 1
+        assert ax.get_xlabel() == r"$X^2$"
+        ax = viz.kstestplot(statistic=0.05, n=500, title="ks")
+        assert len(ax.collections) == 2
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
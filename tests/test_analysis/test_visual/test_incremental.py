@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /tests/test_analysis/test_visual/test_incremental.py                                #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 06:11:36 pm                                                #
+# Modified   : Monday October 19th 2026 06:11:36 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+
+from studioai.analysis.visualize.incremental import IncrementalHistogram, IncrementalLineplot
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.visual
+@pytest.mark.incremental
+class TestIncremental:  # pragma: no cover
+    # ============================================================================================ #
+    def test_histogram(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(0)
+        plot = IncrementalHistogram(x="value", hue="group", bins=20)
+        for i in range(10):
+            chunk = pd.DataFrame(
+                {"value": rng.normal(i, 1 + i, 500), "group": rng.choice(["a", "b"], 500)}
+            )
+            plot.update(chunk)
+            counts = plot.counts["a"] + plot.counts["b"]
+            assert (counts == plot.histogram.counts).all()
+            for level, bars in plot._bars.items():
+                assert [bar.get_height() for bar in bars] == list(plot.counts[level])
+                assert np.allclose([bar.get_x() for bar in bars], plot.histogram.edges[:-1])
+        assert plot.histogram.n == 5000
+        assert len(plot.ax.patches) == 40
+        assert len(plot.ax.get_legend().get_texts()) == 2
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_lineplot(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        plot = IncrementalLineplot(x="time", y="value", window=100)
+        for i in range(5):
+            time = np.arange(i * 60, (i + 1) * 60)
+            plot.update(pd.DataFrame({"time": time, "value": np.sin(time)}))
+        line = plot.ax.lines[0]
+        assert len(plot.ax.lines) == 1
+        assert list(line.get_xdata()) == list(range(200, 300))
+        assert np.allclose(line.get_ydata(), np.sin(np.arange(200, 300)))
+        assert plot.ax.get_xlim()[0] <= 200 and plot.ax.get_xlim()[1] >= 299
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Artificial Intelligence & Data Science Studio                                       #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /tests/test_data/test_sample.py                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/studioai                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 05:15:44 pm                                                #
+# Modified   : Monday October 19th 2026 06:40:52 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2023 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from studioai.data.sample import ReservoirSampler, StratifiedSampler, sample, stratum_seed
+
+
+# ------------------------------------------------------------------------------------------------ #
+def chunks(df: pd.DataFrame, size: int):
+    for i in range(0, len(df), size):
+        yield df.iloc[i : i + size]
+
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.sample
+class TestSample:  # pragma: no cover
+    # ============================================================================================ #
+    def test_reservoir(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        s1 = sample(data=chunks(credit, 10), n=50, random_state=55)
+        s2 = sample(data=chunks(credit, 33), n=50, random_state=55)
+        assert len(s1) == 50
+        assert s1.index.is_unique
+        assert s1.equals(s2)
+        small = sample(data=chunks(credit, 10), n=500, random_state=55)
+        assert small.equals(credit)
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_reservoir_merge(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        a = ReservoirSampler(n=20, random_state=1).update(credit.iloc[:100])
+        b = ReservoirSampler(n=20, random_state=2).update(credit.iloc[100:])
+        merged = a + b
+        assert merged.count == len(credit)
+        assert len(merged.sample) == 20
+        assert merged.sample.index.is_unique
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_stratified(self, credit, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        s1 = sample(data=chunks(credit, 10), n=5, by="Gender", random_state=55)
+        assert (s1.groupby("Gender").size() == 5).all()
+        a = StratifiedSampler(by="Gender", n=5, random_state=55).update(credit.iloc[:100])
+        b = StratifiedSampler(by="Gender", n=5, random_state=55).update(credit.iloc[100:])
+        assert len((a + b).sample) == 10
+        s2 = sample(
+            data=chunks(credit, 10), n=40, by="Gender", allocation="proportional", random_state=5
+        )
+        assert len(s2) == 40
+        expected = credit["Gender"].value_counts(normalize=True) * 40
+        assert (np.abs(s2["Gender"].value_counts() - expected) < 1).all()
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_stratum_seed(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Partitions may yield numpy or Python scalars for the same stratum.
+        seed = np.random.SeedSequence(55)
+        for numpy_value, python_value in [
+            (np.int64(1), 1),
+            (np.float64(2.5), 2.5),
+            (np.str_("Male"), "Male"),
+            (np.bool_(True), True),
+            (np.datetime64("2023-01-01"), pd.Timestamp("2023-01-01")),
+            ((np.int64(1), np.str_("Male")), (1, "Male")),
+        ]:
+            expected = stratum_seed(seed, python_value).generate_state(4)
+            assert (stratum_seed(seed, numpy_value).generate_state(4) == expected).all()
+        assert (
+            stratum_seed(seed, 1).generate_state(4) != stratum_seed(seed, 2).generate_state(4)
+        ).any()
+
+        df = pd.DataFrame({"group": np.arange(100) % 2, "value": np.arange(100)})
+        mixed = df.astype({"group": object})
+        mixed["group"] = [int(g) for g in df["group"]]
+        a = StratifiedSampler(by="group", n=5, random_state=55).update(df).sample
+        b = StratifiedSampler(by="group", n=5, random_state=55).update(mixed).sample
+        assert sorted(a["value"]) == sorted(b["value"])
+
+        # Rows with a missing stratum form one stratum across chunks, rather than being dropped.
+        df["group"] = np.where(df["value"] % 3 == 0, np.nan, df["group"])
+        sampler = StratifiedSampler(by="group", n=5, random_state=55)
+        for chunk in chunks(df, 10):
+            sampler.update(chunk)
+        assert len(sampler.count) == 3
+        assert sampler.sample["group"].isna().sum() == 5
+        proportional = sample(data=chunks(df, 10), n=30, by="group", allocation="proportional")
+        assert proportional["group"].isna().sum() == 10
+
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)